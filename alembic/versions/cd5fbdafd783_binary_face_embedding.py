@@ -0,0 +1,137 @@
+"""store user.face_embedding as binary float32 blob
+
+Revision ID: cd5fbdafd783
+Revises: 7098ca7308bc, 89e3a9d5f8cd
+Create Date: 2026-10-19 10:12:41.318204
+
+"""
+import json
+import struct
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cd5fbdafd783'
+down_revision: Union[str, Sequence[str], None] = ('7098ca7308bc', '89e3a9d5f8cd')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+user_table = sa.table(
+    'user',
+    sa.column('id', sa.Integer),
+    sa.column('face_embedding', sa.String),
+    sa.column('face_embedding_bin', sa.LargeBinary),
+)
+
+# Frozen copy of the version-1 embedding format (app/utils/embedding_codec.py at this
+# revision), so later codec changes cannot alter what this migration reads and writes.
+#   header: b"FE" | version u8 | dtype u8 (1 = float32) | model count u8
+#   model:  name length u8 | name (ascii) | dim u16 | padding to 4 bytes | dim * float32
+_HEADER = struct.Struct("<2sBBB")
+_NAME_LEN = struct.Struct("<B")
+_DIM = struct.Struct("<H")
+
+
+def _decode_json(text):
+    """Legacy JSON text: {model: [floats]} or a bare ArcFace vector."""
+    import numpy as np
+
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return None
+    if isinstance(data, list):
+        data = {"ArcFace": data}
+    if not isinstance(data, dict):
+        return None
+    return {k: np.asarray(v, dtype=np.float32) for k, v in data.items() if isinstance(v, list)}
+
+
+def _encode_v1(embeddings):
+    import numpy as np
+
+    parts = [_HEADER.pack(b"FE", 1, 1, len(embeddings))]
+    offset = _HEADER.size
+    for model, vector in embeddings.items():
+        name = model.encode("ascii")
+        arr = np.asarray(vector, dtype=np.float32).reshape(-1)
+        meta = _NAME_LEN.pack(len(name)) + name + _DIM.pack(arr.size)
+        offset += len(meta)
+        pad = (-offset) % 4
+        parts.append(meta + b"\0" * pad)
+        offset += pad
+        parts.append(arr.tobytes())
+        offset += arr.nbytes
+    return b"".join(parts)
+
+
+def _decode_v1(blob):
+    import numpy as np
+
+    buf = memoryview(blob)
+    try:
+        magic, version, dtype_code, count = _HEADER.unpack_from(buf, 0)
+        if magic != b"FE" or version != 1 or dtype_code != 1:
+            return None
+        offset = _HEADER.size
+        result = {}
+        for _ in range(count):
+            (name_len,) = _NAME_LEN.unpack_from(buf, offset)
+            offset += _NAME_LEN.size
+            name = bytes(buf[offset:offset + name_len]).decode("ascii")
+            offset += name_len
+            (dim,) = _DIM.unpack_from(buf, offset)
+            offset += _DIM.size
+            offset += (-offset) % 4
+            result[name] = np.frombuffer(buf, dtype=np.float32, count=dim, offset=offset)
+            offset += dim * 4
+        return result
+    except (struct.error, ValueError, UnicodeDecodeError):
+        return None
+
+
+def upgrade() -> None:
+    """Upgrade schema: JSON text -> binary blob (also merges the two CONNECTED/DISCONNECTED heads)."""
+    op.add_column('user', sa.Column('face_embedding_bin', sa.LargeBinary(), nullable=True))
+
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.select(user_table.c.id, user_table.c.face_embedding).where(user_table.c.face_embedding.isnot(None))
+    ).fetchall()
+    for user_id, text_value in rows:
+        embeddings = _decode_json(text_value)
+        if not embeddings:
+            continue
+        conn.execute(
+            user_table.update()
+            .where(user_table.c.id == user_id)
+            .values(face_embedding_bin=_encode_v1(embeddings))
+        )
+
+    op.drop_column('user', 'face_embedding')
+    op.alter_column('user', 'face_embedding_bin', new_column_name='face_embedding')
+
+
+def downgrade() -> None:
+    """Downgrade schema: binary blob -> JSON text."""
+    op.alter_column('user', 'face_embedding', new_column_name='face_embedding_bin')
+    op.add_column('user', sa.Column('face_embedding', sa.VARCHAR(), autoincrement=False, nullable=True))
+
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.select(user_table.c.id, user_table.c.face_embedding_bin).where(user_table.c.face_embedding_bin.isnot(None))
+    ).fetchall()
+    for user_id, blob in rows:
+        embeddings = _decode_v1(blob)
+        if not embeddings:
+            continue
+        conn.execute(
+            user_table.update()
+            .where(user_table.c.id == user_id)
+            .values(face_embedding=json.dumps({k: v.astype(float).tolist() for k, v in embeddings.items()}))
+        )
+
+    op.drop_column('user', 'face_embedding_bin')
@@ -0,0 +1,33 @@
+"""composite indexes for dashboard and live-status queries
+
+Revision ID: e41b7c09a2d6
+Revises: cd5fbdafd783
+Create Date: 2026-10-19 14:05:12.503117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41b7c09a2d6'
+down_revision: Union[str, Sequence[str], None] = 'cd5fbdafd783'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_interviewsession_status_last_activity', 'interviewsession', ['status', 'last_activity'], unique=False)
+    op.create_index(op.f('ix_interviewsession_start_time'), 'interviewsession', ['start_time'], unique=False)
+    op.create_index('ix_proctoringevent_timestamp_interview_id', 'proctoringevent', ['timestamp', 'interview_id'], unique=False)
+    op.create_index(op.f('ix_interviewresult_created_at'), 'interviewresult', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_interviewresult_created_at'), table_name='interviewresult')
+    op.drop_index('ix_proctoringevent_timestamp_interview_id', table_name='proctoringevent')
+    op.drop_index(op.f('ix_interviewsession_start_time'), table_name='interviewsession')
+    op.drop_index('ix_interviewsession_status_last_activity', table_name='interviewsession')
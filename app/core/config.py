@@ -18,6 +18,49 @@ ENV_MODE = os.getenv("ENV_MODE", "full")
 IS_ORCHESTRATOR = ENV_MODE == "orchestrator"
 USE_MODAL = os.getenv("USE_MODAL", "false").lower() == "true"
 
+# Proctoring Frame Sampling (analysed frames per second)
+PROCTORING_STABLE_FPS = float(os.getenv("PROCTORING_STABLE_FPS", "2"))          # Per session, no recent violation
+PROCTORING_SUSPICIOUS_FPS = float(os.getenv("PROCTORING_SUSPICIOUS_FPS", "8"))  # Per session, while a warning is active
+PROCTORING_GLOBAL_FPS_BUDGET = float(os.getenv("PROCTORING_GLOBAL_FPS_BUDGET", "60"))  # Across all sessions on this node
+CAMERA_MAX_SESSIONS = int(os.getenv("CAMERA_MAX_SESSIONS", "2000"))  # In-memory proctoring sessions per node (least recently active evicted)
+
+# Face Tracking (skip re-embedding a face that was verified recently and has not moved)
+FACE_TRACK_IOU = float(os.getenv("FACE_TRACK_IOU", "0.5"))                  # Min box overlap to treat a detection as the same face
+FACE_VERIFIED_TTL = float(os.getenv("FACE_VERIFIED_TTL", "5"))              # Seconds a verified identity is trusted without re-embedding
+FACE_UNVERIFIED_TTL = float(os.getenv("FACE_UNVERIFIED_TTL", "1"))          # Re-check unknown faces sooner
+
+# Video WebSocket stream negotiation (advertised to clients at connect)
+PROCTORING_CLIENT_MAX_HEIGHT = int(os.getenv("PROCTORING_CLIENT_MAX_HEIGHT", "540"))  # Matches the shared frame ring
+PROCTORING_CLIENT_MAX_WIDTH = int(os.getenv("PROCTORING_CLIENT_MAX_WIDTH", "960"))
+PROCTORING_CLIENT_JPEG_QUALITY = int(os.getenv("PROCTORING_CLIENT_JPEG_QUALITY", "70"))
+
+# Proctoring violation persistence
+VIOLATION_DEBOUNCE_WINDOW = float(os.getenv("VIOLATION_DEBOUNCE_WINDOW", "10"))  # Repeats of the same warning within this gap are one incident
+VIOLATION_FLUSH_INTERVAL = float(os.getenv("VIOLATION_FLUSH_INTERVAL", "2"))     # Seconds between batched DB writes
+
+# Status timeline entries are bulk-inserted in batches
+STATUS_TIMELINE_FLUSH_INTERVAL = float(os.getenv("STATUS_TIMELINE_FLUSH_INTERVAL", "2"))  # Seconds between bulk INSERTs
+
+# Candidate activity heartbeats (last_activity is written in batches)
+ACTIVITY_FLUSH_INTERVAL = float(os.getenv("ACTIVITY_FLUSH_INTERVAL", "5"))  # Seconds between batched UPDATEs
+
+# Admin dashboard counters (maintained incrementally, rebuilt from SQL periodically)
+DASHBOARD_RECONCILE_INTERVAL = float(os.getenv("DASHBOARD_RECONCILE_INTERVAL", "300"))  # Seconds
+
+# Admin real-time broadcasts
+INTERVIEW_SNAPSHOT_CACHE_SIZE = int(os.getenv("INTERVIEW_SNAPSHOT_CACHE_SIZE", "5000"))  # Interviews whose enriched state is kept in memory
+INTERVIEW_SNAPSHOT_TTL = float(os.getenv("INTERVIEW_SNAPSHOT_TTL", "60"))  # Seconds; bounds staleness from other workers' writes
+ADMIN_BROADCAST_COALESCE_WINDOW = float(os.getenv("ADMIN_BROADCAST_COALESCE_WINDOW", "0.25"))  # Seconds; latest state per interview wins
+ADMIN_SEND_QUEUE_SIZE = int(os.getenv("ADMIN_SEND_QUEUE_SIZE", "64"))  # Per admin socket; oldest message dropped when full
+WS_BACKPLANE = os.getenv("WS_BACKPLANE", "redis").lower()  # "redis" (cross-worker pub/sub via REDIS_URL) or "local" (this process only)
+
+# WebSocket connection health (all endpoints)
+WS_HEARTBEAT_INTERVAL = float(os.getenv("WS_HEARTBEAT_INTERVAL", "25"))  # Seconds between protocol pings; also app-level ping for opted-in clients
+WS_PING_TIMEOUT = float(os.getenv("WS_PING_TIMEOUT", "20"))              # Seconds to wait for a protocol pong (browsers answer automatically)
+WS_IDLE_TIMEOUT = float(os.getenv("WS_IDLE_TIMEOUT", "90"))              # Seconds of silence before an opted-in (heartbeat) socket is closed
+WS_SEND_TIMEOUT = float(os.getenv("WS_SEND_TIMEOUT", "10"))              # Seconds a single send may take before the socket is closed
+WS_MAX_OUTSTANDING = int(os.getenv("WS_MAX_OUTSTANDING", "32"))          # Concurrent in-flight sends per socket before it is treated as dead
+
 # Lazy-loaded LLM Initialization
 _local_llm = None
 
@@ -110,6 +153,8 @@ SMTP_USE_SSL = os.getenv("SMTP_USE_SSL", "false").lower() == "true" or SMTP_PORT
 ASSETS_DIR = "app/assets"
 AUDIO_DIR = os.path.join(ASSETS_DIR, "audio")
 PROCTORING_LOGS_DIR = os.path.join(ASSETS_DIR, "proctoring_logs")
+# Status timeline entries that could not be written at shutdown (replayed on next start)
+STATUS_TIMELINE_FALLBACK_PATH = os.getenv("STATUS_TIMELINE_FALLBACK_PATH", os.path.join(ASSETS_DIR, "status_timeline_pending.jsonl"))
 
 # Cloud Configuration
 # Try to detect HF Direct URL or use Space URL as fallback
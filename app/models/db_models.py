@@ -1,6 +1,7 @@
 from typing import Optional, List
 from datetime import datetime, timedelta
 from sqlmodel import Field, SQLModel, Relationship, Column, ForeignKey, Integer
+from sqlalchemy import Index
 from enum import Enum
 import uuid
 import random
@@ -59,7 +60,7 @@ class User(SQLModel, table=True):
     resume_path: Optional[str] = Field(default=None)
     profile_image: Optional[str] = Field(default=None) # Path to uploaded selfie (Legacy)
     profile_image_bytes: Optional[bytes] = Field(default=None) # Binary store for selfie
-    face_embedding: Optional[str] = Field(default=None) # JSON/CSV string of the ArcFace/Sface vector
+    face_embedding: Optional[bytes] = Field(default=None) # Binary ArcFace/SFace vectors (see utils/embedding_codec.py)
     
     # Relationships
     team_id: Optional[int] = Field(
@@ -179,6 +180,9 @@ class CodingQuestions(SQLModel, table=True):
     paper: Optional[CodingQuestionPaper] = Relationship(back_populates="questions")
 
 class InterviewSession(SQLModel, table=True):
+    # Live-status/dashboard filters by status and orders by recent activity
+    __table_args__ = (Index("ix_interviewsession_status_last_activity", "status", "last_activity"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
 
     # Scheduler Info
@@ -204,7 +208,7 @@ class InterviewSession(SQLModel, table=True):
     schedule_time: datetime
     duration_minutes: int = Field(default=60)  # 60 Minutes default
     max_questions: int = Field(default=0)   # 0 = use all questions
-    start_time: Optional[datetime] = None
+    start_time: Optional[datetime] = Field(default=None, index=True)
     end_time: Optional[datetime] = None
 
     # State
@@ -270,6 +274,9 @@ class SessionQuestion(SQLModel, table=True):
     question: Questions = Relationship(back_populates="session_questions")
 
 class ProctoringEvent(SQLModel, table=True):
+    # Dashboard counts distinct interviews with events in a time window
+    __table_args__ = (Index("ix_proctoringevent_timestamp_interview_id", "timestamp", "interview_id"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     interview_id: int = Field(
         sa_column=Column(Integer, ForeignKey("interviewsession.id", ondelete="CASCADE"))
@@ -321,7 +328,7 @@ class InterviewResult(SQLModel, table=True):
     )
     result_status: str = Field(default="PENDING", title="Status: PENDING, PASS, or FAIL")
     total_score: float = Field(default=0.0)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
 
     session: "InterviewSession" = Relationship(back_populates="result")
     answers: List["Answers"] = Relationship(
@@ -8,7 +8,7 @@ from fastapi.responses import FileResponse, RedirectResponse, Response
 from sqlmodel import Session, select
 from sqlalchemy.orm import selectinload
 from ..core.database import get_db as get_session
-from ..models.db_models import QuestionPaper, Questions, InterviewSession, Answers, CodingAnswers, InterviewResult, User, UserRole, ProctoringEvent, InterviewStatus, Team, InterviewRound, CodingQuestionPaper, CodingQuestions, CandidateStatus
+from ..models.db_models import QuestionPaper, Questions, InterviewSession, Answers, CodingAnswers, InterviewResult, User, UserRole, ProctoringEvent, InterviewStatus, Team, InterviewRound, CodingQuestionPaper, CodingQuestions, CandidateStatus, SessionQuestion
 from ..auth.dependencies import get_current_user_optional, get_admin_user
 from ..auth.security import get_password_hash
 from ..services.status_manager import record_status_change
@@ -19,6 +19,8 @@ from ..utils import calculate_average_score, format_iso_datetime, calculate_tota
 from ..tasks.interview_tasks import send_result_email_util
 logger = get_logger(__name__)
 from ..services.admin_serialization import serialize_interview_admin_detail
+from ..services.activity_tracker import activity_tracker
+from ..services.timeline_buffer import timeline_buffer
 _serialize_interview_admin_detail = serialize_interview_admin_detail
 
 from ..schemas.admin.users import CreateUserRequest, UserRead, GetUserDetailResponse
@@ -1191,37 +1193,53 @@ async def get_live_status_dashboard(
         List of active interviews with basic status, warnings, and progress
     """
     
-    # Role-based visibility
-    if current_user.role == UserRole.SUPER_ADMIN:
-        stmt = select(InterviewSession).where(
-            InterviewSession.status.in_([
-                InterviewStatus.SCHEDULED,
-                InterviewStatus.LIVE
-            ])
-        )
-    else:
-        stmt = select(InterviewSession).where(
-            InterviewSession.admin_id == current_user.id,
-            InterviewSession.status.in_([
-                InterviewStatus.SCHEDULED,
-                InterviewStatus.LIVE
-            ])
+    # Progress comes from grouped COUNT subqueries instead of loading every
+    # selected question and answer row
+    question_counts = (
+        select(SessionQuestion.interview_id, func.count().label("total"))
+        .group_by(SessionQuestion.interview_id)
+        .subquery()
+    )
+    answer_counts = (
+        select(Answers.interview_result_id, func.count().label("answered"))
+        .group_by(Answers.interview_result_id)
+        .subquery()
+    )
+    stmt = (
+        select(
+            InterviewSession,
+            func.coalesce(question_counts.c.total, 0),
+            func.coalesce(answer_counts.c.answered, 0),
+            InterviewResult.total_score,
         )
+        .outerjoin(question_counts, question_counts.c.interview_id == InterviewSession.id)
+        # One row per interview: InterviewResult.interview_id is unique (model and initial schema)
+        .outerjoin(InterviewResult, InterviewResult.interview_id == InterviewSession.id)
+        .outerjoin(answer_counts, answer_counts.c.interview_result_id == InterviewResult.id)
+        .where(InterviewSession.status.in_([
+            InterviewStatus.SCHEDULED,
+            InterviewStatus.LIVE
+        ]))
+    )
+
+    # Role-based visibility
+    if current_user.role != UserRole.SUPER_ADMIN:
+        stmt = stmt.where(InterviewSession.admin_id == current_user.id)
     
     stmt = stmt.options(
-        selectinload(InterviewSession.selected_questions),
-        selectinload(InterviewSession.result).selectinload(InterviewResult.answers),
-        selectinload(InterviewSession.candidate)
+        selectinload(InterviewSession.candidate),
+        selectinload(InterviewSession.admin)
     ).order_by(InterviewSession.last_activity.desc())
     
     active_sessions = session.exec(stmt).all()
     
     results = []
-    for interview_session in active_sessions:
+    for interview_session, total_questions, answered_questions, result_score in active_sessions:
+        # Unflushed heartbeats are newer than the stored value
+        fresh_activity = activity_tracker.latest(interview_session.id, interview_session.last_activity)
+        last_activity = format_iso_datetime(fresh_activity)
+
         # Calculate progress
-        total_questions = len(interview_session.selected_questions) if interview_session.selected_questions else 0
-        responses = interview_session.result.answers if interview_session.result else []
-        answered_questions = len(responses)
         progress_percent = (answered_questions / total_questions * 100) if total_questions > 0 else 0
         
         # Serialize users
@@ -1239,9 +1257,9 @@ async def get_live_status_dashboard(
             "start_time": format_iso_datetime(interview_session.start_time),
             "end_time": format_iso_datetime(interview_session.end_time),
             "status": interview_session.status.value,
-            "total_score": (interview_session.result.total_score if interview_session.result else interview_session.total_score) or 0.0,
+            "total_score": (result_score if result_score is not None else interview_session.total_score) or 0.0,
             "current_status": interview_session.current_status or None,
-            "last_activity": format_iso_datetime(interview_session.last_activity),
+            "last_activity": last_activity,
             "warning_count": interview_session.warning_count,
             "max_warnings": interview_session.max_warnings,
             "is_suspended": interview_session.is_suspended,
@@ -1255,7 +1273,7 @@ async def get_live_status_dashboard(
             "interview_round": interview_session.interview_round.value if interview_session.interview_round else None
         }
         
-        results.append(LiveStatusItem(
+        results.append((fresh_activity or datetime.min, LiveStatusItem(
             interview=interview_dict,
             admin_user=admin_dict,
             candidate_user=candidate_dict,
@@ -1263,13 +1281,16 @@ async def get_live_status_dashboard(
             warning_count=interview_session.warning_count or 0,
             warnings_remaining=max(0, (interview_session.max_warnings or 3) - (interview_session.warning_count or 0)),
             is_suspended=interview_session.is_suspended or False,
-            last_activity=format_iso_datetime(interview_session.last_activity),
+            last_activity=last_activity,
             progress_percent=round(progress_percent, 1)
-        ))
+        )))
+    
+    # Keep most-recent-first with the fresh values
+    results.sort(key=lambda pair: pair[0], reverse=True)
     
     return ApiResponse(
         status_code=200,
-        data=results,
+        data=[item for _, item in results],
         message="Live interview status retrieved successfully"
     )
 
@@ -1520,6 +1541,7 @@ async def delete_interview(
         session.rollback()
         logger.error(f"Failed to delete interview {interview_id}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to delete interview. Please try again.")
+    timeline_buffer.forget(interview_id)
     
     return ApiResponse(
         status_code=200,
@@ -2264,7 +2286,6 @@ async def create_user(
             if not IS_ORCHESTRATOR:
                 try:
                     from deepface import DeepFace
-                    import json
                     import tempfile
                     import os
 
@@ -2291,7 +2312,8 @@ async def create_user(
                             logger.warning(f"SFace failed during user creation: {e}")
 
                         if embeddings_map:
-                            new_user.face_embedding = json.dumps(embeddings_map)
+                            from ..utils.embedding_codec import encode_embeddings
+                            new_user.face_embedding = encode_embeddings(embeddings_map)
                     finally:
                         if os.path.exists(tmp_path):
                             os.remove(tmp_path)
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
-from typing import Optional
+from typing import List, Optional
 from ..auth.dependencies import get_admin_user_ws
 from ..models.db_models import User
 from fastapi import Depends
 from ..services.websocket_manager import manager
+from ..services.ws_session import ws_sessions
 from ..core.logger import get_logger
 import json
 
@@ -92,17 +93,75 @@ async def admin_dashboard_ws(
     
     logger.info(f"✅ Admin WS auth passed for: {email}")
     
-    # All checks passed - accept the connection
+    # All checks passed - accept the connection (heartbeat, send timeouts and idle reaping via the session)
+    websocket = ws_sessions.wrap(websocket, "admin")
     await websocket.accept()
     logger.info(f"✅ WebSocket accepted for admin: {email}")
     
-    await manager.connect_admin(websocket)
+    await manager.connect_admin(
+        websocket,
+        admin_id=user.id,
+        team_id=user.team_id,
+        is_super=user.role == UserRole.SUPER_ADMIN,
+    )
     try:
         while True:
-            await websocket.receive_text() # Keep connection alive
+            message = await websocket.receive_text()
+            await _handle_admin_message(websocket, user, message)
     except WebSocketDisconnect:
         logger.info(f"👋 Admin WS disconnected: {email}")
         manager.disconnect_admin(websocket)
     except Exception as e:
         logger.error(f"❌ Admin WS Error: {e}")
         manager.disconnect_admin(websocket)
+
+
+def _owned_interview_ids(user: User, interview_ids: List[int]) -> List[int]:
+    """Interview ids a non-super admin may subscribe to explicitly (own or same-team interviews)."""
+    from sqlmodel import Session, select
+    from ..core.database import engine
+    from ..models.db_models import InterviewSession
+
+    with Session(engine) as db_session:
+        stmt = select(InterviewSession.id).where(InterviewSession.id.in_(interview_ids))
+        if user.team_id is not None:
+            stmt = stmt.join(User, User.id == InterviewSession.admin_id).where(
+                (InterviewSession.admin_id == user.id) | (User.team_id == user.team_id)
+            )
+        else:
+            stmt = stmt.where(InterviewSession.admin_id == user.id)
+        return list(db_session.exec(stmt).all())
+
+
+async def _handle_admin_message(websocket: WebSocket, user: User, message: str):
+    """
+    Topic filter updates from the dashboard:
+    {"type": "subscribe", "scope": "own" | "team" | "all" | "none",
+     "interview_ids": [..], "event_types": [..] | null}
+    """
+    try:
+        data = json.loads(message)
+    except ValueError:
+        return  # Plain keep-alive text
+    if not isinstance(data, dict) or data.get("type") != "subscribe":
+        return
+
+    from ..models.db_models import UserRole
+    import asyncio
+
+    interview_ids = data.get("interview_ids")
+    try:
+        if interview_ids is not None:
+            interview_ids = [int(i) for i in interview_ids]
+            if user.role != UserRole.SUPER_ADMIN and interview_ids:
+                interview_ids = await asyncio.to_thread(_owned_interview_ids, user, interview_ids)
+        filters = manager.update_admin_subscription(
+            websocket,
+            scope=data.get("scope"),
+            interview_ids=interview_ids,
+            event_types=data.get("event_types"),
+            all_event_types="event_types" in data and data["event_types"] is None,
+        )
+        await websocket.send_json({"type": "subscribed", **filters})
+    except (KeyError, TypeError, ValueError) as e:
+        await websocket.send_json({"type": "subscription_error", "message": str(e)})
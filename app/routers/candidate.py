@@ -162,7 +162,6 @@ async def upload_selfie(
     try:
         from ..services.face import get_modal_embedding
         from ..core.config import USE_MODAL
-        import json
         import tempfile
         import os
         
@@ -221,7 +220,8 @@ async def upload_selfie(
                 logger.warning(f"SFace embedding failed: {e}")
 
         if embeddings_map:
-            current_user.face_embedding = json.dumps(embeddings_map)
+            from ..utils.embedding_codec import encode_embeddings
+            current_user.face_embedding = encode_embeddings(embeddings_map)
             logger.info(f"Generated embeddings for: {list(embeddings_map.keys())}")
                 
     except Exception as e:
@@ -1107,6 +1107,7 @@ async def upload_selfie_session(
     import tempfile
     import os
     from deepface import DeepFace
+    from ..utils.embedding_codec import encode_embeddings, decode_embeddings
     
     _logger = get_logger(__name__)
     
@@ -1156,7 +1157,7 @@ async def upload_selfie_session(
             if not embeddings_map:
                 raise HTTPException(status_code=400, detail="Failed to generate face embeddings for enrollment. Please ensure a clear face is visible.")
             
-            candidate.face_embedding = json.dumps(embeddings_map)
+            candidate.face_embedding = encode_embeddings(embeddings_map)
             # Use original filename or dummy for profile_image if needed
             candidate.profile_image = f"enrolled_{candidate.id}.jpg"
             session_db.add(candidate)
@@ -1242,10 +1243,10 @@ async def upload_selfie_session(
             raise HTTPException(status_code=400, detail=detail_msg)
         
         # 6. Parse stored embeddings
-        stored_embeddings = json.loads(candidate.face_embedding)
+        stored_embeddings = decode_embeddings(candidate.face_embedding) or {}
         # Handle both lowercase and capitalized keys for robustness
-        stored_arcface = stored_embeddings.get("ArcFace") or stored_embeddings.get("arcface")
-        stored_sface = stored_embeddings.get("SFace") or stored_embeddings.get("sface")
+        stored_arcface = stored_embeddings.get("ArcFace", stored_embeddings.get("arcface"))
+        stored_sface = stored_embeddings.get("SFace", stored_embeddings.get("sface"))
         
         # 7. Compute similarity handles
         ARCFACE_THRESHOLD = 0.50
@@ -1256,7 +1257,7 @@ async def upload_selfie_session(
         verification_results = []
         
         # Compare ArcFace embeddings (primary - high accuracy)
-        if arcface_embedding and stored_arcface:
+        if arcface_embedding and stored_arcface is not None:
             try:
                 if len(arcface_embedding) > 0 and len(stored_arcface) > 0:
                     arcface_sim = float(np.dot(arcface_embedding, stored_arcface) / (
@@ -1271,7 +1272,7 @@ async def upload_selfie_session(
                 verification_results.append(False)
         
         # Compare SFace embeddings (fallback - lightweight)
-        if sface_embedding and stored_sface:
+        if sface_embedding and stored_sface is not None:
             try:
                 if len(sface_embedding) > 0 and len(stored_sface) > 0:
                     sface_sim = float(np.dot(sface_embedding, stored_sface) / (
@@ -2265,7 +2266,8 @@ async def log_tab_switch(
                     session=session_db,
                     interview_session=session_obj,
                     new_status=CandidateStatus.SUSPENDED,
-                    metadata={"reason": "tab_switch_timeout", "elapsed_seconds": elapsed}
+                    metadata={"reason": "tab_switch_timeout", "elapsed_seconds": elapsed},
+                    commit=False,
                 )
                 # Ensure database is committed before raising exception
                 session_db.add(session_obj)
@@ -2398,7 +2400,8 @@ def enforce_tab_timeout(db: Session, session_obj: InterviewSession) -> None:
                 session=db,
                 interview_session=session_obj,
                 new_status=CandidateStatus.SUSPENDED,
-                metadata={"reason": "tab_switch_timeout", "proactive": True, "elapsed_seconds": elapsed}
+                metadata={"reason": "tab_switch_timeout", "proactive": True, "elapsed_seconds": elapsed},
+                commit=False,
             )
             db.add(session_obj)
             db.commit()
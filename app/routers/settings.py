@@ -1,9 +1,10 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, Depends
-from ..auth.dependencies import get_current_user_ws
+from ..auth.dependencies import get_current_user_ws, get_admin_user
 from ..models.db_models import User, UserRole
 from typing import Optional
 from ..services.camera import CameraService
 from ..services.interview import get_modal_evaluator
+from ..services.ws_session import ws_sessions
 from ..core.config import local_llm, IS_ORCHESTRATOR, USE_MODAL
 
 from ..schemas.shared.api_response import ApiResponse
@@ -56,9 +57,9 @@ _listener_registered = False
 def camera_status_callback(interview_id: int, warning_key: str):
     """Bridge for CameraService alerts to WebSockets (Filtered by Session)."""
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            asyncio.run_coroutine_threadsafe(manager.broadcast(interview_id, warning_key), loop)
+        # Called from CameraService threads; the dispatcher hands off to the main loop
+        from ..services.broadcast_dispatcher import dispatcher
+        dispatcher.submit(manager.broadcast(interview_id, warning_key))
     except Exception as e:
         print(f"Callback Bridge Error: {e}")
 
@@ -143,6 +144,21 @@ async def get_system_status(interview_id: Optional[int] = Query(None)):
         message="System status retrieved successfully"
     )
 
+@router.get("/websockets", response_model=ApiResponse[dict])
+async def websocket_metrics(current_user: User = Depends(get_admin_user)):
+    """Per-node WebSocket health: open sockets by endpoint, reaped/timed-out connections, heartbeats and broadcast queues."""
+    from ..services.websocket_manager import manager as ws_manager
+    from ..services.broadcast_dispatcher import dispatcher
+    return ApiResponse(
+        status_code=200,
+        data={
+            "sessions": ws_sessions.metrics(),
+            "broadcasts": ws_manager.get_broadcast_stats(),
+            "dispatcher": dispatcher.stats(),
+        },
+        message="OK"
+    )
+
 @router.websocket("/ws")
 async def websocket_status(
     websocket: WebSocket, 
@@ -171,6 +187,7 @@ async def websocket_status(
         await websocket.close(code=4000, reason="interview_id parameter is required")
         return
         
+    websocket = ws_sessions.wrap(websocket, "status", interview_id)
     await manager.connect(websocket, interview_id)
     
     if not _listener_registered:
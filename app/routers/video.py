@@ -4,9 +4,10 @@ from pydantic import BaseModel
 from ..services.camera import CameraService
 from ..schemas.shared.api_response import ApiResponse
 from ..core.logger import get_logger
-from ..auth.dependencies import get_current_user_ws
+from ..auth.dependencies import get_current_user_ws, get_admin_user
 from ..models.db_models import User
 from ..services import websocket_handler as handler
+from ..services.ws_session import ws_sessions
 
 # Proctoring/Heartbeat Limit (Rate limiting handled per-endpoint when needed)
 heavy_throttle = []
@@ -33,7 +34,7 @@ async def proctoring_status(interview_id: int = Query(0)):
         return ApiResponse(status_code=202, data={"status": "initializing"}, message="Detectors are not ready yet.")
     warning = camera_service.get_current_warning(interview_id)
     detectors_ready = camera_service._detectors_ready
-    last_result = camera_service.session_results.get(interview_id, {})
+    last_result = camera_service.get_session_result(interview_id)
     return ApiResponse(
         status_code=200,
         data={
@@ -43,22 +44,73 @@ async def proctoring_status(interview_id: int = Query(0)):
             "faces_detected": last_result.get("faces", "N/A"),
             "gaze": last_result.get("gaze", "N/A"),
             "detectors": last_result.get("detectors", {}),
+            "sampling": camera_service.sampler.session_stats(interview_id),
         },
         message="OK"
     )
 
+@router.get("/metrics")
+async def proctoring_metrics(current_user: User = Depends(get_admin_user)):
+    """Per-node proctoring session counts, sampling/violation counters and approximate memory use."""
+    return ApiResponse(status_code=200, data=get_camera_service().metrics(), message="OK")
+
+@router.get("/video_feed")
+async def video_feed(
+    interview_id: int = Query(...),
+    fps: float = Query(10.0, gt=0, le=30),
+    quality: int = Query(80, ge=10, le=95),
+    current_user: User = Depends(get_admin_user)
+):
+    """
+    MJPEG feed of a session's annotated frames for admins.
+    Frames are only kept and JPEG-encoded while at least one feed is open.
+    """
+    import asyncio
+    from fastapi.responses import StreamingResponse
+
+    camera_service = get_camera_service()
+    token = camera_service.add_watcher(interview_id, max_fps=fps, quality=quality)
+
+    async def frames():
+        last_id = 0
+        try:
+            while True:
+                # JPEG encoding happens here; keep it off the event loop
+                jpeg, frame_id = await asyncio.to_thread(camera_service.get_frame, interview_id)
+                if jpeg is not None and frame_id != last_id:
+                    last_id = frame_id
+                    yield b"--frame\r\nContent-Type: image/jpeg\r\n\r\n" + jpeg + b"\r\n"
+                await asyncio.sleep(1.0 / fps)
+        finally:
+            camera_service.remove_watcher(interview_id, token)
+
+    return StreamingResponse(frames(), media_type="multipart/x-mixed-replace; boundary=frame")
+
 @router.websocket("/stream/{interview_id}")
 async def websocket_video_stream(
     websocket: WebSocket, 
     interview_id: int,
+    format: str = Query("json"),
+    max_height: Optional[int] = Query(None, ge=120, le=1080),
+    fps: Optional[float] = Query(None, gt=0, le=30),
+    quality: Optional[int] = Query(None, ge=30, le=95),
     current_user: User = Depends(get_current_user_ws)
 ):
     """
     Binary WebSocket Fallback for Video Proctoring.
+    `format` selects the result encoding ("json" or "msgpack"); results are sent only on change plus keepalives.
+    `max_height`, `fps` and `quality` may lower the capture settings the server advertises in `stream_config`.
     """
+    websocket = ws_sessions.wrap(websocket, "video", interview_id)
     connected = await handler.handle_video_stream_connect(interview_id, websocket, current_user)
     if not connected:
         return
+
+    from ..utils.proctoring_codec import ProctoringUpdateEncoder
+    from ..services.stream_negotiation import StreamSettings
+    encoder = ProctoringUpdateEncoder(format)
+    stream = StreamSettings(interview_id, max_height=max_height, max_fps=fps, jpeg_quality=quality)
+    await websocket.send_json(stream.message())
     
     try:
         while True:
@@ -66,7 +118,7 @@ async def websocket_video_stream(
                 data = await websocket.receive_bytes()
                 if not data:
                     break
-                await handler.process_video_frame(interview_id, websocket, data)
+                await handler.process_video_frame(interview_id, websocket, data, encoder=encoder, stream=stream)
             except WebSocketDisconnect:
                 raise
             except Exception as e:
@@ -89,8 +141,12 @@ async def websocket_video_stream(
 # platforms (e.g. HF Spaces). Import it conditionally so startup never crashes.
 try:
     from aiortc import RTCPeerConnection, RTCSessionDescription, RTCConfiguration, RTCIceServer
+    from aiortc.contrib.media import MediaRelay
     from ..services.webrtc import VideoTransformTrack
     WEBRTC_AVAILABLE = True
+    # Each candidate track is analysed once; the relay fans the annotated output out
+    # to the candidate echo and every admin watcher without re-running detection.
+    relay = MediaRelay()
 except ImportError:
     WEBRTC_AVAILABLE = False
     logger.warning("aiortc not installed — WebRTC endpoints are disabled on this deployment.")
@@ -100,10 +156,24 @@ class Offer(BaseModel):
     sdp: str
     type: str
     interview_id: Optional[int] = None
+    proctoring_format: Optional[str] = "json"  # DataChannel result encoding: "json" or "msgpack"
+
+def _relay_to(pc, track):
+    """Adds a relay branch of `track` to `pc`; consumers never read the source directly."""
+    pc.addTrack(relay.subscribe(track, buffered=False))
+
+
+def _attach_candidate_track(pc, track, interview_id: int, channel, proctoring_format: Optional[str]):
+    """Wraps the candidate's video with analysis, echoes it back and returns the analysed source."""
+    local_track = VideoTransformTrack(
+        track, interview_id=interview_id, channel=channel, proctoring_format=proctoring_format
+    )
+    _relay_to(pc, local_track)
+    return local_track
 
 # Global set to keep references to PCs
 pcs = set()
-# Global registry for active sessions: {interview_id: {"pc": pc, "track": video_track}}
+# Global registry for active sessions: {interview_id: {"pc": pc, "track": analysed_source_track}}
 active_sessions = {}
 
 @router.post("/offer", response_model=ApiResponse[dict], dependencies=heavy_throttle)
@@ -149,11 +219,9 @@ async def offer(params: Offer):
     @pc.on("track")
     def on_track(track):
         if track.kind == "video":
-            # 1. Wrap with AI and pass the DataChannel for real-time results
-            local_track = VideoTransformTrack(track, interview_id=interview_id, channel=channel)
-            # 2. Add to PC (Echo back to candidate)
-            pc.addTrack(local_track)
-            # 3. Register for Admin Ghost Mode
+            # 1. Wrap with AI (results go over the DataChannel) and echo a relay branch back
+            local_track = _attach_candidate_track(pc, track, interview_id, channel, params.proctoring_format)
+            # 2. Register the analysed source for Admin Ghost Mode (watchers subscribe via the relay)
             active_sessions[interview_id]["track"] = local_track
             logger.info(f"WebRTC: Track registered for Session {interview_id} (DataChannel enabled)")
 
@@ -237,9 +305,9 @@ async def watch(target_session_id: int, params: Offer):
 
     logger.info(f"WebRTC: Admin watching Session {target_session_id} - track found, establishing connection")
     
-    # Add the Candidate's track to Admin's PC
+    # Add a relay branch of the Candidate's analysed track to Admin's PC
     try:
-        pc.addTrack(track)
+        _relay_to(pc, track)
         logger.info(f"WebRTC: Track added to Admin PC for Session {target_session_id}")
     except Exception as e:
         logger.error(f"WebRTC: Failed to add track to Admin PC: {e}")
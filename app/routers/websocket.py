@@ -3,6 +3,7 @@ from sqlmodel import Session
 from ..core.database import get_db as get_session
 from ..core.logger import get_logger
 from ..services import websocket_handler as handler
+from ..services.ws_session import ws_sessions
 
 logger = get_logger(__name__)
 
@@ -23,6 +24,7 @@ async def websocket_candidate_violations(
     """
     WebSocket endpoint for candidates to receive real-time violation events.
     """
+    websocket = ws_sessions.wrap(websocket, "candidate", interview_id)
     try:
         # TODO: Implement token validation here
         await handler.handle_candidate_connect(interview_id, websocket, session)
@@ -60,6 +62,7 @@ async def websocket_admin_dashboard(
     """
     WebSocket endpoint for admin dashboard to receive interview events.
     """
+    websocket = ws_sessions.wrap(websocket, "admin_dashboard", interview_id)
     try:
         # TODO: Implement token validation here
         await handler.handle_admin_connect(interview_id, websocket)
@@ -119,8 +119,19 @@ async def lifespan(app: FastAPI):
                 logger.error(f"Lifespan: Error in background expiry check: {e}")
             await asyncio.sleep(60)
 
+    # --- Dashboard counter reconciliation (corrects drift in the incremental counters) ---
+    async def periodic_dashboard_reconcile():
+        from .services.dashboard_counters import dashboard_counters
+        while True:
+            await asyncio.sleep(dashboard_counters.reconcile_interval)
+            try:
+                await asyncio.to_thread(dashboard_counters.reconcile_if_due)
+            except Exception as e:
+                logger.error(f"Lifespan: Error reconciling dashboard counters: {e}")
+
     import asyncio
     app.state.expiry_task = asyncio.create_task(periodic_expiry_check())
+    app.state.dashboard_reconcile_task = asyncio.create_task(periodic_dashboard_reconcile())
     
     # RATE LIMITING: Protect AI resources
     redis_conn = None
@@ -140,6 +151,21 @@ async def lifespan(app: FastAPI):
         logger.warning("Lifespan: fastapi-limiter not installed. Rate limiting disabled.")
     except Exception as re_e:
         logger.error(f"Lifespan: Rate Limiter failed to start: {re_e}")
+    # --- Broadcasts from worker threads are handed to this loop ---
+    from .services.broadcast_dispatcher import dispatcher as broadcast_dispatcher
+    broadcast_dispatcher.start(asyncio.get_running_loop())
+
+    # --- Cross-worker WebSocket fan-out ---
+    from .services.websocket_manager import manager as ws_manager
+    try:
+        await ws_manager.start_backplane()
+    except Exception as bp_e:
+        logger.error(f"Lifespan: WebSocket backplane failed to start: {bp_e}")
+
+    # --- Replay status timeline entries saved by the previous shutdown ---
+    from .services.timeline_buffer import timeline_buffer
+    timeline_buffer.recover()
+
     # --- Skip heavy ML if Orchestrator Mode ---
     if not IS_ORCHESTRATOR:
         _apply_torchaudio_patch()
@@ -171,6 +197,15 @@ async def lifespan(app: FastAPI):
     from .core.database import engine
     if service is not None:
         service.stop()
+    await ws_manager.stop_backplane()
+    from .services.ws_session import ws_sessions
+    await ws_sessions.stop()
+    # Persist heartbeats still waiting for their batch
+    from .services.activity_tracker import activity_tracker
+    activity_tracker.close()
+    # Bulk-insert buffered status timeline entries (kept on disk if the DB is unreachable)
+    timeline_buffer.close()
+    await broadcast_dispatcher.stop()
     engine.dispose()
     
     # CLEANUP: Close Redis connection explicitly to avoid event loop error
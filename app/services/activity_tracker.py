@@ -0,0 +1,149 @@
+"""
+Write-batched InterviewSession.last_activity heartbeats.
+
+Candidate API calls (`/next-question`, `/submit-answer-*`) bump the session's
+last-activity timestamp on every request. Instead of one UPDATE + commit per
+request, `touch` records the time in memory and a background thread flushes
+all pending timestamps every `flush_interval` seconds with a single
+multi-row UPDATE (never moving a stored timestamp backwards).
+
+Readers that show activity (live-status dashboard, status summaries) call
+`latest`, which returns the newer of the stored value and this process's
+unflushed one. Other workers see the value once it is flushed.
+"""
+
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from ..core.config import ACTIVITY_FLUSH_INTERVAL
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    # The column is stored without a timezone; in-process writers mix both kinds
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class ActivityTracker:
+    def __init__(self, flush_interval: float = ACTIVITY_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._pending: Dict[int, datetime] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        self.touched = 0
+        self.flushes = 0
+        self.persisted = 0
+
+    def touch(self, interview_id: int, now: Optional[datetime] = None) -> datetime:
+        """Records activity for an interview; persisted on the next flush."""
+        now = _naive_utc(now) if now is not None else datetime.now(timezone.utc).replace(tzinfo=None)
+        with self._lock:
+            self.touched += 1
+            current = self._pending.get(interview_id)
+            if current is None or now > current:
+                self._pending[interview_id] = now
+        self._ensure_started()
+        return now
+
+    def latest(self, interview_id: int, stored: Optional[datetime]) -> Optional[datetime]:
+        """The newer of a stored last_activity and this process's unflushed value."""
+        with self._lock:
+            pending = self._pending.get(interview_id)
+        if pending is None:
+            return stored
+        if stored is None or pending > _naive_utc(stored):
+            return pending
+        return stored
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self, db_session=None) -> int:
+        """Writes all pending timestamps in one UPDATE. Returns the number of interviews flushed."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+
+            try:
+                if db_session is not None:
+                    self._write(db_session, batch)
+                else:
+                    from sqlmodel import Session
+                    from ..core.database import engine
+                    with Session(engine) as session:
+                        self._write(session, batch)
+            except Exception:
+                with self._lock:
+                    # Retry on the next flush unless a newer touch arrived meanwhile
+                    for interview_id, value in batch.items():
+                        current = self._pending.get(interview_id)
+                        if current is None or value > current:
+                            self._pending[interview_id] = value
+                raise
+
+            self.flushes += 1
+            self.persisted += len(batch)
+            return len(batch)
+
+    def close(self):
+        self._running = False
+        self._wakeup.set()
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"ActivityTracker: Final flush failed: {e}")
+
+    def metrics(self) -> Dict[str, int]:
+        return {"pending": self.pending(), "touched": self.touched, "flushes": self.flushes, "persisted": self.persisted}
+
+    # --- internals ---
+
+    def _write(self, session, batch: Dict[int, datetime]):
+        from sqlalchemy import case, or_, update
+        from ..models.db_models import InterviewSession
+
+        new_value = case(batch, value=InterviewSession.id)
+        stmt = (
+            update(InterviewSession)
+            .where(InterviewSession.id.in_(list(batch)))
+            # Status changes write last_activity directly; never overwrite a newer value
+            .where(or_(InterviewSession.last_activity.is_(None), InterviewSession.last_activity < new_value))
+            .values(last_activity=new_value)
+            .execution_options(synchronize_session=False)
+        )
+        session.execute(stmt)
+        session.commit()
+
+    def _ensure_started(self):
+        if self._running:
+            return
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="activity-flush", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while self._running:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"ActivityTracker: Flush failed: {e}")
+
+
+activity_tracker = ActivityTracker()
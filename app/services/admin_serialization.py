@@ -1,6 +1,7 @@
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
 import json as _json
+from .activity_tracker import activity_tracker
 
 from ..models.db_models import (
     InterviewSession, 
@@ -132,7 +133,7 @@ def serialize_interview_admin_detail(session_obj: InterviewSession) -> Dict[str,
         "status": _get_enum_value(session_obj.status),
         "current_status": _get_enum_value(session_obj.current_status),
         "response_count": ans_count,
-        "last_activity": session_obj.last_activity,
+        "last_activity": activity_tracker.latest(session_obj.id, session_obj.last_activity),
         "result_status": res_status,
         "max_marks": float((paper_data["total_marks"] if paper_data else 0) + (coding_paper_data["total_marks"] if coding_paper_data else 0)),
         "total_score": float(session_obj.total_score or 0.0),
@@ -0,0 +1,133 @@
+"""
+Topic filters for global admin dashboard sockets.
+
+Each admin socket has a subscription: a scope ("own" interviews, the admin's
+"team", "all" for super admins, or "none"), optional explicit interview ids and
+optional event types. Subscriptions are indexed by interview id, owning admin
+and team, so routing an event only touches the sockets that can match it
+rather than every connected admin.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+SCOPES = ("own", "team", "all", "none")
+
+# (admin_id, team_id) of the admin who owns an interview
+Owner = Tuple[Optional[int], Optional[int]]
+
+
+class AdminSubscription:
+    __slots__ = ("websocket", "admin_id", "team_id", "is_super", "scope", "interview_ids", "event_types")
+
+    def __init__(self, websocket, admin_id: Optional[int] = None, team_id: Optional[int] = None, is_super: bool = False):
+        self.websocket = websocket
+        self.admin_id = admin_id
+        self.team_id = team_id
+        self.is_super = is_super
+        # Unauthenticated (legacy) registrations keep the old receive-everything behaviour
+        self.scope = "all" if is_super or admin_id is None else "own"
+        self.interview_ids: Set[int] = set()
+        self.event_types: Optional[Set[str]] = None  # None = every event type
+
+    def wants(self, event_type: Optional[str]) -> bool:
+        return self.event_types is None or event_type is None or event_type in self.event_types
+
+    def describe(self) -> dict:
+        return {
+            "scope": self.scope,
+            "interview_ids": sorted(self.interview_ids),
+            "event_types": sorted(self.event_types) if self.event_types is not None else None,
+        }
+
+
+class SubscriptionIndex:
+    def __init__(self):
+        self._subs: Dict[object, AdminSubscription] = {}
+        self._all: Set[AdminSubscription] = set()
+        self._by_admin: Dict[int, Set[AdminSubscription]] = {}
+        self._by_team: Dict[int, Set[AdminSubscription]] = {}
+        self._by_interview: Dict[int, Set[AdminSubscription]] = {}
+
+    def __len__(self) -> int:
+        return len(self._subs)
+
+    def get(self, websocket) -> Optional[AdminSubscription]:
+        return self._subs.get(websocket)
+
+    def add(self, sub: AdminSubscription):
+        self.remove(sub.websocket)
+        self._subs[sub.websocket] = sub
+        self._index(sub)
+
+    def remove(self, websocket) -> Optional[AdminSubscription]:
+        sub = self._subs.pop(websocket, None)
+        if sub is not None:
+            self._unindex(sub)
+        return sub
+
+    def update(
+        self,
+        websocket,
+        scope: Optional[str] = None,
+        interview_ids: Optional[Iterable[int]] = None,
+        event_types: Optional[Iterable[str]] = None,
+        all_event_types: bool = False,
+    ) -> AdminSubscription:
+        """Changes a subscription's filters. Raises ValueError for scopes the admin may not use."""
+        sub = self._subs[websocket]
+        if scope is not None:
+            if scope not in SCOPES:
+                raise ValueError(f"Unknown scope '{scope}'")
+            if scope == "all" and not sub.is_super and sub.admin_id is not None:
+                raise ValueError("Scope 'all' requires a super admin")
+            if scope == "team" and sub.team_id is None:
+                raise ValueError("Scope 'team' requires the admin to belong to a team")
+        self._unindex(sub)
+        if scope is not None:
+            sub.scope = scope
+        if interview_ids is not None:
+            sub.interview_ids = {int(i) for i in interview_ids}
+        if all_event_types:
+            sub.event_types = None
+        elif event_types is not None:
+            sub.event_types = {str(t) for t in event_types}
+        self._index(sub)
+        return sub
+
+    def match(self, interview_id: Optional[int], owner: Optional[Owner], event_type: Optional[str]) -> List[object]:
+        """Sockets whose filters accept an event (events without an interview go to every subscriber)."""
+        if interview_id is None:
+            candidates = self._subs.values()
+        else:
+            candidates = set(self._all)
+            candidates.update(self._by_interview.get(interview_id, ()))
+            if owner is not None:
+                admin_id, team_id = owner
+                if admin_id is not None:
+                    candidates.update(self._by_admin.get(admin_id, ()))
+                if team_id is not None:
+                    candidates.update(self._by_team.get(team_id, ()))
+        return [sub.websocket for sub in candidates if sub.wants(event_type)]
+
+    def _buckets(self, sub: AdminSubscription) -> List[Tuple[dict, int]]:
+        buckets = [(self._by_interview, i) for i in sub.interview_ids]
+        if sub.scope in ("own", "team") and sub.admin_id is not None:
+            buckets.append((self._by_admin, sub.admin_id))
+        if sub.scope == "team" and sub.team_id is not None:
+            buckets.append((self._by_team, sub.team_id))
+        return buckets
+
+    def _index(self, sub: AdminSubscription):
+        if sub.scope == "all":
+            self._all.add(sub)
+        for index, key in self._buckets(sub):
+            index.setdefault(key, set()).add(sub)
+
+    def _unindex(self, sub: AdminSubscription):
+        self._all.discard(sub)
+        for index, key in self._buckets(sub):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.discard(sub)
+                if not bucket:
+                    del index[key]
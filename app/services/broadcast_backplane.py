@@ -0,0 +1,144 @@
+"""
+Cross-worker fan-out for WebSocket broadcasts.
+
+Each worker process owns its own sockets, so a broadcast made on one worker is
+also published to the backplane and delivered by every other worker to the
+sockets it holds. Messages carry the publishing node's id so a worker never
+re-delivers its own broadcasts (those are delivered locally straight away).
+
+- RedisBackplane: Redis pub/sub, for multiple uvicorn workers or replicas.
+- LocalBackplane: in-process stand-in; managers attached to the same LocalHub
+  behave like separate workers sharing a channel (used in tests, and when Redis
+  is unavailable, where it limits fan-out to this process).
+"""
+
+import asyncio
+import json
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+Handler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+CHANNEL = "ws:broadcast"
+RECONNECT_DELAY = 2.0
+MAX_RECONNECT_DELAY = 30.0
+
+
+class LocalHub:
+    def __init__(self):
+        self.subscribers: List["LocalBackplane"] = []
+
+
+class LocalBackplane:
+    def __init__(self, hub: Optional[LocalHub] = None):
+        self.hub = hub or LocalHub()
+        self.node_id = uuid.uuid4().hex
+        self.handler: Optional[Handler] = None
+        self.published = 0
+
+    async def start(self, handler: Handler):
+        self.handler = handler
+        self.hub.subscribers.append(self)
+
+    async def stop(self):
+        if self in self.hub.subscribers:
+            self.hub.subscribers.remove(self)
+
+    async def publish(self, message: Dict[str, Any]):
+        self.published += 1
+        envelope = {**message, "origin": self.node_id}
+        for subscriber in self.hub.subscribers[:]:
+            if subscriber is not self and subscriber.handler is not None:
+                await subscriber.handler(envelope)
+
+
+class RedisBackplane:
+    def __init__(self, url: str, channel: str = CHANNEL):
+        self.url = url
+        self.channel = channel
+        self.node_id = uuid.uuid4().hex
+        self.client = None
+        self.handler: Optional[Handler] = None
+        self._task: Optional[asyncio.Task] = None
+        self.published = 0
+        self.received = 0
+
+    async def connect(self):
+        import redis.asyncio as redis
+
+        conn_kwargs = {"decode_responses": True}
+        if self.url.startswith("rediss://"):
+            conn_kwargs["ssl_cert_reqs"] = "none"
+        self.client = redis.from_url(self.url, **conn_kwargs)
+        await asyncio.wait_for(self.client.ping(), timeout=5.0)
+
+    async def start(self, handler: Handler):
+        self.handler = handler
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self.client is not None:
+            try:
+                await self.client.close()
+            except Exception as e:
+                logger.warning(f"Backplane: Error closing Redis connection: {e}")
+
+    async def publish(self, message: Dict[str, Any]):
+        try:
+            await self.client.publish(self.channel, json.dumps({**message, "origin": self.node_id}, separators=(",", ":")))
+            self.published += 1
+        except Exception as e:
+            logger.error(f"Backplane: Publish failed, other workers miss this broadcast: {e}")
+
+    async def _listen(self):
+        delay = RECONNECT_DELAY
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                logger.info(f"Backplane: Subscribed to {self.channel}")
+                delay = RECONNECT_DELAY
+                async for item in pubsub.listen():
+                    if item.get("type") != "message":
+                        continue
+                    try:
+                        envelope = json.loads(item["data"])
+                    except (TypeError, ValueError):
+                        continue
+                    if envelope.get("origin") == self.node_id:
+                        continue
+                    self.received += 1
+                    try:
+                        await self.handler(envelope)
+                    except Exception as e:
+                        logger.error(f"Backplane: Delivery failed: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Backplane: Subscription lost ({e}), retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RECONNECT_DELAY)
+            finally:
+                try:
+                    await pubsub.close()
+                except Exception:
+                    pass
+
+
+async def create_backplane(mode: str, url: str):
+    """Redis pub/sub when configured and reachable, otherwise the in-process stand-in."""
+    if mode == "redis" and url:
+        backplane = RedisBackplane(url)
+        try:
+            await backplane.connect()
+            return backplane
+        except Exception as e:
+            logger.warning(f"Backplane: Redis unavailable ({type(e).__name__}: {e}); broadcasts reach this worker only")
+    return LocalBackplane()
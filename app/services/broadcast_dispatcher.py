@@ -0,0 +1,180 @@
+"""
+Thread-safe hand-off of broadcast coroutines to the server's event loop.
+
+Proctoring, scoring and status updates run in executor, camera and background
+threads that have no event loop of their own. They `submit` broadcast
+coroutines here instead of calling `asyncio.get_event_loop()`:
+
+- The main loop is captured at startup (`start`), and a single task on it
+  drains a queue of submitted coroutines, starting each as its own task (at
+  most `max_concurrent` at once), so one slow DB read or backplane publish
+  does not hold up the broadcasts queued behind it. Submitting from a thread
+  is just `call_soon_threadsafe`, so the submitting thread never blocks.
+- After `stop()` (server shutdown) submissions are rejected.
+- Submitting from code already running on the main loop schedules directly.
+- In processes without a server loop (Celery workers, scripts) a private
+  daemon loop thread is started on first use, so updates are still delivered
+  (to other workers through the WebSocket backplane) rather than dropped.
+"""
+
+import asyncio
+import threading
+from typing import Coroutine, Optional, Set
+
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAX_PENDING = 10000  # Submitted but not yet started broadcasts
+MAX_CONCURRENT = 64  # Broadcasts running at once
+
+
+class BroadcastDispatcher:
+    def __init__(self, max_pending: int = MAX_PENDING, max_concurrent: int = MAX_CONCURRENT):
+        self.max_pending = max_pending
+        self.max_concurrent = max_concurrent
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._running: Set[asyncio.Task] = set()
+        self._stopped = False
+        self._fallback_lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Binds to the running (main) loop and starts the drain task. Call from that loop."""
+        self.loop = loop or asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+        self._stopped = False
+        self._drain_task = self.loop.create_task(self._drain())
+        logger.info("BroadcastDispatcher: Bound to main event loop")
+
+    async def stop(self):
+        """Shutdown: cancels queued and running broadcasts; later submissions are rejected."""
+        self._stopped = True
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+        for task in list(self._running):
+            task.cancel()
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._queue.get_nowait().close()
+        self.loop = None
+        self._queue = None
+
+    def submit(self, coro: Coroutine) -> bool:
+        """Schedules a broadcast coroutine from any thread without waiting for it."""
+        if self._stopped:
+            # Shutting down: never fall back to a private loop inside the server process
+            coro.close()
+            self.rejected += 1
+            return False
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        loop = self.loop
+        if loop is None or loop.is_closed():
+            if running is not None:
+                # Not bound (e.g. no lifespan ran): the caller's own loop is the best target
+                self.submitted += 1
+                running.create_task(coro)
+                return True
+            return self._run_without_loop(coro)
+
+        self.submitted += 1
+        if running is loop:
+            self._enqueue(coro)
+        else:
+            loop.call_soon_threadsafe(self._enqueue, coro)
+        return True
+
+    def _enqueue(self, coro: Coroutine):
+        # Runs on the main loop
+        if self._queue is None:
+            coro.close()
+            self.rejected += 1
+            return
+        try:
+            self._queue.put_nowait(coro)
+        except asyncio.QueueFull:
+            coro.close()
+            self.rejected += 1
+            if self.rejected % 100 == 1:
+                logger.error(f"BroadcastDispatcher: Queue full ({self.max_pending}), rejected {self.rejected} broadcasts")
+
+    async def _drain(self):
+        # Only the thread hand-off is serialized; each broadcast runs as its own task
+        while True:
+            coro = await self._queue.get()
+            try:
+                await self._slots.acquire()
+            except asyncio.CancelledError:
+                coro.close()
+                raise
+            task = self.loop.create_task(self._run(coro, self._slots))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, coro: Coroutine, slots: asyncio.Semaphore):
+        try:
+            await coro
+            self.completed += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"BroadcastDispatcher: Broadcast failed: {e}")
+        finally:
+            slots.release()
+
+    def _run_without_loop(self, coro: Coroutine) -> bool:
+        """No server loop in this process: run broadcasts on a private loop thread."""
+        with self._fallback_lock:
+            if self.loop is None or self.loop.is_closed():
+                ready = threading.Event()
+
+                def _run_loop():
+                    loop = asyncio.new_event_loop()
+                    asyncio.set_event_loop(loop)
+                    self.start(loop)
+                    # Drained first, so later broadcasts already have the backplane
+                    self._queue.put_nowait(self._start_backplane())
+                    ready.set()
+                    loop.run_forever()
+
+                threading.Thread(target=_run_loop, name="broadcast-dispatcher", daemon=True).start()
+                ready.wait(timeout=5.0)
+        if self.loop is None:
+            coro.close()
+            self.rejected += 1
+            return False
+        return self.submit(coro)
+
+    async def _start_backplane(self):
+        # Without local sockets, broadcasts only matter if they reach other workers
+        from .websocket_manager import manager
+        try:
+            await manager.start_backplane()
+        except Exception as e:
+            logger.warning(f"BroadcastDispatcher: No backplane for out-of-server broadcasts: {e}")
+
+    def stats(self) -> dict:
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "running": len(self._running),
+        }
+
+
+dispatcher = BroadcastDispatcher()
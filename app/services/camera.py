@@ -2,12 +2,38 @@ import threading
 import time
 import os
 from typing import Optional, Tuple, Any
-from ..core.config import IS_ORCHESTRATOR
-from ..utils.image_processing import decode_image
+from ..core.config import IS_ORCHESTRATOR, PROCTORING_CLIENT_MAX_HEIGHT, PROCTORING_CLIENT_MAX_WIDTH
+from ..utils.image_processing import decode_image, resize_with_aspect_ratio
 from ..core.logger import get_logger
+from .session_expiry import SessionExpiry
+from .camera_sessions import CameraSessionStore
 
 logger = get_logger(__name__)
 
+SESSION_IDLE_TTL = 600     # Seconds without frames before a session's state is cleared
+MONITOR_MAX_SLEEP = 60.0   # Upper bound on the monitor's wait when nothing is scheduled
+MIN_RESTART_INTERVAL = 2.0 # Seconds between restarts of the same crashing worker
+DEFAULT_WATCH_FPS = 10.0
+DEFAULT_WATCH_QUALITY = 80
+
+
+class SessionFrameState:
+    """
+    Latest annotated frame of one interview plus its lazily encoded JPEG.
+    Frames are only retained while at least one watcher is subscribed, and are
+    JPEG-encoded on read at the highest rate/quality any watcher asked for.
+    """
+    __slots__ = ("lock", "raw", "frame_id", "jpeg", "jpeg_id", "encoded_at", "watchers")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.raw: Optional[Any] = None
+        self.frame_id: int = 0
+        self.jpeg: Optional[bytes] = None
+        self.jpeg_id: int = 0
+        self.encoded_at: float = float("-inf")
+        self.watchers: dict[int, Tuple[float, int]] = {}  # {token: (max_fps, jpeg_quality)}
+
 
 class CameraService:
     """
@@ -31,24 +57,30 @@ class CameraService:
         
         self.face_detector: Optional[Any] = None
         self.gaze_detector: Optional[Any] = None
+        # Shared-memory ring the detectors read frames from (None -> queue transport)
+        self.frame_ring: Optional[Any] = None
 
         self.running: bool = False
         self._listeners = []
         
         # Session Isolation: {interview_id: value}
-        self.session_frames: dict[int, bytes] = {}
-        self.session_frame_ids: dict[int, int] = {}
-        self.session_warnings: dict[int, str] = {}
-        self.session_results: dict[int, dict] = {}  # last detection details for debugging
-        self.session_start_times: dict[int, float] = {} # {interview_id: timestamp}
-        self.session_last_active: dict[int, float] = {} # {interview_id: timestamp}
-        
-        from concurrent.futures import ThreadPoolExecutor
-        self.executor = ThreadPoolExecutor(max_workers=5)
+        self.sessions = CameraSessionStore(on_evict=self.clear_session)  # bounded per-session verdict records
+        self.session_frames: dict[int, SessionFrameState] = {}  # annotated frames for watchers (per-session locks)
+        self._next_watch_token = 0
+        self.session_expiry = SessionExpiry(ttl=SESSION_IDLE_TTL)  # idle deadlines, replaces a periodic scan
+
+        from .frame_sampler import AdaptiveFrameSampler
+        self.sampler = AdaptiveFrameSampler()
+
+        from .violation_buffer import ViolationBuffer
+        self.violations = ViolationBuffer()
         
-        self.frame_lock = threading.Lock()
+        self.frame_lock = threading.Lock()  # guards session_frames membership only
         self._detectors_ready = False
         self._monitor_thread = None
+        import multiprocessing
+        self._monitor_wakeup_r, self._monitor_wakeup_w = multiprocessing.Pipe(duplex=False)
+        self._last_restart: dict[str, float] = {}
 
     def start(self, video_source=None):
         """
@@ -76,11 +108,19 @@ class CameraService:
 
             logger.info("Background: Initializing Detectors...")
             gaze_path = "app/assets/face_landmarker.task"
+
+            try:
+                from .frame_buffer import SharedFrameRing
+                self.frame_ring = SharedFrameRing()
+                logger.info(f"Background: Shared frame ring ready ({self.frame_ring.slots} slots).")
+            except Exception as e:
+                logger.warning(f"Background: Shared frame ring unavailable, using queue transport: {e}")
+                self.frame_ring = None
             
             try:
                 from .face import FaceDetector
                 # FaceDetector no longer needs known_path in constructor (Multi-User Refactor)
-                self.face_detector = FaceDetector()
+                self.face_detector = FaceDetector(frame_ring_spec=self._frame_ring_spec())
                 logger.info("Background: FaceDetector ready.")
             except Exception as e:
                 logger.error(f"Background: FaceDetector failed: {e}", exc_info=True)
@@ -88,7 +128,7 @@ class CameraService:
             if os.path.exists(gaze_path):
                 try:
                     from .gaze import GazeDetector
-                    self.gaze_detector = GazeDetector(model_path=gaze_path, max_faces=1)
+                    self.gaze_detector = GazeDetector(model_path=gaze_path, max_faces=1, frame_ring_spec=self._frame_ring_spec())
                     logger.info("Background: GazeDetector ready.")
                 except Exception as e:
                     logger.error(f"Background: GazeDetector failed: {e}", exc_info=True)
@@ -97,6 +137,7 @@ class CameraService:
             
             # Mark ready even if one detector fails - allows partial proctoring
             self._detectors_ready = True
+            self._wake_monitor()  # Start watching the new worker sentinels
             logger.info(f"Background: Detectors Initialized (Face: {'✓' if self.face_detector else '✗'}, Gaze: {'✓' if self.gaze_detector else '✗'}).")
 
         threading.Thread(target=init_detectors, daemon=True).start()
@@ -105,10 +146,18 @@ class CameraService:
 
     def stop(self):
         self.running = False
+        self._wake_monitor()
+        self.violations.close()
         if self.face_detector:
             self.face_detector.close()
         if self.gaze_detector:
             self.gaze_detector.close()
+        if self.frame_ring:
+            self.frame_ring.close()
+            self.frame_ring = None
+
+    def _frame_ring_spec(self):
+        return self.frame_ring.spec if self.frame_ring else None
 
     def process_frame_ndarray(self, frame: Any, interview_id: int):
 
@@ -117,16 +166,34 @@ class CameraService:
         Returns: (annotated_frame, result_dict)
         """
         try:
+            # Adaptive sampling: skip analysis (and encoding) when this session is over its rate
+            if not self.sampler.should_analyze(interview_id, self._detector_backlog()):
+                self.session_expiry.touch(interview_id)
+                self._publish_frame(interview_id, frame)
+                record = self.sessions.get(interview_id)
+                cached = record.verdict() if record is not None and record.analyzed else {"warning": ""}
+                return frame, {**cached, "analyzed": False}
+
             # Analyze
             face_status = (False, 1.0, 0, [])
             gaze_status = "No Gaze"
+
+            # Write the frame once into shared memory; both workers read it by slot.
+            # Skipped when every worker queue is full: the frame would be dropped, and the
+            # write would only recycle a slot that queued FrameRefs may still point to.
+            frame_ref = None
+            if self.frame_ring is not None and any(
+                d is not None and d.accepts_frame() for d in (self.face_detector, self.gaze_detector)
+            ):
+                shared, scale = resize_with_aspect_ratio(frame, target_height=self.frame_ring.max_height)
+                frame_ref = self.frame_ring.write(shared, scale=scale)
             
             if self.face_detector:
-                f_res = self.face_detector.process_frame(frame, interview_id)
+                f_res = self.face_detector.process_frame(frame, interview_id, frame_ref=frame_ref)
                 if f_res: face_status = f_res
             
             if self.gaze_detector:
-                g_res = self.gaze_detector.process_frame(frame)
+                g_res = self.gaze_detector.process_frame(frame, interview_id, frame_ref=frame_ref)
                 if g_res: gaze_status = g_res
 
             found, dist, n_face, locs = face_status
@@ -137,127 +204,159 @@ class CameraService:
                 for (top, right, bottom, left) in locs:
                     cv2.rectangle(frame, (left, top), (right, bottom), (0, 255, 0), 2)
 
-            
             warning = ""
             if n_face > 1: warning = "MULTIPLE FACES DETECTED"
             elif n_face == 0: warning = "NO FACE DETECTED"
             elif n_face == 1 and not found: warning = "SECURITY ALERT: UNAUTHORIZED PERSON"
             elif "WARNING" in str(gaze_status): warning = str(gaze_status)
 
-            # Update latest frame for MJPEG stream (Isolate by session)
-            with self.frame_lock:
-                import cv2
-                success, buffer = cv2.imencode('.jpg', frame)
-                if success:
-                    self.session_frames[interview_id] = buffer.tobytes()
-                self.session_frame_ids[interview_id] = self.session_frame_ids.get(interview_id, 0) + 1
-
-                if interview_id not in self.session_start_times:
-                    self.session_start_times[interview_id] = time.time()
-                self.session_last_active[interview_id] = time.time()
+            self._publish_frame(interview_id, frame)
+            record = self.sessions.get_or_create(interview_id)
+            self.session_expiry.touch(interview_id)
 
             # --- PERSIST PROCTORING EVENT (With Grace Period) ---
             GRACE_PERIOD = 30 # Seconds
-            in_grace_period = (time.time() - self.session_start_times.get(interview_id, time.time())) < GRACE_PERIOD
+            in_grace_period = (time.time() - record.started_at) < GRACE_PERIOD
             
             if warning and not in_grace_period:
-                def persist_violation(iid, warn, n_f, fnd, g_s):
-                    from ..core.database import engine
-                    from sqlmodel import Session
-                    from ..services.status_manager import add_violation
-                    from ..models.db_models import InterviewSession
-                    
-                    try:
-                        with Session(engine) as db_session:
-                            interview_session = db_session.get(InterviewSession, iid)
-                            if interview_session:
-                                add_violation(
-                                    session=db_session,
-                                    interview_session=interview_session,
-                                    event_type=warn,
-                                    details=f"Faces: {n_f}, Auth: {fnd}, Gaze: {g_s}"
-                                )
-                    except Exception as e:
-                        logger.error(f"Async Violation Persist Error: {e}")
-
-                self.executor.submit(persist_violation, interview_id, warning, n_face, found, gaze_status)
+                # Coalesced per incident and written in batches by the violation buffer
+                self.violations.record(interview_id, warning, f"Faces: {n_face}, Auth: {found}, Gaze: {gaze_status}")
             elif warning and in_grace_period:
                 logger.debug(f"Proctoring: Alert suppressed during grace period for Session {interview_id}")
 
             # Update state for external status calls (Isolate by session)
-            self.session_warnings[interview_id] = warning if warning else "No Issues"
-            self.session_results[interview_id] = {
-                "faces": int(n_face),
-                "gaze": str(gaze_status),
-                "warning": warning,
-                "detectors": {
-                    "face": bool(self.face_detector),
-                    "gaze": bool(self.gaze_detector)
-                }
-            }
+            self.sampler.record_result(interview_id, warning)
+            record.warning = warning
+            record.faces = int(n_face)
+            record.gaze = str(gaze_status)
+            record.auth = bool(found)
+            record.auth_dist = float(dist) if dist is not None else 1.0
+            record.box = tuple(locs[0]) if locs else None
+            record.analyzed += 1
             for callback in self._listeners:
                 try: 
-                    callback(interview_id, self.session_warnings[interview_id])
+                    callback(interview_id, warning if warning else "No Issues")
                 except Exception as e:
                     logger.warning(f"Listener callback failed: {e}")
 
-            result_dict = {
-                "auth": bool(found),
-                "auth_dist": float(dist) if dist is not None else 1.0,
-                "faces": int(n_face),
-                "gaze": str(gaze_status),
-                "warning": warning,
-                "box": locs[0] if locs else None
-            }
-            return frame, result_dict
+            return frame, {**record.verdict(), "analyzed": True}
 
         except Exception as e:
             logger.error(f"Core Frame Process Error: {e}")
             return frame, {"warning": "Server Error"}
 
+    def client_fps(self, interview_id: int) -> float:
+        """Analysis rate the sampler currently allows this session (what the client should capture at)."""
+        return self.sampler.target_fps(interview_id, self._detector_backlog())
+
+    def _publish_frame(self, interview_id: int, frame: Any):
+        """Keeps the latest frame for watchers only; JPEG encoding is deferred to get_frame."""
+        frame_state = self.session_frames.get(interview_id)
+        if frame_state is not None and frame_state.watchers:
+            with frame_state.lock:
+                frame_state.raw = frame
+                frame_state.frame_id += 1
+
+    def _detector_backlog(self) -> float:
+        """Highest worker queue fill ratio across the active detectors."""
+        backlog = 0.0
+        for detector in (self.face_detector, self.gaze_detector):
+            if detector is not None:
+                try:
+                    backlog = max(backlog, detector.backlog())
+                except Exception:
+                    pass
+        return backlog
+
     def start_monitor(self):
-        """Starts background monitoring for detector health."""
+        """
+        Starts background monitoring for detector health and idle sessions.
+        Sleeps until a worker process exits (its sentinel becomes ready), the next
+        session expiry is due, or it is woken after detectors are (re)created.
+        """
         if self._monitor_thread and self._monitor_thread.is_alive(): return
         
         def monitor_loop():
+            from multiprocessing.connection import wait
             logger.info("Detector Monitor Started.")
             while self.running:
-                time.sleep(5)
-                # Face Detector Check
-                if self.face_detector and not self.face_detector.worker.is_alive():
-                    logger.warning("MONITOR: FaceDetector worker died. Restarting...")
-                    try:
-                        from .face import FaceDetector
-                        self.face_detector = FaceDetector()
-                    except Exception as e:
-                        logger.error(f"MONITOR: Failed to restart FaceDetector: {e}")
-                
-                # Gaze Detector Check
-                if self.gaze_detector and not self.gaze_detector.worker.is_alive():
-                    logger.warning("MONITOR: GazeDetector worker died. Restarting...")
+                watched = {self._monitor_wakeup_r: None}
+                for name, detector in (("face", self.face_detector), ("gaze", self.gaze_detector)):
+                    worker = getattr(detector, "worker", None)
+                    if worker is not None:
+                        watched[worker.sentinel] = name
+
+                next_deadline = self.session_expiry.next_deadline()
+                timeout = MONITOR_MAX_SLEEP if next_deadline is None else min(
+                    MONITOR_MAX_SLEEP, max(0.0, next_deadline - time.monotonic())
+                )
+                ready = wait(list(watched), timeout=timeout)
+                if not self.running:
+                    break
+
+                for handle in ready:
+                    if handle is self._monitor_wakeup_r:
+                        while self._monitor_wakeup_r.poll():
+                            self._monitor_wakeup_r.recv_bytes()
+                    elif watched[handle] == "face":
+                        self._restart_face_detector()
+                    elif watched[handle] == "gaze":
+                        self._restart_gaze_detector()
+
+                # Cleanup stale sessions: O(expired) via the expiry heap
+                for sid in self.session_expiry.pop_expired():
+                    logger.info(f"MONITOR: Auto-clearing stale session {sid}")
                     try:
-                        from .gaze import GazeDetector
-                        self.gaze_detector = GazeDetector(model_path="app/assets/face_landmarker.task", max_faces=1)
+                        self.clear_session(sid)
                     except Exception as e:
-                        logger.error(f"MONITOR: Failed to restart GazeDetector: {e}")
-
-                # Cleanup stale sessions (TTL: 10 minutes)
-                STALE_TTL = 600
-                now = time.time()
-                stale_ids = [
-                    sid for sid, last_active in self.session_last_active.items()
-                    if (now - last_active) > STALE_TTL
-                ]
-                for sid in stale_ids:
-                    logger.info(f"MONITOR: Auto-clearing stale session {sid}")
-                    self.clear_session(sid)
+                        logger.error(f"MONITOR: Failed to clear session {sid}: {e}")
 
         self._monitor_thread = threading.Thread(target=monitor_loop, daemon=True)
         self._monitor_thread.start()
 
-    def process_external_frame(self, image_bytes, interview_id: Optional[int] = None):
+    def _wake_monitor(self):
+        try:
+            self._monitor_wakeup_w.send_bytes(b"\0")
+        except Exception:
+            pass
+
+    def _restart_backoff(self, name: str):
+        # Immediate restart, but a worker that keeps crashing on start-up must not spin the monitor
+        elapsed = time.monotonic() - self._last_restart.get(name, float("-inf"))
+        if elapsed < MIN_RESTART_INTERVAL:
+            time.sleep(MIN_RESTART_INTERVAL - elapsed)
+        self._last_restart[name] = time.monotonic()
+
+    def _restart_face_detector(self):
+        logger.warning("MONITOR: FaceDetector worker died. Restarting...")
+        self._restart_backoff("face")
+        try:
+            from .face import FaceDetector
+            self.face_detector = FaceDetector(frame_ring_spec=self._frame_ring_spec())
+        except Exception as e:
+            logger.error(f"MONITOR: Failed to restart FaceDetector: {e}")
+            self.face_detector = None
+
+    def _restart_gaze_detector(self):
+        logger.warning("MONITOR: GazeDetector worker died. Restarting...")
+        self._restart_backoff("gaze")
+        try:
+            from .gaze import GazeDetector
+            self.gaze_detector = GazeDetector(model_path="app/assets/face_landmarker.task", max_faces=1, frame_ring_spec=self._frame_ring_spec())
+        except Exception as e:
+            logger.error(f"MONITOR: Failed to restart GazeDetector: {e}")
+            self.gaze_detector = None
+
+    def process_external_frame(
+        self,
+        image_bytes,
+        interview_id: Optional[int] = None,
+        max_height: int = PROCTORING_CLIENT_MAX_HEIGHT,
+        max_width: int = PROCTORING_CLIENT_MAX_WIDTH,
+    ):
         """
         Processes a frame received from the client via WebSocket.
+        Frames larger than the negotiated size are decoded at reduced scale.
         Returns a dict of analysis results.
         """
         if not self._detectors_ready:
@@ -265,7 +364,7 @@ class CameraService:
 
         try:
             # Decode image using utility
-            frame = decode_image(image_bytes)
+            frame = decode_image(image_bytes, max_height=max_height, max_width=max_width)
             
             if frame is None:
                 return {"warning": "Bad Frame"}
@@ -278,10 +377,56 @@ class CameraService:
             logger.error(f"Frame Process Error: {e}")
             return {"warning": "Server Error"}
 
-    def get_frame(self, interview_id: int) -> Tuple[Optional[bytes], int]:
-        """Returns the latest annotated frame and its unique ID for a specific session."""
+    def add_watcher(self, interview_id: int, max_fps: float = DEFAULT_WATCH_FPS, quality: int = DEFAULT_WATCH_QUALITY) -> int:
+        """
+        Subscribes a viewer to a session's annotated frames and returns a token for `remove_watcher`.
+        Unwatched sessions never retain or encode frames.
+        """
+        with self.frame_lock:
+            frame_state = self.session_frames.get(interview_id)
+            if frame_state is None:
+                frame_state = self.session_frames[interview_id] = SessionFrameState()
+            self._next_watch_token += 1
+            token = self._next_watch_token
+        with frame_state.lock:
+            frame_state.watchers[token] = (max(0.1, float(max_fps)), min(max(int(quality), 10), 95))
+        return token
+
+    def remove_watcher(self, interview_id: int, token: int):
         with self.frame_lock:
-            return self.session_frames.get(interview_id), self.session_frame_ids.get(interview_id, 0)
+            frame_state = self.session_frames.get(interview_id)
+            if frame_state is None:
+                return
+            with frame_state.lock:
+                frame_state.watchers.pop(token, None)
+                if not frame_state.watchers:
+                    del self.session_frames[interview_id]
+
+    def get_frame(self, interview_id: int) -> Tuple[Optional[bytes], int]:
+        """
+        Returns the latest annotated JPEG and its unique ID for a specific session.
+        Encodes on demand, at most at the fastest rate requested by the session's watchers.
+        """
+        frame_state = self.session_frames.get(interview_id)
+        if frame_state is None:
+            return None, 0
+
+        with frame_state.lock:
+            if frame_state.raw is None or not frame_state.watchers:
+                return frame_state.jpeg, frame_state.jpeg_id
+
+            max_fps = max(fps for fps, _ in frame_state.watchers.values())
+            quality = max(q for _, q in frame_state.watchers.values())
+            now = time.monotonic()
+            stale = frame_state.jpeg_id != frame_state.frame_id
+            if stale and now - frame_state.encoded_at >= 1.0 / max_fps:
+                import cv2
+                success, buffer = cv2.imencode('.jpg', frame_state.raw, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+                if success:
+                    frame_state.jpeg = buffer.tobytes()
+                    frame_state.jpeg_id = frame_state.frame_id
+                    frame_state.encoded_at = now
+            return frame_state.jpeg, frame_state.jpeg_id
 
 
 
@@ -289,7 +434,48 @@ class CameraService:
         self._listeners.append(callback)
 
     def get_current_warning(self, interview_id: int):
-        return self.session_warnings.get(interview_id, "System Active")
+        record = self.sessions.get(interview_id)
+        if record is None or not record.analyzed:
+            return "System Active"
+        return record.warning if record.warning else "No Issues"
+
+    def get_session_result(self, interview_id: int) -> dict:
+        """Last detection details for a session (empty if it has not been analysed)."""
+        record = self.sessions.get(interview_id)
+        if record is None or not record.analyzed:
+            return {}
+        return {
+            "faces": record.faces,
+            "gaze": record.gaze,
+            "warning": record.warning,
+            "detectors": {
+                "face": bool(self.face_detector),
+                "gaze": bool(self.gaze_detector)
+            }
+        }
+
+    def metrics(self) -> dict:
+        """Per-node proctoring state and approximate memory held by it."""
+        with self.frame_lock:
+            frame_states = list(self.session_frames.values())
+        frame_bytes = 0
+        for frame_state in frame_states:
+            raw, jpeg = frame_state.raw, frame_state.jpeg
+            frame_bytes += (raw.nbytes if raw is not None else 0) + (len(jpeg) if jpeg is not None else 0)
+        sessions = self.sessions.metrics()
+        return {
+            "sessions": sessions,
+            "watched_sessions": len(frame_states),
+            "frame_bytes": frame_bytes,
+            "approx_bytes": sessions["approx_bytes"] + frame_bytes,
+            "idle_tracked": len(self.session_expiry),
+            "sampler": self.sampler.metrics(),
+            "violations": {
+                "recorded": self.violations.recorded,
+                "persisted": self.violations.persisted,
+                "pending": self.violations.pending(),
+            },
+        }
 
     def clear_session(self, interview_id: int):
         """
@@ -297,10 +483,19 @@ class CameraService:
         Should be called when an interview finishes or the candidate disconnects.
         """
         with self.frame_lock:
-            self.session_frames.pop(interview_id, None)
-            self.session_frame_ids.pop(interview_id, None)
-            self.session_warnings.pop(interview_id, None)
-            self.session_start_times.pop(interview_id, None)
-            self.session_last_active.pop(interview_id, None)
+            frame_state = self.session_frames.get(interview_id)
+            if frame_state is not None:
+                # Watchers keep their subscription; only the stale frame is dropped
+                with frame_state.lock:
+                    frame_state.raw = None
+                    frame_state.jpeg = None
+            self.sessions.pop(interview_id)
+            self.session_expiry.discard(interview_id)
+            self.sampler.forget(interview_id)
+            self.violations.forget(interview_id)
+            if self.face_detector:
+                self.face_detector.clear_session(interview_id)
+            if self.gaze_detector:
+                self.gaze_detector.clear_session(interview_id)
             logger.info(f"Proctoring: Cleared session data for Interview {interview_id}")
 
@@ -0,0 +1,110 @@
+"""
+Compact, bounded per-interview proctoring state for CameraService.
+
+All per-session fields live in one slotted record instead of a handful of
+parallel dicts, and the store caps the number of records it keeps. When the cap
+is exceeded the least recently active session is evicted (and its detector
+state released through the eviction callback), so a long-running node cannot
+accumulate state for every interview it has ever seen.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..core.config import CAMERA_MAX_SESSIONS
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class CameraSession:
+    interview_id: int
+    started_at: float = field(default_factory=time.time)
+    warning: str = ""                 # "" means no issues
+    faces: int = 0
+    gaze: str = "No Gaze"
+    auth: bool = False
+    auth_dist: float = 1.0
+    box: Optional[Tuple[int, int, int, int]] = None
+    analyzed: int = 0                 # Analysed frames; 0 means no verdict yet
+
+    def verdict(self) -> Dict[str, Any]:
+        """Latest per-frame result (served again for frames that skip analysis)."""
+        return {
+            "auth": self.auth,
+            "auth_dist": self.auth_dist,
+            "faces": self.faces,
+            "gaze": self.gaze,
+            "warning": self.warning,
+            "box": self.box,
+        }
+
+    def approx_bytes(self) -> int:
+        size = sys.getsizeof(self) + sys.getsizeof(self.warning) + sys.getsizeof(self.gaze)
+        if self.box is not None:
+            size += sys.getsizeof(self.box)
+        return size
+
+
+class CameraSessionStore:
+    def __init__(self, max_sessions: int = CAMERA_MAX_SESSIONS, on_evict: Optional[Callable[[int], None]] = None):
+        self.max_sessions = max_sessions
+        self.on_evict = on_evict
+        self._sessions: "OrderedDict[int, CameraSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, interview_id: int) -> bool:
+        return interview_id in self._sessions
+
+    def get(self, interview_id: int) -> Optional[CameraSession]:
+        return self._sessions.get(interview_id)
+
+    def get_or_create(self, interview_id: int) -> CameraSession:
+        """Returns the session's record, marking it most recently active."""
+        evicted = []
+        with self._lock:
+            record = self._sessions.get(interview_id)
+            if record is None:
+                record = self._sessions[interview_id] = CameraSession(interview_id)
+                self.created += 1
+                while len(self._sessions) > self.max_sessions:
+                    old_id, _ = self._sessions.popitem(last=False)
+                    evicted.append(old_id)
+                    self.evicted += 1
+            else:
+                self._sessions.move_to_end(interview_id)
+
+        # Outside the lock: the callback may call back into the store
+        for old_id in evicted:
+            logger.warning(f"CameraSessionStore: Capacity {self.max_sessions} reached, evicting Session {old_id}")
+            if self.on_evict:
+                try:
+                    self.on_evict(old_id)
+                except Exception as e:
+                    logger.error(f"CameraSessionStore: Eviction callback failed for Session {old_id}: {e}")
+        return record
+
+    def pop(self, interview_id: int) -> Optional[CameraSession]:
+        with self._lock:
+            return self._sessions.pop(interview_id, None)
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            records = list(self._sessions.values())
+        return {
+            "sessions": len(records),
+            "max_sessions": self.max_sessions,
+            "created": self.created,
+            "evicted": self.evicted,
+            "approx_bytes": sum(r.approx_bytes() for r in records),
+        }
@@ -0,0 +1,375 @@
+"""
+Incrementally maintained admin dashboard counters.
+
+`compute_dashboard_metrics` answers "how many interviews are live, how many
+started today, how many of those had violations, how many passed/failed" by
+querying the tables. Admin broadcasts need those numbers on every candidate
+event, so instead they are kept as counters:
+
+- ORM flush hooks turn status transitions (InterviewSession.status/start_time,
+  new ProctoringEvents, InterviewResult.result_status) into counter deltas,
+  applied only once the transaction commits.
+- Counters live in Redis when it is reachable so every worker shares them, and
+  in process memory otherwise.
+- `reconcile` rebuilds them from SQL COUNT/GROUP BY queries. It runs when a
+  day's counters are first read and periodically (DASHBOARD_RECONCILE_INTERVAL),
+  correcting drift from writes made outside the ORM or by other processes.
+"""
+
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import distinct, event, func, inspect
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, select
+
+from ..core.config import DASHBOARD_RECONCILE_INTERVAL, REDIS_URL
+from ..core.logger import get_logger
+from ..models.db_models import InterviewResult, InterviewSession, InterviewStatus, ProctoringEvent
+
+logger = get_logger(__name__)
+
+LIVE_STATUSES = (InterviewStatus.LIVE, InterviewStatus.CONNECTED, InterviewStatus.DISCONNECTED)
+_LIVE_VALUES = {s.value for s in LIVE_STATUSES}
+KEY_PREFIX = "dashboard"
+DAY_KEY_TTL = 3 * 24 * 3600          # Per-day counters outlive the day they describe
+REDIS_RETRY_INTERVAL = 60.0          # Seconds before retrying an unreachable Redis
+
+# Counter names
+LIVE = "live"
+STARTED = "started"
+VIOLATORS = "violators"   # Set of interview ids with a violation that day
+PASSED = "passed"
+FAILED = "failed"
+
+
+def _key(name: str, day: Optional[str] = None) -> str:
+    return f"{KEY_PREFIX}:{day}:{name}" if day else f"{KEY_PREFIX}:{name}"
+
+
+def _day(value: Optional[datetime]) -> Optional[str]:
+    """UTC calendar day of a timestamp (naive timestamps are stored as UTC)."""
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.date().isoformat()
+
+
+def _status_value(value: Any) -> Optional[str]:
+    return getattr(value, "value", value)
+
+
+def format_metrics(live: int, started: int, violators: int, passed: int, failed: int) -> Dict[str, Any]:
+    pct = (violators / float(started)) * 100.0 if started > 0 else 0.0
+    return {
+        "live": live,
+        "proctoring_activity": f"{pct:.2f}%",
+        "failed_today": failed,
+        "passed_today": passed,
+    }
+
+
+def query_dashboard_totals(session: Session, target_date: date, violator_ids: bool = False) -> Tuple[int, int, Any, int, int]:
+    """
+    (live, started, violators, passed, failed) for a UTC day using only aggregate
+    queries. `violators` is the set of interview ids when `violator_ids` is set,
+    otherwise its COUNT(DISTINCT).
+    """
+    start = datetime.combine(target_date, datetime.min.time()).replace(tzinfo=timezone.utc)
+    end = start + timedelta(days=1)
+
+    live = session.exec(
+        select(func.count()).select_from(InterviewSession).where(InterviewSession.status.in_(LIVE_STATUSES))
+    ).one()
+    started = session.exec(
+        select(func.count()).select_from(InterviewSession).where(
+            InterviewSession.start_time >= start, InterviewSession.start_time < end
+        )
+    ).one()
+    in_window = (ProctoringEvent.timestamp >= start, ProctoringEvent.timestamp < end)
+    if violator_ids:
+        violators = set(session.exec(select(distinct(ProctoringEvent.interview_id)).where(*in_window)).all())
+    else:
+        violators = session.exec(select(func.count(distinct(ProctoringEvent.interview_id))).where(*in_window)).one()
+    by_status = dict(session.exec(
+        select(func.upper(InterviewResult.result_status), func.count()).where(
+            InterviewResult.created_at >= start, InterviewResult.created_at < end
+        ).group_by(func.upper(InterviewResult.result_status))
+    ).all())
+    return live, started, violators, by_status.get("PASS", 0), by_status.get("FAIL", 0)
+
+
+class _MemoryBackend:
+    """Per-process counters, used when Redis is not configured or unreachable."""
+
+    def __init__(self):
+        self._values: Dict[str, int] = {}
+        self._sets: Dict[str, Set[int]] = {}
+        self._lock = threading.Lock()
+
+    def apply(self, increments: Dict[str, int], members: Dict[str, Set[int]]):
+        with self._lock:
+            for key, n in increments.items():
+                self._values[key] = self._values.get(key, 0) + n
+            for key, ids in members.items():
+                self._sets.setdefault(key, set()).update(ids)
+
+    def read(self, keys: Iterable[str], set_keys: Iterable[str]) -> Tuple[List[Optional[int]], List[int]]:
+        with self._lock:
+            return [self._values.get(k) for k in keys], [len(self._sets.get(k, ())) for k in set_keys]
+
+    def replace(self, values: Dict[str, int], sets: Dict[str, Set[int]]):
+        with self._lock:
+            self._values.update(values)
+            for key, ids in sets.items():
+                self._sets[key] = set(ids)
+
+    def claim(self, key: str, ttl: float) -> bool:
+        with self._lock:
+            expires_at = self._values.get(key)
+            now = int(time.monotonic())
+            if expires_at is not None and expires_at > now:
+                return False
+            self._values[key] = now + int(ttl)
+            return True
+
+
+class _RedisBackend:
+    """Counters shared by every worker process."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def apply(self, increments: Dict[str, int], members: Dict[str, Set[int]]):
+        pipe = self.client.pipeline(transaction=False)
+        for key, n in increments.items():
+            pipe.incrby(key, n)
+            if key.count(":") > 1:
+                pipe.expire(key, DAY_KEY_TTL)
+        for key, ids in members.items():
+            pipe.sadd(key, *ids)
+            pipe.expire(key, DAY_KEY_TTL)
+        pipe.execute()
+
+    def read(self, keys: Iterable[str], set_keys: Iterable[str]) -> Tuple[List[Optional[int]], List[int]]:
+        keys, set_keys = list(keys), list(set_keys)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.mget(keys)
+        for key in set_keys:
+            pipe.scard(key)
+        values, *cards = pipe.execute()
+        return [int(v) if v is not None else None for v in values], [int(c) for c in cards]
+
+    def replace(self, values: Dict[str, int], sets: Dict[str, Set[int]]):
+        pipe = self.client.pipeline(transaction=True)
+        for key, n in values.items():
+            if key.count(":") > 1:
+                pipe.set(key, n, ex=DAY_KEY_TTL)
+            else:
+                pipe.set(key, n)
+        for key, ids in sets.items():
+            pipe.delete(key)
+            if ids:
+                pipe.sadd(key, *ids)
+                pipe.expire(key, DAY_KEY_TTL)
+        pipe.execute()
+
+    def claim(self, key: str, ttl: float) -> bool:
+        # One worker per interval does the reconciliation
+        return bool(self.client.set(key, "1", nx=True, ex=max(1, int(ttl))))
+
+
+class DashboardCounters:
+    def __init__(self, redis_url: Optional[str] = REDIS_URL, reconcile_interval: float = DASHBOARD_RECONCILE_INTERVAL):
+        self.redis_url = redis_url
+        self.reconcile_interval = reconcile_interval
+        self.memory = _MemoryBackend()
+        self._redis: Optional[_RedisBackend] = None
+        self._redis_retry_at = 0.0
+        self._lock = threading.Lock()
+        self.reconciliations = 0
+
+    def _backend(self):
+        if self._redis is not None or not self.redis_url:
+            return self._redis or self.memory
+        now = time.monotonic()
+        if now < self._redis_retry_at:
+            return self.memory
+        with self._lock:
+            if self._redis is None and now >= self._redis_retry_at:
+                try:
+                    import redis
+
+                    conn_kwargs = {"decode_responses": True, "socket_connect_timeout": 2, "socket_timeout": 2}
+                    if self.redis_url.startswith("rediss://"):
+                        conn_kwargs["ssl_cert_reqs"] = "none"
+                    client = redis.Redis.from_url(self.redis_url, **conn_kwargs)
+                    client.ping()
+                    self._redis = _RedisBackend(client)
+                    logger.info("DashboardCounters: Using Redis")
+                except Exception as e:
+                    self._redis_retry_at = now + REDIS_RETRY_INTERVAL
+                    logger.warning(f"DashboardCounters: Redis unavailable ({type(e).__name__}), using in-process counters")
+        return self._redis or self.memory
+
+    def _call(self, method: str, *args):
+        backend = self._backend()
+        try:
+            return getattr(backend, method)(*args)
+        except Exception as e:
+            if backend is self.memory:
+                raise
+            logger.error(f"DashboardCounters: Redis {method} failed: {e}. Falling back to in-process counters.")
+            self._redis = None
+            self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+            return getattr(self.memory, method)(*args)
+
+    def apply(self, increments: Dict[str, int], members: Dict[str, Set[int]]):
+        increments = {k: n for k, n in increments.items() if n}
+        members = {k: ids for k, ids in members.items() if ids}
+        if increments or members:
+            self._call("apply", increments, members)
+
+    def snapshot(self, target_date: Optional[date] = None) -> Dict[str, Any]:
+        """Dashboard metrics from the counters; reconciles first if the day has never been counted."""
+        day = (target_date or datetime.now(timezone.utc).date()).isoformat()
+        keys = [_key(LIVE), _key(STARTED, day), _key(PASSED, day), _key(FAILED, day), _key("reconciled", day)]
+        values, (violators,) = self._call("read", keys, [_key(VIOLATORS, day)])
+        if values[-1] is None:
+            self.reconcile(target_date)
+            values, (violators,) = self._call("read", keys, [_key(VIOLATORS, day)])
+        live, started, passed, failed, _ = (v or 0 for v in values)
+        return format_metrics(max(live, 0), max(started, 0), violators, max(passed, 0), max(failed, 0))
+
+    def reconcile(self, target_date: Optional[date] = None, session: Optional[Session] = None) -> Dict[str, Any]:
+        """Rebuilds the live and per-day counters from the database."""
+        target_date = target_date or datetime.now(timezone.utc).date()
+        day = target_date.isoformat()
+
+        close_session = session is None
+        if session is None:
+            from ..core.database import engine
+            session = Session(engine)
+        try:
+            live, started, violators, passed, failed = query_dashboard_totals(session, target_date, violator_ids=True)
+        finally:
+            if close_session:
+                session.close()
+
+        self._call("replace", {
+            _key(LIVE): live,
+            _key(STARTED, day): started,
+            _key(PASSED, day): passed,
+            _key(FAILED, day): failed,
+            _key("reconciled", day): int(time.time()),
+        }, {_key(VIOLATORS, day): violators})
+        self.reconciliations += 1
+        return format_metrics(live, started, len(violators), passed, failed)
+
+    def reconcile_if_due(self) -> bool:
+        """Periodic reconciliation; with Redis only one worker runs it per interval."""
+        if not self._call("claim", _key("reconcile_lock"), self.reconcile_interval):
+            return False
+        self.reconcile()
+        return True
+
+
+dashboard_counters = DashboardCounters()
+
+
+# ========== ORM HOOKS ==========
+
+_PENDING_KEY = "dashboard_counter_deltas"
+
+
+def _history(obj, attr: str):
+    """(changed, old, new) for an attribute in the current flush."""
+    hist = inspect(obj).attrs[attr].history
+    if not hist.has_changes():
+        return False, None, None
+    old = hist.deleted[0] if hist.deleted else None
+    new = hist.added[0] if hist.added else None
+    return True, old, new
+
+
+def _interview_deltas(obj: InterviewSession, increments: Dict[str, int], state: str):
+    if state == "new":
+        old_status, new_status, old_start, new_start = None, obj.status, None, obj.start_time
+    elif state == "deleted":
+        old_status, new_status, old_start, new_start = obj.status, None, obj.start_time, None
+    else:
+        status_changed, old_status, new_status = _history(obj, "status")
+        start_changed, old_start, new_start = _history(obj, "start_time")
+        if not status_changed:
+            old_status = new_status = None
+        if not start_changed:
+            old_start = new_start = None
+
+    live_delta = (_status_value(new_status) in _LIVE_VALUES) - (_status_value(old_status) in _LIVE_VALUES)
+    if live_delta:
+        increments[_key(LIVE)] = increments.get(_key(LIVE), 0) + live_delta
+    for value, n in ((old_start, -1), (new_start, 1)):
+        day = _day(value)
+        if day:
+            increments[_key(STARTED, day)] = increments.get(_key(STARTED, day), 0) + n
+
+
+def _result_deltas(obj: InterviewResult, increments: Dict[str, int], state: str):
+    if state == "new":
+        old_status, new_status = None, obj.result_status
+    elif state == "deleted":
+        old_status, new_status = obj.result_status, None
+    else:
+        changed, old_status, new_status = _history(obj, "result_status")
+        if not changed:
+            return
+    day = _day(obj.created_at or datetime.now(timezone.utc))
+    for status, n in ((old_status, -1), (new_status, 1)):
+        name = {"PASS": PASSED, "FAIL": FAILED}.get((status or "").upper())
+        if name:
+            increments[_key(name, day)] = increments.get(_key(name, day), 0) + n
+
+
+def _collect_deltas(session, flush_context):
+    try:
+        increments, members = session.info.setdefault(_PENDING_KEY, ({}, {}))
+        for state, objects in (("new", session.new), ("dirty", session.dirty), ("deleted", session.deleted)):
+            for obj in objects:
+                if isinstance(obj, InterviewSession):
+                    _interview_deltas(obj, increments, state)
+                elif isinstance(obj, InterviewResult):
+                    _result_deltas(obj, increments, state)
+                elif isinstance(obj, ProctoringEvent) and state == "new" and obj.interview_id is not None:
+                    key = _key(VIOLATORS, _day(obj.timestamp or datetime.now(timezone.utc)))
+                    members.setdefault(key, set()).add(obj.interview_id)
+    except Exception as e:
+        logger.error(f"DashboardCounters: Failed to collect deltas: {e}")
+
+
+def _apply_deltas(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        try:
+            dashboard_counters.apply(*pending)
+        except Exception as e:
+            logger.error(f"DashboardCounters: Failed to apply deltas: {e}")
+
+
+def _discard_deltas(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _load_old_value(target, value, oldvalue, initiator):
+    return value
+
+
+event.listen(OrmSession, "after_flush", _collect_deltas)
+event.listen(OrmSession, "after_commit", _apply_deltas)
+event.listen(OrmSession, "after_rollback", _discard_deltas)
+# Make attribute history carry the previous value even when it was expired, so
+# transitions can always be counted in both directions
+for _attr in (InterviewSession.status, InterviewSession.start_time, InterviewResult.result_status):
+    event.listen(_attr, "set", _load_old_value, active_history=True, retval=True)
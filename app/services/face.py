@@ -2,15 +2,21 @@ import time
 import multiprocessing
 import os
 import threading
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from ..core.config import IS_ORCHESTRATOR
 from ..utils.image_processing import convert_to_rgb, resize_with_aspect_ratio
+from ..utils.embedding_codec import decode_embeddings
 from ..core.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-from ..core.config import IS_ORCHESTRATOR, USE_MODAL
+from ..core.config import IS_ORCHESTRATOR, USE_MODAL, FACE_TRACK_IOU, FACE_VERIFIED_TTL, FACE_UNVERIFIED_TTL
+
+FRAME_QUEUE_SIZE = 10
+TRACKER_IDLE_TTL = 600  # Seconds of inactivity before a session's tracker is dropped in the worker
+REMOTE_RECOGNITION_INTERVAL = 30  # Orchestrator mode: frames between remote recognitions per session
+MAX_INFLIGHT_RECOGNITIONS = 4     # Orchestrator mode: concurrent remote calls across all sessions
 
 # Lazy import Modal DeepFace
 _modal_get_embedding = None
@@ -91,11 +97,189 @@ class MediaPipeDetector:
         return locs
 
 
+MATCH_THRESHOLD = 0.40  # Cosine similarity; generally safe for both ArcFace and SFace
+
+
+class ReferenceEmbeddings:
+    """
+    A candidate's known embeddings, parsed once into pre-normalised float32 vectors
+    keyed by model name ("ArcFace", "SFace").
+    """
+    __slots__ = ("vectors",)
+
+    def __init__(self, vectors: Dict[str, Any]):
+        self.vectors = vectors
+
+    @classmethod
+    def from_encoding(cls, encoding: Any) -> Optional["ReferenceEmbeddings"]:
+        """
+        Accepts the stored binary blob, legacy JSON text, a {model: vector} map
+        or a legacy single ArcFace vector.
+        """
+        if encoding is None:
+            return None
+        if isinstance(encoding, ReferenceEmbeddings):
+            return encoding
+
+        if isinstance(encoding, dict):
+            data = encoding
+        elif isinstance(encoding, list):
+            # Legacy: single ArcFace vector
+            data = {"ArcFace": encoding}
+        else:
+            data = decode_embeddings(encoding)
+        if data is None:
+            return None
+
+        import numpy as np
+        vectors = {}
+        for model, vec in data.items():
+            try:
+                arr = np.asarray(vec, dtype=np.float32).reshape(-1)
+            except (TypeError, ValueError):
+                continue
+            norm = float(np.linalg.norm(arr))
+            if arr.size and norm > 0:
+                vectors[model] = arr / norm
+        return cls(vectors)
+
+    def get(self, model: str) -> Optional[Any]:
+        return self.vectors.get(model)
+
+
+def cosine_matches(reference: Any, embeddings: List[Any], threshold: float = MATCH_THRESHOLD) -> List[bool]:
+    """
+    Compares every embedding against a pre-normalised reference vector with one
+    matrix-vector product. Embeddings of the wrong dimension never match.
+    """
+    if not embeddings:
+        return []
+    import numpy as np
+    dim = reference.shape[0]
+    valid = [i for i, e in enumerate(embeddings) if len(e) == dim]
+    matches = [False] * len(embeddings)
+    if not valid:
+        return matches
+
+    mat = np.asarray([embeddings[i] for i in valid], dtype=np.float32)
+    norms = np.linalg.norm(mat, axis=1)
+    norms[norms == 0] = 1.0
+    sims = (mat @ reference) / norms
+    for i, sim in zip(valid, sims):
+        matches[i] = bool(sim > threshold)
+    return matches
+
+
+def box_iou(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> float:
+    """Intersection-over-union of two (top, right, bottom, left) boxes."""
+    t, r = max(a[0], b[0]), min(a[1], b[1])
+    bt, l = min(a[2], b[2]), max(a[3], b[3])
+    inter = max(0, r - l) * max(0, bt - t)
+    if inter == 0:
+        return 0.0
+    area_a = (a[1] - a[3]) * (a[2] - a[0])
+    area_b = (b[1] - b[3]) * (b[2] - b[0])
+    return inter / float(area_a + area_b - inter)
+
+
+class FaceTrack:
+    """A face box carried across frames with its last recognition verdict."""
+    __slots__ = ("box", "matched", "verified_at")
+
+    def __init__(self, box: Tuple[int, int, int, int], matched: bool, verified_at: float):
+        self.box = box
+        self.matched = matched
+        self.verified_at = verified_at
+
+
+class FaceTracker:
+    """
+    Per-session IoU tracker that lets the recognizer skip embeddings.
+
+    Each detected box is greedily associated with the previous frame's box it
+    overlaps most. A box reuses its track's verdict while the track is fresh;
+    embeddings are only computed for new faces, boxes that jumped (IoU below
+    threshold) and tracks whose TTL expired. Verified identities are trusted
+    for `verified_ttl`, unknown faces are re-checked after `unverified_ttl`.
+    """
+
+    def __init__(
+        self,
+        iou_threshold: float = FACE_TRACK_IOU,
+        verified_ttl: float = FACE_VERIFIED_TTL,
+        unverified_ttl: float = FACE_UNVERIFIED_TTL,
+    ):
+        self.iou_threshold = iou_threshold
+        self.verified_ttl = verified_ttl
+        self.unverified_ttl = unverified_ttl
+        self.tracks: List[FaceTrack] = []
+        self.last_seen = 0.0
+        self.embedded = 0
+        self.reused = 0
+
+    def reset(self):
+        self.tracks = []
+
+    def resolve(
+        self,
+        locs: List[Tuple[int, int, int, int]],
+        recognize: Callable[[List[Tuple[int, int, int, int]]], List[bool]],
+        now: Optional[float] = None,
+    ) -> List[bool]:
+        """
+        Returns a match verdict per box in `locs`, calling `recognize` only for
+        the boxes that need a fresh embedding.
+        """
+        now = time.time() if now is None else now
+        self.last_seen = now
+
+        assigned = self._associate(locs)
+        pending = [
+            i for i, track in enumerate(assigned)
+            if track is None or now - track.verified_at > (self.verified_ttl if track.matched else self.unverified_ttl)
+        ]
+        fresh = dict(zip(pending, recognize([locs[i] for i in pending]))) if pending else {}
+        self.embedded += len(pending)
+        self.reused += len(locs) - len(pending)
+
+        verdicts = []
+        tracks = []
+        for i, box in enumerate(locs):
+            if i in fresh:
+                matched, verified_at = bool(fresh[i]), now
+            else:
+                matched, verified_at = assigned[i].matched, assigned[i].verified_at
+            verdicts.append(matched)
+            tracks.append(FaceTrack(box, matched, verified_at))
+        self.tracks = tracks
+        return verdicts
+
+    def _associate(self, locs: List[Tuple[int, int, int, int]]) -> List[Optional[FaceTrack]]:
+        # Greedy one-to-one assignment by descending IoU (a handful of faces at most)
+        pairs = []
+        for i, box in enumerate(locs):
+            for j, track in enumerate(self.tracks):
+                iou = box_iou(box, track.box)
+                if iou >= self.iou_threshold:
+                    pairs.append((iou, i, j))
+        pairs.sort(reverse=True)
+
+        assigned: List[Optional[FaceTrack]] = [None] * len(locs)
+        used = set()
+        for _, i, j in pairs:
+            if assigned[i] is None and j not in used:
+                assigned[i] = self.tracks[j]
+                used.add(j)
+        return assigned
+
+
 class FaceRecognizer:
     """
     Handles face recognition using DeepFace.
     """
     def __init__(self, known_encoding=None):
+        self._known_raw = None
+        self._references: Optional[ReferenceEmbeddings] = None
         self.known_encoding = known_encoding
         # Default local/fallback model is SFace (lightweight: 35MB)
         self.model_name = "SFace"
@@ -135,137 +319,124 @@ class FaceRecognizer:
         except Exception as e:
             logger.warning(f"Local {self.model_name} model build failed (will try lazy load on first attempt): {e}")
 
+    @property
+    def known_encoding(self):
+        return self._references
+
+    @known_encoding.setter
+    def known_encoding(self, value):
+        # Re-parse only when a different encoding object is assigned
+        if value is self._known_raw:
+            return
+        self._known_raw = value
+        self._references = ReferenceEmbeddings.from_encoding(value)
+
+    def _embed(self, face) -> Tuple[Optional[List[float]], Optional[str]]:
+        """Returns (embedding, model_name) for a face crop, or (None, None) on failure."""
+        # 1. Try Modal (High Accuracy: ArcFace) if enabled
+        if USE_MODAL:
+            modal_cls = get_modal_embedding()
+            if modal_cls:
+                try:
+                    # Convert face crop to bytes
+                    import cv2
+                    _, img_encoded = cv2.imencode('.jpg', cv2.cvtColor(face, cv2.COLOR_RGB2BGR))
+                    # Modal app is configured for ArcFace (default)
+                    result = modal_cls().get_embedding.remote(img_encoded.tobytes())
+                    if result.get("success"):
+                        return result["embedding"], "ArcFace"
+                    logger.warning(f"Modal DeepFace returned error: {result.get('error')}")
+                except Exception as e:
+                    # Catch Modal specific errors (like credits exhausted or connection issues)
+                    logger.warning(f"Modal Face Recognition call failed (likely credits or connection): {e}")
+
+        # 2. Local fallback (Lightweight: SFace) if Modal fails or is disabled
+        # If we are in Orchestrator mode, DeepFace import might fail (not in requirements)
+        try:
+            from deepface import DeepFace
+            objs = DeepFace.represent(
+                img_path=face, 
+                model_name=self.model_name, # Uses SFace
+                enforce_detection=False, 
+                detector_backend="skip",
+                align=False
+            )
+            logger.debug(f"Local {self.model_name} embedding successful.")
+            return objs[0]["embedding"], self.model_name
+        except ImportError:
+            if IS_ORCHESTRATOR:
+                logger.error("Face Recognition Fail: Modal failed and Local models (DeepFace) are NOT installed in Orchestrator mode.")
+            else:
+                logger.error("Face Recognition Fail: Local DeepFace import failed.")
+        except Exception as e:
+            logger.warning(f"Local {self.model_name} fallback failed: {e}")
+        return None, None
+
     def recognize(self, img_rgb, locs):
         """
         Returns list of booleans indicating matches for each face location.
         Uses Modal (ArcFace) for high accuracy, or Local (SFace) for fallback.
+        Embeddings are grouped by model and matched in a single vectorised op.
         """
-        matches = []
-        if self.known_encoding is None: 
+        references = self._references
+        if references is None:
             return [False] * len(locs)
 
-        # known_encoding can be a JSON string of a map or a single list (legacy)
-        embedding_map = {}
-        if isinstance(self.known_encoding, str):
-            import json
-            try:
-                data = json.loads(self.known_encoding)
-                if isinstance(data, dict):
-                    embedding_map = data
-                else:
-                    # Legacy: single ArcFace vector
-                    embedding_map = {"ArcFace": data}
-            except:
-                return [False] * len(locs)
-        elif isinstance(self.known_encoding, dict):
-            embedding_map = self.known_encoding
-        else:
-            # Fallback for unexpected formats
-            return [False] * len(locs)
+        matches = [False] * len(locs)
+        by_model: Dict[str, Tuple[List[int], List[Any]]] = {}
+        h, w = img_rgb.shape[:2]
 
-        for (t, r, b, l) in locs:
+        for idx, (t, r, b, l) in enumerate(locs):
             # Padding check
-            h, w = img_rgb.shape[:2]
-            if t < 0 or l < 0 or b > h or r > w: continue
-            
+            if t < 0 or l < 0 or b > h or r > w:
+                continue
             face = img_rgb[t:b, l:r]
-            if face.size == 0: 
-                matches.append(False)
+            if face.size == 0:
                 continue
-            
             try:
-                curr_emb = None
-                
-                # 1. Try Modal (High Accuracy: ArcFace) if enabled
-                if USE_MODAL:
-                    modal_cls = get_modal_embedding()
-                    if modal_cls:
-                        try:
-                            # Convert face crop to bytes
-                            import cv2
-                            _, img_encoded = cv2.imencode('.jpg', cv2.cvtColor(face, cv2.COLOR_RGB2BGR))
-                            # Modal app is configured for ArcFace (default)
-                            result = modal_cls().get_embedding.remote(img_encoded.tobytes())
-                            if result.get("success"):
-                                curr_emb = result["embedding"]
-                            else:
-                                logger.warning(f"Modal DeepFace returned error: {result.get('error')}")
-                        except Exception as e:
-                            # Catch Modal specific errors (like credits exhausted or connection issues)
-                            logger.warning(f"Modal Face Recognition call failed (likely credits or connection): {e}")
-                
-                # 2. Local fallback (Lightweight: SFace) if Modal fails or is disabled
-                if curr_emb is None:
-                    # If we are in Orchestrator mode, DeepFace import might fail (not in requirements)
-                    try:
-                        from deepface import DeepFace
-                        objs = DeepFace.represent(
-                            img_path=face, 
-                            model_name=self.model_name, # Uses SFace
-                            enforce_detection=False, 
-                            detector_backend="skip",
-                            align=False
-                        )
-                        curr_emb = objs[0]["embedding"]
-                        logger.info(f"Local {self.model_name} fallback successful.")
-                    except ImportError:
-                        if IS_ORCHESTRATOR:
-                            logger.error("Face Recognition Fail: Modal failed and Local models (DeepFace) are NOT installed in Orchestrator mode.")
-                        else:
-                            logger.error("Face Recognition Fail: Local DeepFace import failed.")
-                    except Exception as e:
-                        logger.warning(f"Local {self.model_name} fallback failed: {e}")
-
-
-                
-                if curr_emb is None:
-                    matches.append(False)
-                    continue
-
-                # Cosine Similarity check against the correct model's known encoding
-                target_model = "ArcFace" if USE_MODAL and modal_cls and curr_emb is not None else self.model_name
-                known_vec = embedding_map.get(target_model)
-
-                if known_vec is None:
-                    logger.warning(f"No known encoding found for model: {target_model}")
-                    matches.append(False)
-                    continue
-
-                import numpy as np
-                a = np.array(known_vec)
-                b = np.array(curr_emb)
-                
-                if a.shape != b.shape:
-                    logger.error(f"Dimension mismatch: {target_model} known({a.shape}) vs current({b.shape})")
-                    matches.append(False)
-                    continue
-
-                cos_sim = np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
-                
-                # Threshold: 0.40 is generally safe for both ArcFace and SFace
-                # but SFace is more compact, sometimes more strict.
-                matches.append(bool(cos_sim > 0.40))
-
-                
+                emb, model = self._embed(face)
             except Exception as e:
                 logger.debug(f"Face recognition error: {e}")
-                matches.append(False)
-        
+                continue
+            if emb is None:
+                continue
+            indices, embs = by_model.setdefault(model, ([], []))
+            indices.append(idx)
+            embs.append(emb)
+
+        for model, (indices, embs) in by_model.items():
+            reference = references.get(model)
+            if reference is None:
+                logger.warning(f"No known encoding found for model: {model}")
+                continue
+            for emb in embs:
+                if len(emb) != reference.shape[0]:
+                    logger.error(f"Dimension mismatch: {model} known({reference.shape}) vs current({len(emb)})")
+            for idx, ok in zip(indices, cosine_matches(reference, embs)):
+                matches[idx] = ok
+
         return matches
 
 
 
-def face_worker_process(frame_queue, result_queue):
+def face_worker_process(frame_queue, result_queue, frame_ring_spec=None):
     """Worker process logic: Processes frames for multiple sessions."""
     from ..core.logger import setup_logging
+    from .frame_buffer import FrameRef, SharedFrameRing
     setup_logging()
     worker_logger = get_logger("face_worker")
 
     detector = MediaPipeDetector()
     recognizer = FaceRecognizer() # No global encoding
+
+    # Frames arrive as FrameRef descriptors into shared memory when a ring is configured
+    frame_ring = SharedFrameRing.attach(*frame_ring_spec) if frame_ring_spec else None
     
-    # Cache for embeddings: {interview_id: encoding_ndarray}
+    # Cache for embeddings: {interview_id: ReferenceEmbeddings}
     embedding_cache = {}
+    # Box trackers so stable, already-verified faces are not re-embedded: {interview_id: FaceTracker}
+    trackers: Dict[int, FaceTracker] = {}
+    last_eviction = time.time()
 
     while True:
         try:
@@ -279,40 +450,67 @@ def face_worker_process(frame_queue, result_queue):
         interview_id, frame_bgr, encoding_json = item
 
         try:
-            # Sync session encoding if provided
+            ref_scale = 1.0
+            frame_ref = None
+            if isinstance(frame_bgr, FrameRef):
+                frame_ref = frame_bgr
+                ref_scale = frame_ref.scale
+                frame_bgr = frame_ring.read(frame_ref) if frame_ring else None
+                if frame_bgr is None:
+                    continue # Slot already overwritten by a newer frame
+
+            # Sync session encoding if provided (parsed + normalised once per session)
             if encoding_json and interview_id not in embedding_cache:
-                import json
-                try:
-                    data = json.loads(encoding_json)
-                    # We store it as is (dict or list) and let recognizer handle it
-                    embedding_cache[interview_id] = data
-                except Exception as e:
-                    worker_logger.error(f"Failed to parse encoding for Session {interview_id}: {e}")
+                references = ReferenceEmbeddings.from_encoding(encoding_json)
+                if references is not None:
+                    embedding_cache[interview_id] = references
+                    if interview_id in trackers:
+                        trackers[interview_id].reset() # Verdicts were made against a different identity
+                else:
+                    worker_logger.error(f"Failed to parse encoding for Session {interview_id}")
             
             recognizer.known_encoding = embedding_cache.get(interview_id)
             
             import cv2
             frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+            if frame_ref is not None and not frame_ring.is_current(frame_ref):
+                continue # Writer reused the slot while we were copying out
             h, w = frame_rgb.shape[:2]
-            target_h = 540
+            target_h = 360
             s = target_h / h if h > target_h else 1.0
             img = cv2.resize(frame_rgb, (0,0), fx=s, fy=s) if s < 1.0 else frame_rgb
 
             
             locs = detector.detect(img)
-            matches = recognizer.recognize(img, locs)
+            tracker = trackers.get(interview_id)
+            if tracker is None:
+                tracker = trackers[interview_id] = FaceTracker()
+            # Boxes are tracked in the analysis frame's coordinates (constant scale per session)
+            matches = tracker.resolve(locs, lambda pending: recognizer.recognize(img, pending))
             is_authorized = any(matches) if matches else False
-            final_locs = [(int(t/s), int(r/s), int(b/s), int(l/s)) for (t,r,b,l) in locs]
+            # Map boxes back to the caller's original frame coordinates
+            k = s * ref_scale
+            final_locs = [(int(t/k), int(r/k), int(b/k), int(l/k)) for (t,r,b,l) in locs]
 
             if not result_queue.full():
                 result_queue.put((interview_id, is_authorized, 1.0, len(final_locs), final_locs))
+
+            now = time.time()
+            if now - last_eviction > 60:
+                stale_ids = [sid for sid, t in trackers.items() if now - t.last_seen > TRACKER_IDLE_TTL]
+                for sid in stale_ids:
+                    trackers.pop(sid, None)
+                    embedding_cache.pop(sid, None)
+                if stale_ids:
+                    worker_logger.info(f"FaceWorker: Evicted {len(stale_ids)} idle session tracker(s)")
+                last_eviction = now
         except Exception as e:
             worker_logger.error(f"Face Worker Error [Session {interview_id}]: {e}")
 
 
 class FaceService:
     """The main interface for face-related services (Multi-User Isolated)."""
-    def __init__(self):
+    def __init__(self, frame_ring_spec=None):
         # Session Isolation: {interview_id: value}
         self.session_results = {}
         self.session_encodings = {}
@@ -323,15 +521,23 @@ class FaceService:
             self.worker = None
             self.frame_queue = None
             self.result_queue = None
-            # Initialize an in-thread recognizer (lazy)
-            self._lazy_recognizer = None
+            # Remote (Modal) recognition runs off the request path with a bounded number of
+            # in-flight calls; callers always get the last cached verdict immediately.
+            from concurrent.futures import ThreadPoolExecutor
+            self._recognition_pool = ThreadPoolExecutor(
+                max_workers=MAX_INFLIGHT_RECOGNITIONS, thread_name_prefix="face-recognition"
+            )
+            self._recognition_lock = threading.Lock()
+            self._inflight: Dict[int, Any] = {}          # {interview_id: Future}
+            self._frame_counts: Dict[int, int] = {}
+            self._recognizers: Dict[int, FaceRecognizer] = {}
             return
 
-        self.frame_queue = multiprocessing.Queue(maxsize=10)
-        self.result_queue = multiprocessing.Queue(maxsize=10)
+        self.frame_queue = multiprocessing.Queue(maxsize=FRAME_QUEUE_SIZE)
+        self.result_queue = multiprocessing.Queue(maxsize=FRAME_QUEUE_SIZE)
         self.worker = multiprocessing.Process(
             target=face_worker_process, 
-            args=(self.frame_queue, self.result_queue)
+            args=(self.frame_queue, self.result_queue, frame_ring_spec)
         )
         self.worker.daemon = True
         self.worker.start()
@@ -340,47 +546,30 @@ class FaceService:
         self.session_results = {}
         self.session_encodings = {}
 
-    def process_frame(self, frame_bgr, interview_id: int):
+    def process_frame(self, frame_bgr, interview_id: int, frame_ref=None):
         # 1. Update session encoding
         encoding = self.session_encodings.get(interview_id)
 
-        # --- ORCHESTRATOR PATH: In-thread (Modal only) ---
+        # --- ORCHESTRATOR PATH: Async remote recognition (Modal only) ---
         if IS_ORCHESTRATOR:
-            # Throttle processing to save memory/cpu: Only process 1 in 10 frames
-            # In orchestrator mode, we primarily serve as a pass-through
-            # unless a Modal call is strictly needed.
-            # For now, we'll return the cached result to avoid blocking the main thread too long.
-            if not hasattr(self, "_process_counter"): self._process_counter = 0
-            self._process_counter += 1
-            
-            if self._process_counter % 30 == 0: # Every ~30 frames (approx 3-5 seconds)
-                if self._lazy_recognizer is None:
-                    self._lazy_recognizer = FaceRecognizer(known_encoding=encoding)
-                else:
-                    self._lazy_recognizer.known_encoding = encoding
-
-                # Run detection & recognition in-thread (since it's mostly Modal await)
-                import cv2
-                from ..utils.image_processing import resize_with_aspect_ratio
-                img_small, _ = resize_with_aspect_ratio(frame_bgr, target_height=240)
-                # Note: No local detector in orchestrator mode, we just use a full-frame fake loc for now
-                # or we can just send the crop if we had a light detector.
-                # Since MediaPipe is removed from requirements-render, we skip local detection.
-                
-                # If Modal is enabled, recognizer.recognize will call it.
-                # If not, it returns False.
-                h, w = img_small.shape[:2]
-                matches = self._lazy_recognizer.recognize(img_small, [(0, w, h, 0)])
-                is_authorized = any(matches) if matches else False
-                self.session_results[interview_id] = (is_authorized, 1.0, 1 if matches else 0, [(0, w, h, 0)])
+            # Recognise on the first frame and then every REMOTE_RECOGNITION_INTERVAL frames.
+            # The network round-trip happens in the recognition pool, never on the caller's thread.
+            count = self._frame_counts.get(interview_id, 0) + 1
+            self._frame_counts[interview_id] = count
+            if count % REMOTE_RECOGNITION_INTERVAL == 1:
+                self._submit_recognition(frame_bgr, interview_id, encoding)
 
             return self.session_results.get(interview_id, (False, 1.0, 0, []))
 
         # --- STANDARD PATH: Worker Process ---
         if not self.frame_queue.full():
-            from ..utils.image_processing import resize_with_aspect_ratio
-            img_small, _ = resize_with_aspect_ratio(frame_bgr, target_height=360)
-            self.frame_queue.put((interview_id, img_small, encoding))
+            if frame_ref is not None:
+                # Shared-memory path: only the slot descriptor crosses the process boundary
+                self.frame_queue.put((interview_id, frame_ref, encoding))
+            else:
+                from ..utils.image_processing import resize_with_aspect_ratio
+                img_small, _ = resize_with_aspect_ratio(frame_bgr, target_height=360)
+                self.frame_queue.put((interview_id, img_small, encoding))
         
         # Drain results and update map
         while not self.result_queue.empty():
@@ -392,11 +581,82 @@ class FaceService:
         
         return self.session_results.get(interview_id, (False, 1.0, 0, []))
 
+    def _submit_recognition(self, frame_bgr, interview_id: int, encoding) -> bool:
+        """Schedules a remote recognition unless one is already running for the session or the pool is saturated."""
+        with self._recognition_lock:
+            if interview_id in self._inflight or len(self._inflight) >= MAX_INFLIGHT_RECOGNITIONS:
+                return False
+            recognizer = self._recognizers.get(interview_id)
+            if recognizer is None:
+                recognizer = self._recognizers[interview_id] = FaceRecognizer(known_encoding=encoding)
+            else:
+                recognizer.known_encoding = encoding
+
+            # Own a copy of the pixels: the caller may reuse or annotate the frame buffer
+            img_small, _ = resize_with_aspect_ratio(frame_bgr, target_height=240)
+            if img_small is frame_bgr:
+                img_small = frame_bgr.copy()
+
+            future = self._recognition_pool.submit(self._recognize_remote, recognizer, img_small)
+            self._inflight[interview_id] = future
+        future.add_done_callback(lambda f: self._on_recognition_done(interview_id, f))
+        return True
+
+    @staticmethod
+    def _recognize_remote(recognizer: FaceRecognizer, img_bgr):
+        # No local detector in orchestrator mode (MediaPipe is not installed), so the
+        # whole downscaled frame is sent as a single face crop.
+        img_rgb = convert_to_rgb(img_bgr)
+        h, w = img_rgb.shape[:2]
+        loc = (0, w, h, 0)
+        matches = recognizer.recognize(img_rgb, [loc])
+        return (any(matches), 1.0, 1 if matches else 0, [loc])
+
+    def _on_recognition_done(self, interview_id: int, future):
+        with self._recognition_lock:
+            self._inflight.pop(interview_id, None)
+            if interview_id not in self._frame_counts:
+                return # Session was cleared while the call was in flight
+        try:
+            self.session_results[interview_id] = future.result()
+        except Exception as e:
+            logger.warning(f"FaceService: Remote recognition failed for Session {interview_id}: {e}")
+
+    def clear_session(self, interview_id: int):
+        """Drops cached results and recognition state for a finished session."""
+        self.session_results.pop(interview_id, None)
+        self.session_encodings.pop(interview_id, None)
+        if IS_ORCHESTRATOR:
+            with self._recognition_lock:
+                self._frame_counts.pop(interview_id, None)
+                self._recognizers.pop(interview_id, None)
+
+    def accepts_frame(self) -> bool:
+        """Whether process_frame would enqueue a frame for the worker now (False means it would be dropped)."""
+        if IS_ORCHESTRATOR or self.frame_queue is None:
+            return False
+        try:
+            return not self.frame_queue.full()
+        except Exception:
+            return True
+
+    def backlog(self) -> float:
+        """Fill ratio of the worker frame queue in [0, 1] (0 when unknown)."""
+        if self.frame_queue is None:
+            return 0.0
+        try:
+            return self.frame_queue.qsize() / FRAME_QUEUE_SIZE
+        except NotImplementedError: # macOS has no sem_getvalue
+            return 0.0
+
     def register_session_identity(self, interview_id: int, encoding_json: str):
         """Pre-cache the candidate encoding for a session."""
         self.session_encodings[interview_id] = encoding_json
 
     def close(self):
+        if IS_ORCHESTRATOR:
+            self._recognition_pool.shutdown(wait=False)
+            return
         try:
             self.frame_queue.put(None)
             self.worker.join(timeout=5)
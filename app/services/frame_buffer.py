@@ -0,0 +1,131 @@
+"""
+Shared-memory frame transport between the API process and the vision workers.
+
+The API process writes each decoded frame once into a fixed-size ring of slots
+backed by `multiprocessing.shared_memory`. Face and gaze workers receive only a
+small `FrameRef` descriptor through their queues and read the pixels by slot
+index, so frames are never pickled and never copied once per detector.
+
+Each slot carries a sequence number. A reader checks it before and after using
+the pixels; if the writer has wrapped around and reused the slot in between,
+the frame is treated as stale and skipped.
+"""
+
+import threading
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Optional, Tuple
+
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_SLOTS = 12         # > worker FRAME_QUEUE_SIZE (10): queued refs are not overwritten before they are read
+DEFAULT_MAX_HEIGHT = 540   # Matches the face worker's analysis resolution cap
+DEFAULT_MAX_WIDTH = 960
+CHANNELS = 3
+_SEQ_BYTES = 8             # uint64 sequence number per slot
+
+
+@dataclass(frozen=True)
+class FrameRef:
+    """Descriptor sent through worker queues in place of the frame itself."""
+    slot: int
+    seq: int
+    height: int
+    width: int
+    scale: float = 1.0     # Shared frame size relative to the original frame
+
+
+class SharedFrameRing:
+    """Fixed-slot ring buffer of BGR frames in shared memory (single writer, many readers)."""
+
+    def __init__(
+        self,
+        slots: int = DEFAULT_SLOTS,
+        max_height: int = DEFAULT_MAX_HEIGHT,
+        max_width: int = DEFAULT_MAX_WIDTH,
+        name: Optional[str] = None,
+        create: bool = True,
+    ):
+        import numpy as np
+
+        self.slots = slots
+        self.max_height = max_height
+        self.max_width = max_width
+        self.slot_bytes = max_height * max_width * CHANNELS
+        self._owner = create
+
+        header_bytes = slots * _SEQ_BYTES
+        size = header_bytes + slots * self.slot_bytes
+        if create:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+
+        self._seqs = np.ndarray((slots,), dtype=np.uint64, buffer=self.shm.buf[:header_bytes])
+        self._data = np.ndarray(
+            (slots, self.slot_bytes), dtype=np.uint8, buffer=self.shm.buf[header_bytes:size]
+        )
+        if create:
+            self._seqs[:] = 0
+
+        self._next_slot = 0
+        self._next_seq = 1
+        self._write_lock = threading.Lock()
+
+    @property
+    def spec(self) -> Tuple[str, int, int, int]:
+        """Picklable arguments for `SharedFrameRing.attach` in a worker process."""
+        return (self.shm.name, self.slots, self.max_height, self.max_width)
+
+    @classmethod
+    def attach(cls, name: str, slots: int, max_height: int, max_width: int) -> "SharedFrameRing":
+        return cls(slots=slots, max_height=max_height, max_width=max_width, name=name, create=False)
+
+    def write(self, frame_bgr: Any, scale: float = 1.0) -> Optional[FrameRef]:
+        """
+        Copies a frame into the next slot and returns its descriptor.
+        Returns None if the frame does not fit, so callers can fall back to queue transport.
+        """
+        h, w = frame_bgr.shape[:2]
+        if h > self.max_height or w > self.max_width or frame_bgr.ndim != 3 or frame_bgr.shape[2] != CHANNELS:
+            return None
+
+        n_bytes = h * w * CHANNELS
+        with self._write_lock:
+            slot = self._next_slot
+            seq = self._next_seq
+            self._next_slot = (slot + 1) % self.slots
+            self._next_seq += 1
+
+            # Seq 0 marks the slot as "being written" for concurrent readers
+            self._seqs[slot] = 0
+            self._data[slot, :n_bytes] = frame_bgr.reshape(-1)
+            self._seqs[slot] = seq
+
+        return FrameRef(slot=slot, seq=seq, height=h, width=w, scale=scale)
+
+    def read(self, ref: FrameRef) -> Optional[Any]:
+        """
+        Returns a zero-copy view of the referenced frame, or None if the slot was reused.
+        Callers must confirm `is_current(ref)` after consuming the view.
+        """
+        if not self.is_current(ref):
+            return None
+        n_bytes = ref.height * ref.width * CHANNELS
+        return self._data[ref.slot, :n_bytes].reshape(ref.height, ref.width, CHANNELS)
+
+    def is_current(self, ref: FrameRef) -> bool:
+        return int(self._seqs[ref.slot]) == ref.seq
+
+    def close(self):
+        # Views must be released before the mapping can be closed
+        self._seqs = None
+        self._data = None
+        try:
+            self.shm.close()
+            if self._owner:
+                self.shm.unlink()
+        except Exception as e:
+            logger.warning(f"SharedFrameRing: Error releasing shared memory: {e}")
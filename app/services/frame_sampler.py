@@ -0,0 +1,133 @@
+"""
+Adaptive frame sampling for proctoring.
+
+Clients push frames as fast as they can, but the detectors only need a few
+analysed frames per second. The sampler decides, per session, whether an
+incoming frame should be analysed or skipped based on:
+
+- violation state: sample faster while a warning is active, slower when stable
+- worker backlog: back off proportionally when detector queues are filling up
+- a node-wide budget of analysed frames/sec shared by all active sessions
+
+Skipped frames are counted so degradation under load is visible in metrics.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from ..core.config import (
+    PROCTORING_STABLE_FPS,
+    PROCTORING_SUSPICIOUS_FPS,
+    PROCTORING_GLOBAL_FPS_BUDGET,
+)
+
+ACTIVE_WINDOW = 5.0   # Seconds since last frame for a session to count towards the budget share
+
+
+class SessionSampling:
+    """Per-session sampling state and counters."""
+    __slots__ = ("last_analyzed", "last_seen", "suspicious", "analyzed", "dropped")
+
+    def __init__(self):
+        self.last_analyzed: float = float("-inf")
+        self.last_seen: float = 0.0
+        self.suspicious: bool = False
+        self.analyzed: int = 0
+        self.dropped: int = 0
+
+
+class AdaptiveFrameSampler:
+    def __init__(
+        self,
+        stable_fps: float = PROCTORING_STABLE_FPS,
+        suspicious_fps: float = PROCTORING_SUSPICIOUS_FPS,
+        global_budget_fps: float = PROCTORING_GLOBAL_FPS_BUDGET,
+    ):
+        self.stable_fps = stable_fps
+        self.suspicious_fps = suspicious_fps
+        self.global_budget_fps = global_budget_fps
+
+        self._sessions: Dict[int, SessionSampling] = {}
+        self._lock = threading.Lock()
+        self._active_count = 0
+        self._active_counted_at = 0.0
+
+    def target_fps(self, interview_id: int, backlog: float = 0.0, now: Optional[float] = None) -> float:
+        """Analysis rate currently allowed for a session."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            state = self._sessions.get(interview_id)
+            return self._target_fps(state, backlog, now)
+
+    def should_analyze(self, interview_id: int, backlog: float = 0.0, now: Optional[float] = None) -> bool:
+        """
+        Returns True if this frame should go through the detectors.
+        `backlog` is the detector queue fill ratio in [0, 1].
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            state = self._sessions.get(interview_id)
+            if state is None:
+                state = self._sessions[interview_id] = SessionSampling()
+            state.last_seen = now
+
+            fps = self._target_fps(state, backlog, now)
+            if fps > 0 and now - state.last_analyzed >= 1.0 / fps:
+                state.last_analyzed = now
+                state.analyzed += 1
+                return True
+
+            state.dropped += 1
+            return False
+
+    def record_result(self, interview_id: int, warning: str):
+        """Feeds the latest analysis verdict back so suspicious sessions are sampled faster."""
+        with self._lock:
+            state = self._sessions.get(interview_id)
+            if state is not None:
+                state.suspicious = bool(warning)
+
+    def forget(self, interview_id: int):
+        with self._lock:
+            self._sessions.pop(interview_id, None)
+
+    def session_stats(self, interview_id: int) -> Dict[str, int]:
+        with self._lock:
+            state = self._sessions.get(interview_id)
+            if state is None:
+                return {"analyzed": 0, "dropped": 0}
+            return {"analyzed": state.analyzed, "dropped": state.dropped}
+
+    def metrics(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "active_sessions": self._active_count,
+                "analyzed": sum(s.analyzed for s in self._sessions.values()),
+                "dropped": sum(s.dropped for s in self._sessions.values()),
+                "global_budget_fps": self.global_budget_fps,
+            }
+
+    # --- internals (caller holds self._lock) ---
+
+    def _target_fps(self, state: Optional[SessionSampling], backlog: float, now: float) -> float:
+        fps = self.suspicious_fps if state is not None and state.suspicious else self.stable_fps
+
+        # Back off linearly once detector queues are more than half full
+        backlog = min(max(backlog, 0.0), 1.0)
+        if backlog > 0.5:
+            fps *= max(0.1, 2.0 * (1.0 - backlog))
+
+        # Fair share of the node-wide budget
+        share = self.global_budget_fps / max(1, self._active_sessions(now))
+        return min(fps, share)
+
+    def _active_sessions(self, now: float) -> int:
+        # Recount at most once per second to keep the hot path O(1)
+        if now - self._active_counted_at >= 1.0:
+            self._active_count = sum(
+                1 for s in self._sessions.values() if now - s.last_seen <= ACTIVE_WINDOW
+            )
+            self._active_counted_at = now
+        return self._active_count
@@ -1,10 +1,53 @@
 import multiprocessing
 import time
 import logging
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
-def gaze_worker(frame_queue: multiprocessing.Queue, result_queue: multiprocessing.Queue, max_faces: int, model_path: str):
+SUSPICION_THRESHOLD = 3.0  # Seconds before flagging any suspicious gaze
+SESSION_STATE_TTL = 600    # Seconds of inactivity before a session's gaze state is dropped
+FRAME_QUEUE_SIZE = 10
+
+
+class GazeSessionState:
+    """Temporal gaze state for a single interview (grace timer + activity stamp)."""
+    __slots__ = ("suspicious_since", "last_seen")
+
+    def __init__(self):
+        self.suspicious_since: Optional[float] = None
+        self.last_seen: float = 0.0
+
+
+def apply_grace_period(state: GazeSessionState, raw_state: str, now: float) -> str:
+    """
+    Turns a raw per-frame gaze state into the reported status for one session.
+    Any state other than "Center" must persist for SUSPICION_THRESHOLD seconds
+    before it is escalated to a WARNING.
+    """
+    if raw_state == "Center":
+        state.suspicious_since = None
+        return "Safe: Center"
+
+    if state.suspicious_since is None:
+        state.suspicious_since = now
+
+    if now - state.suspicious_since > SUSPICION_THRESHOLD:
+        # Formulate descriptive warning
+        msg = f"Looking {raw_state}" if raw_state != "Blink" else "Sleeping/Eyes Closed"
+        return f"WARNING: {msg}"
+    return f"Safe: Center (Brief {raw_state})"
+
+
+def evict_idle_states(states: Dict[int, GazeSessionState], now: float, ttl: float = SESSION_STATE_TTL) -> int:
+    """Drops gaze state for sessions that have not sent a frame within `ttl` seconds."""
+    stale_ids = [sid for sid, st in states.items() if now - st.last_seen > ttl]
+    for sid in stale_ids:
+        del states[sid]
+    return len(stale_ids)
+
+
+def gaze_worker(frame_queue: multiprocessing.Queue, result_queue: multiprocessing.Queue, max_faces: int, model_path: str, frame_ring_spec=None):
     """
     Processes video frames using MediaPipe FaceLandmarker.
     Calculates eye ratios to determine gaze direction and blink state.
@@ -22,6 +65,7 @@ def gaze_worker(frame_queue: multiprocessing.Queue, result_queue: multiprocessin
         from mediapipe.tasks import python
         from mediapipe.tasks.python import vision
         from ..utils.image_processing import convert_to_rgb
+        from .frame_buffer import FrameRef, SharedFrameRing
         
         abs_model_path = os.path.abspath(model_path)
         
@@ -67,9 +111,12 @@ def gaze_worker(frame_queue: multiprocessing.Queue, result_queue: multiprocessin
             worker_logger.error(f"GazeWorker: MediaPipe creation failed: {mp_e}")
             return
         
-        # State tracking for grace period
-        suspicious_start_time = None
-        SUSPICION_THRESHOLD = 3.0  # Seconds before flagging any suspicious gaze
+        # Frames arrive as FrameRef descriptors into shared memory when a ring is configured
+        frame_ring = SharedFrameRing.attach(*frame_ring_spec) if frame_ring_spec else None
+
+        # Per-session grace period state: {interview_id: GazeSessionState}
+        session_states: Dict[int, GazeSessionState] = {}
+        last_eviction = time.time()
         
         # Thresholds (Tuned based on user feedback)
         H_MIN, H_MAX = 0.44, 0.56
@@ -77,16 +124,44 @@ def gaze_worker(frame_queue: multiprocessing.Queue, result_queue: multiprocessin
         
         while True:
             try:
-                bgr_frame = frame_queue.get(timeout=1)
+                item = frame_queue.get(timeout=1)
             except multiprocessing.queues.Empty:
                 continue
                 
-            if bgr_frame is None: 
+            if item is None: 
                 break
+
+            interview_id, bgr_frame = item
+
+            # Control message: forget a finished session
+            if bgr_frame is None:
+                session_states.pop(interview_id, None)
+                continue
+
+            now = time.time()
+            if now - last_eviction > 60:
+                evicted = evict_idle_states(session_states, now)
+                if evicted:
+                    worker_logger.info(f"GazeWorker: Evicted {evicted} idle session state(s)")
+                last_eviction = now
+
+            state = session_states.get(interview_id)
+            if state is None:
+                state = session_states[interview_id] = GazeSessionState()
+            state.last_seen = now
                 
             try:
+                frame_ref = None
+                if isinstance(bgr_frame, FrameRef):
+                    frame_ref = bgr_frame
+                    bgr_frame = frame_ring.read(frame_ref) if frame_ring else None
+                    if bgr_frame is None:
+                        continue # Slot already overwritten by a newer frame
+
                 # Convert to RGB inside the worker using utility
                 rgb_frame = convert_to_rgb(bgr_frame)
+                if frame_ref is not None and not frame_ring.is_current(frame_ref):
+                    continue # Writer reused the slot while we were copying out
                 rgb_frame.flags.writeable = False # Efficiency
                 
                 mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
@@ -141,32 +216,16 @@ def gaze_worker(frame_queue: multiprocessing.Queue, result_queue: multiprocessin
                             elif avg_v > V_MAX: raw_state = "Down"
                             elif is_blinking:   raw_state = "Blink"
                             
-                            # Process Unified Grace Period (5 Seconds)
-                            # Any state other than "Center" increments the timer
-                            if raw_state != "Center":
-                                if suspicious_start_time is None:
-                                    suspicious_start_time = time.time()
-                                
-                                elapsed = time.time() - suspicious_start_time
-                                
-                                if elapsed > SUSPICION_THRESHOLD:
-                                    # Formulate descriptive warning
-                                    msg = f"Looking {raw_state}" if raw_state != "Blink" else "Sleeping/Eyes Closed"
-                                    final_status = f"WARNING: {msg}"
-                                else:
-                                    final_status = f"Safe: Center (Brief {raw_state})"
-                                    
-                            else:
-                                final_status = "Safe: Center"
-                                suspicious_start_time = None
+                            # Process Unified Grace Period (per session)
+                            final_status = apply_grace_period(state, raw_state, now)
                                 
                 if result_queue.full():
                     try: result_queue.get_nowait()
                     except multiprocessing.queues.Empty: pass
-                result_queue.put(final_status)
+                result_queue.put((interview_id, final_status))
 
             except Exception as e:
-                worker_logger.error(f"GazeWorker Logic Error: {e}")
+                worker_logger.error(f"GazeWorker Logic Error [Session {interview_id}]: {e}")
 
     except Exception as e:
         worker_logger.critical(f"GazeWorker CRITICAL FAILURE: {e}")
@@ -182,7 +241,7 @@ def gaze_worker(frame_queue: multiprocessing.Queue, result_queue: multiprocessin
 from ..core.config import IS_ORCHESTRATOR
 
 class GazeDetector:
-    def __init__(self, model_path='app/assets/face_landmarker.task', max_faces=1):
+    def __init__(self, model_path='app/assets/face_landmarker.task', max_faces=1, frame_ring_spec=None):
         logger.info("Initializing GazeDetector...")
         self.model_path = model_path
         
@@ -194,33 +253,70 @@ class GazeDetector:
             self.result_queue = None
             return
 
-        self.frame_queue = multiprocessing.Queue(maxsize=1)
-        self.result_queue = multiprocessing.Queue(maxsize=1)
+        # Results map: {interview_id: latest_status}
+        self.session_results: Dict[int, str] = {}
+
+        self.frame_queue = multiprocessing.Queue(maxsize=FRAME_QUEUE_SIZE)
+        self.result_queue = multiprocessing.Queue(maxsize=FRAME_QUEUE_SIZE)
         
         logger.info(f"GazeDetector initialized with model: {model_path}")
         self.worker = multiprocessing.Process(
             target=gaze_worker,
-            args=(self.frame_queue, self.result_queue, max_faces, self.model_path)
+            args=(self.frame_queue, self.result_queue, max_faces, self.model_path, frame_ring_spec)
         )
         self.worker.daemon = True
         self.worker.start()
         logger.info("Gaze Worker started.")
         
-    def process_frame(self, frame_bgr):
+    def process_frame(self, frame_bgr, interview_id: int, frame_ref=None):
         if IS_ORCHESTRATOR:
             return None
         try:
-            # Send BGR directly; worker will convert to RGB
+            # Send BGR directly (or its shared-memory slot); worker will convert to RGB
             if not self.frame_queue.full():
-                self.frame_queue.put(frame_bgr)
+                self.frame_queue.put((interview_id, frame_ref if frame_ref is not None else frame_bgr))
                 
-            try:
-                return self.result_queue.get_nowait()
-            except multiprocessing.queues.Empty:
-                return None
+            # Drain results and update map
+            while not self.result_queue.empty():
+                try:
+                    sid, status = self.result_queue.get_nowait()
+                    self.session_results[sid] = status
+                except multiprocessing.queues.Empty:
+                    break
+
+            return self.session_results.get(interview_id)
         except Exception as e:
             logger.error(f"Gaze API Error: {e}")
             return None
+
+    def accepts_frame(self) -> bool:
+        """Whether process_frame would enqueue a frame now (False means it would be dropped)."""
+        if IS_ORCHESTRATOR or self.frame_queue is None:
+            return False
+        try:
+            return not self.frame_queue.full()
+        except Exception:
+            return True
+
+    def backlog(self) -> float:
+        """Fill ratio of the worker frame queue in [0, 1] (0 when unknown)."""
+        if self.frame_queue is None:
+            return 0.0
+        try:
+            return self.frame_queue.qsize() / FRAME_QUEUE_SIZE
+        except NotImplementedError: # macOS has no sem_getvalue
+            return 0.0
+
+    def clear_session(self, interview_id: int):
+        """Drops cached results and asks the worker to forget the session's grace timer."""
+        self.session_results.pop(interview_id, None)
+        if self.frame_queue is None:
+            return
+        try:
+            self.frame_queue.put_nowait((interview_id, None))
+        except Exception:
+            # Worker evicts idle session state on its own after SESSION_STATE_TTL
+            pass
             
     def close(self):
         try:
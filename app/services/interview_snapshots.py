@@ -0,0 +1,305 @@
+"""
+In-memory per-interview snapshots for enriched admin broadcasts.
+
+Every admin event carries the interview's status, candidate identity and
+counters. Instead of querying them per broadcast, each interview's values are
+loaded once (a single query) into an InterviewSnapshot and then patched in
+place:
+
+- ORM flush hooks collect changes to InterviewSession, the candidate User,
+  InterviewResult, Answers and SessionQuestion rows, and patch the cached
+  snapshots once the transaction commits (rolled back changes are dropped).
+- Snapshots expire after INTERVIEW_SNAPSHOT_TTL seconds, which bounds
+  staleness from writes made by other workers or outside the ORM.
+- The cache is an LRU bounded by INTERVIEW_SNAPSHOT_CACHE_SIZE.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, func, inspect
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, select
+
+from ..core.config import INTERVIEW_SNAPSHOT_CACHE_SIZE, INTERVIEW_SNAPSHOT_TTL
+from ..core.logger import get_logger
+from ..models.db_models import Answers, InterviewResult, InterviewSession, SessionQuestion, User
+
+logger = get_logger(__name__)
+
+# InterviewSession columns mirrored in the snapshot (attribute name == column name)
+SESSION_FIELDS = (
+    "status", "current_status", "tab_switch_count", "warning_count",
+    "max_warnings", "is_suspended", "last_activity", "candidate_id",
+)
+
+
+def _status_value(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return str(value.value) if hasattr(value, "value") else str(value)
+
+
+@dataclass(slots=True)
+class InterviewSnapshot:
+    interview_id: int
+    status: Optional[str] = None
+    current_status: Optional[str] = None
+    candidate_id: Optional[int] = None
+    candidate_name: Optional[str] = None
+    candidate_email: Optional[str] = None
+    tab_switch_count: int = 0
+    warning_count: int = 0
+    max_warnings: int = 3
+    is_suspended: bool = False
+    last_activity: Optional[datetime] = None
+    result_id: Optional[int] = None
+    questions_answered: int = 0
+    total_questions: int = 0
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    def enriched(self, dashboard_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Payload fields shared by every admin event for this interview."""
+        return {
+            "interview_id": self.interview_id,
+            "interview_status": self.status,
+            "candidate": {
+                "candidate_id": self.candidate_id,
+                "candidate_name": self.candidate_name,
+                "candidate_email": self.candidate_email,
+            },
+            "proctoring_events": {
+                "tab_switch_count": self.tab_switch_count,
+            },
+            "progress": {
+                "questions_answered": self.questions_answered,
+                "total_questions": self.total_questions,
+            },
+            "dashboard_data": dashboard_data,
+        }
+
+
+def query_snapshot(session: Session, interview_id: int) -> Optional[InterviewSnapshot]:
+    """Loads one interview's snapshot (session, candidate, result and counts) in a single query."""
+    answered = (
+        select(func.count(Answers.id))
+        .where(Answers.interview_result_id == InterviewResult.id)
+        .correlate(InterviewResult)
+        .scalar_subquery()
+    )
+    total = (
+        select(func.count(SessionQuestion.id))
+        .where(SessionQuestion.interview_id == InterviewSession.id)
+        .correlate(InterviewSession)
+        .scalar_subquery()
+    )
+    row = session.exec(
+        select(
+            InterviewSession.status, InterviewSession.current_status,
+            InterviewSession.tab_switch_count, InterviewSession.warning_count,
+            InterviewSession.max_warnings, InterviewSession.is_suspended,
+            InterviewSession.last_activity,
+            User.id, User.full_name, User.email,
+            InterviewResult.id, answered, total,
+        )
+        .join(User, InterviewSession.candidate_id == User.id)
+        .outerjoin(InterviewResult, InterviewResult.interview_id == InterviewSession.id)
+        .where(InterviewSession.id == interview_id)
+    ).first()
+    if row is None:
+        return None
+    (status, current_status, tab_switches, warnings, max_warnings, is_suspended, last_activity,
+     candidate_id, name, email, result_id, answered_count, total_count) = row
+    return InterviewSnapshot(
+        interview_id=interview_id,
+        status=_status_value(status),
+        current_status=current_status,
+        candidate_id=candidate_id,
+        candidate_name=name,
+        candidate_email=email,
+        tab_switch_count=tab_switches or 0,
+        warning_count=warnings or 0,
+        max_warnings=max_warnings if max_warnings is not None else 3,
+        is_suspended=bool(is_suspended),
+        last_activity=last_activity,
+        result_id=result_id,
+        questions_answered=(answered_count or 0) if result_id is not None else 0,
+        total_questions=total_count or 0,
+    )
+
+
+class SnapshotCache:
+    def __init__(self, max_size: int = INTERVIEW_SNAPSHOT_CACHE_SIZE, ttl: float = INTERVIEW_SNAPSHOT_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._snapshots: "OrderedDict[int, InterviewSnapshot]" = OrderedDict()
+        self._by_result: Dict[int, int] = {}  # InterviewResult.id -> interview id
+        # Interviews being loaded: True once patched mid-load (the loaded row may be stale)
+        self._loading: Dict[int, bool] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, interview_id: int) -> Optional[InterviewSnapshot]:
+        with self._lock:
+            snap = self._snapshots.get(interview_id)
+            if snap is None:
+                return None
+            if time.monotonic() - snap.loaded_at > self.ttl:
+                self._drop(interview_id)
+                return None
+            self._snapshots.move_to_end(interview_id)
+            return snap
+
+    def get_or_load(self, interview_id: int, session: Optional[Session] = None) -> Optional[InterviewSnapshot]:
+        snap = self.get(interview_id)
+        if snap is not None:
+            self.hits += 1
+            return snap
+        self.misses += 1
+        if session is not None:
+            # May see the caller's uncommitted changes, so it is not cached
+            return query_snapshot(session, interview_id)
+        with self._lock:
+            self._loading.setdefault(interview_id, False)
+        try:
+            from ..core.database import engine
+            with Session(engine) as db_session:
+                snap = query_snapshot(db_session, interview_id)
+        finally:
+            with self._lock:
+                patched_meanwhile = self._loading.pop(interview_id, False)
+        if snap is not None and not patched_meanwhile:
+            self.put(snap)
+        return snap
+
+    def put(self, snap: InterviewSnapshot):
+        with self._lock:
+            self._drop(snap.interview_id)
+            self._snapshots[snap.interview_id] = snap
+            if snap.result_id is not None:
+                self._by_result[snap.result_id] = snap.interview_id
+            while len(self._snapshots) > self.max_size:
+                self._drop(next(iter(self._snapshots)))
+
+    def invalidate(self, interview_id: int):
+        with self._lock:
+            self._drop(interview_id)
+
+    def clear(self):
+        with self._lock:
+            self._snapshots.clear()
+            self._by_result.clear()
+
+    def _drop(self, interview_id: int):
+        snap = self._snapshots.pop(interview_id, None)
+        if snap is not None and snap.result_id is not None:
+            self._by_result.pop(snap.result_id, None)
+
+    def apply(self, patches: List[Tuple]):
+        """Applies committed changes (see _collect_patches) to the cached snapshots."""
+        with self._lock:
+            # New results first, so answers in the same transaction can be attributed
+            for kind, key, value in sorted(patches, key=lambda p: p[0] != "result"):
+                interview_id = self._by_result.get(key) if kind == "answers" else key
+                if kind == "user":
+                    for snap in self._snapshots.values():
+                        if snap.candidate_id == key:
+                            for name, new in value.items():
+                                setattr(snap, name, new)
+                    continue
+                if interview_id in self._loading:
+                    self._loading[interview_id] = True
+                snap = self._snapshots.get(interview_id)
+                if snap is None:
+                    continue
+                if kind == "deleted":
+                    self._drop(interview_id)
+                elif kind == "session":
+                    if "candidate_id" in value and value["candidate_id"] != snap.candidate_id:
+                        self._drop(interview_id)  # Candidate identity must be reloaded
+                        continue
+                    for name, new in value.items():
+                        setattr(snap, name, _status_value(new) if name == "status" else new)
+                elif kind == "result":
+                    snap.result_id = value
+                    self._by_result[value] = interview_id
+                elif kind == "answers":
+                    snap.questions_answered = max(0, snap.questions_answered + value)
+                elif kind == "questions":
+                    snap.total_questions = max(0, snap.total_questions + value)
+
+    def metrics(self) -> Dict[str, int]:
+        return {"size": len(self._snapshots), "hits": self.hits, "misses": self.misses}
+
+
+interview_snapshots = SnapshotCache()
+
+
+# ========== ORM HOOKS ==========
+
+_PENDING_KEY = "interview_snapshot_patches"
+
+
+def _changed_fields(obj, names) -> Dict[str, Any]:
+    state = inspect(obj)
+    changes = {}
+    for name in names:
+        hist = state.attrs[name].history
+        if hist.has_changes() and hist.added:
+            changes[name] = hist.added[0]
+    return changes
+
+
+def _collect_patches(session, flush_context):
+    try:
+        patches = session.info.setdefault(_PENDING_KEY, [])
+        for obj in session.dirty:
+            if isinstance(obj, InterviewSession):
+                changes = _changed_fields(obj, SESSION_FIELDS)
+                if changes:
+                    patches.append(("session", obj.id, changes))
+            elif isinstance(obj, User):
+                changes = _changed_fields(obj, ("full_name", "email"))
+                if changes:
+                    patches.append(("user", obj.id, {
+                        {"full_name": "candidate_name", "email": "candidate_email"}[k]: v for k, v in changes.items()
+                    }))
+        for obj in session.new:
+            if isinstance(obj, Answers):
+                patches.append(("answers", obj.interview_result_id, 1))
+            elif isinstance(obj, SessionQuestion):
+                patches.append(("questions", obj.interview_id, 1))
+            elif isinstance(obj, InterviewResult):
+                patches.append(("result", obj.interview_id, obj.id))
+        for obj in session.deleted:
+            if isinstance(obj, Answers):
+                patches.append(("answers", obj.interview_result_id, -1))
+            elif isinstance(obj, SessionQuestion):
+                patches.append(("questions", obj.interview_id, -1))
+            elif isinstance(obj, (InterviewSession, InterviewResult)):
+                patches.append(("deleted", obj.id if isinstance(obj, InterviewSession) else obj.interview_id, None))
+    except Exception as e:
+        logger.error(f"InterviewSnapshots: Failed to collect changes: {e}")
+
+
+def _apply_patches(session):
+    patches = session.info.pop(_PENDING_KEY, None)
+    if patches:
+        try:
+            interview_snapshots.apply(patches)
+        except Exception as e:
+            logger.error(f"InterviewSnapshots: Failed to apply changes: {e}")
+
+
+def _discard_patches(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+event.listen(OrmSession, "after_flush", _collect_patches)
+event.listen(OrmSession, "after_commit", _apply_patches)
+event.listen(OrmSession, "after_rollback", _discard_patches)
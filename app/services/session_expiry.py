@@ -0,0 +1,99 @@
+"""
+Idle-expiry tracking for per-session state.
+
+`touch` is O(1) and is called on every frame: it only moves the key's deadline
+in a dict. The heap holds one live entry per key and is rescheduled lazily
+when an entry surfaces whose deadline has since been pushed back, so
+`pop_expired` costs O(expired + rescheduled) instead of a scan over all
+sessions.
+
+Each heap entry carries the generation of the key it was pushed for. `discard`
+leaves its entry in the heap as stale (skipped when it surfaces, since a
+re-added key gets a new generation); the heap is compacted once stale entries
+outnumber live ones.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict, Hashable, List, Optional, Tuple
+
+MIN_COMPACT_STALE = 64  # Below this many stale entries the heap is never rebuilt
+
+
+class SessionExpiry:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._deadlines: Dict[Hashable, float] = {}
+        self._generations: Dict[Hashable, int] = {}
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._stale = 0
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._deadlines
+
+    def touch(self, key: Hashable, now: Optional[float] = None):
+        """Marks a session active; it expires `ttl` seconds after the last touch."""
+        deadline = (time.monotonic() if now is None else now) + self.ttl
+        with self._lock:
+            if key not in self._deadlines:
+                generation = next(self._counter)
+                self._generations[key] = generation
+                heapq.heappush(self._heap, (deadline, generation, key))
+            self._deadlines[key] = deadline
+
+    def discard(self, key: Hashable):
+        # The heap entry goes stale and is skipped when it surfaces
+        with self._lock:
+            if self._deadlines.pop(key, None) is None:
+                return
+            del self._generations[key]
+            self._stale += 1
+            if self._stale > max(len(self._deadlines), MIN_COMPACT_STALE):
+                self._compact()
+
+    def last_active(self, key: Hashable) -> Optional[float]:
+        deadline = self._deadlines.get(key)
+        return None if deadline is None else deadline - self.ttl
+
+    def next_deadline(self) -> Optional[float]:
+        with self._lock:
+            while self._heap and self._is_stale(self._heap[0]):
+                heapq.heappop(self._heap)
+                self._stale -= 1
+            return self._heap[0][0] if self._heap else None
+
+    def pop_expired(self, now: Optional[float] = None) -> List[Hashable]:
+        now = time.monotonic() if now is None else now
+        expired = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                entry = heapq.heappop(self._heap)
+                if self._is_stale(entry):
+                    self._stale -= 1
+                    continue  # Discarded (possibly re-added since under a new generation)
+                _, generation, key = entry
+                deadline = self._deadlines[key]
+                if deadline > now:
+                    heapq.heappush(self._heap, (deadline, generation, key))  # Touched since it was scheduled
+                    continue
+                del self._deadlines[key]
+                del self._generations[key]
+                expired.append(key)
+        return expired
+
+    def _is_stale(self, entry: Tuple[float, int, Hashable]) -> bool:
+        _, generation, key = entry
+        return self._generations.get(key) != generation
+
+    def _compact(self):
+        # Rebuilt from live keys at their current deadlines
+        self._heap = [(self._deadlines[key], gen, key) for key, gen in self._generations.items()]
+        heapq.heapify(self._heap)
+        self._stale = 0
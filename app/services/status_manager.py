@@ -9,7 +9,7 @@ This service handles:
 - WebSocket event broadcasting to candidates and admin dashboards
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timezone
 from sqlmodel import Session, select
 
@@ -26,6 +26,10 @@ from ..models.db_models import (
 import json
 from ..schemas.shared.user import serialize_user
 from ..core.logger import get_logger
+from .dashboard_counters import dashboard_counters
+from .interview_snapshots import interview_snapshots
+from .activity_tracker import activity_tracker
+from .timeline_buffer import PendingTimelineEntry, timeline_buffer
 import asyncio
 
 logger = get_logger(__name__)
@@ -38,55 +42,31 @@ from datetime import date, timedelta
 def get_enriched_admin_data(interview_id: int, session: Optional[Session] = None) -> Dict[str, Any]:
     """
     Fetch comprehensive metadata for an interview session to enrich Admin WebSocket payloads.
-    Includes candidate details, current status, and proctoring stats.
+    Includes candidate details, current status, proctoring stats and progress.
+    Assembled from the in-memory interview snapshot; the DB is only read on a cache miss.
     """
-    from ..core.database import engine
-    
-    # Internal helper to get metrics without opening a new session if one is already active
-    def _get_metrics(db_session):
+    # Counters are maintained on status transitions, so this is O(1) per broadcast
+    def _get_metrics():
         try:
-            # We don't want to open another session inside, so we'd ideally pass db_session
-            # But compute_dashboard_metrics is currently self-contained. 
-            # For now, we call it but we've at least fixed the NameError.
+            return dashboard_counters.snapshot()
+        except Exception as e:
+            logger.warning(f"Enrichment: Dashboard counters unavailable ({e}), recomputing")
             return compute_dashboard_metrics()
-        except Exception:
-            return {"live": 0, "proctoring_activity": "0.00%", "failed_today": 0, "passed_today": 0}
 
-    close_session = False
-    if session is None:
-        session = Session(engine)
-        close_session = True
-    
     try:
-        # Fetch session with candidate details
-        stmt = select(InterviewSession, User).join(User, InterviewSession.candidate_id == User.id).where(InterviewSession.id == interview_id)
-        result = session.exec(stmt).first()
+        snapshot = interview_snapshots.get_or_load(interview_id, session=session)
         
-        if not result:
+        if snapshot is None:
             logger.warning(f"Enrichment: Session {interview_id} or candidate not found")
             return {
                 "interview_id": interview_id,
                 "interview_status": "UNKNOWN",
                 "candidate": {"candidate_id": None, "candidate_name": "Unknown", "candidate_email": "Unknown"},
                 "proctoring_events": {"tab_switch_count": 0},
-                "dashboard_data": _get_metrics(session)
+                "dashboard_data": _get_metrics()
             }
         
-        interview_session, candidate = result
-        
-        return {
-            "interview_id": interview_id,
-            "interview_status": str(interview_session.status.value) if hasattr(interview_session.status, 'value') else str(interview_session.status),
-            "candidate": {
-                "candidate_id": candidate.id,
-                "candidate_name": candidate.full_name,
-                "candidate_email": candidate.email
-            },
-            "proctoring_events": {
-                "tab_switch_count": interview_session.tab_switch_count
-            },
-            "dashboard_data": _get_metrics(session)
-        }
+        return snapshot.enriched(_get_metrics())
     except Exception as e:
         logger.error(f"Error enriching admin data for {interview_id}: {e}", exc_info=True)
         return {
@@ -96,9 +76,6 @@ def get_enriched_admin_data(interview_id: int, session: Optional[Session] = None
             "proctoring_events": {"tab_switch_count": 0},
             "dashboard_data": {"live": 0, "proctoring_activity": "0.00%", "failed_today": 0, "passed_today": 0}
         }
-    finally:
-        if close_session:
-            session.close()
 
 async def _broadcast_violation_event(interview_id: int, event_type: str, details: Optional[str] = None, tab_switch_count: Optional[int] = None):
     """
@@ -136,7 +113,7 @@ async def _broadcast_violation_event(interview_id: int, event_type: str, details
         )
         
         # Broadcast to admin dashboard (include enriched data)
-        enriched_data = get_enriched_admin_data(interview_id)
+        enriched_data = await asyncio.to_thread(get_enriched_admin_data, interview_id)
         
         admin_payload = {
             "event_type": "violation_detected",
@@ -148,14 +125,8 @@ async def _broadcast_violation_event(interview_id: int, event_type: str, details
             }
         }
 
-        # Broadcast to per-interview admin dashboards
-        await manager.broadcast_to_admin_dashboard(
-            interview_id,
-            admin_payload
-        )
-        
-        # Broadcast to global admin dashboards
-        await manager.broadcast_to_admins(admin_payload)
+        # Per-interview and global admin dashboards (serialized once)
+        await manager.broadcast_admin_event(interview_id, admin_payload)
         
         logger.debug(f"Violation event broadcast: {event_type} for interview {interview_id}")
         
@@ -173,7 +144,7 @@ async def _broadcast_interview_suspended_event(interview_id: int, violation_type
         from ..schemas.websocket.events import AdminDashboardEvent
         
         # Create suspension event payload and include enriched data
-        enriched_data = get_enriched_admin_data(interview_id)
+        enriched_data = await asyncio.to_thread(get_enriched_admin_data, interview_id)
 
         suspension_payload = {
             "event_type": "interview_suspended",
@@ -190,14 +161,8 @@ async def _broadcast_interview_suspended_event(interview_id: int, violation_type
             }
         }
 
-        # Broadcast to per-interview admin dashboards
-        await manager.broadcast_to_admin_dashboard(
-            interview_id,
-            suspension_payload
-        )
-        
-        # Broadcast to global admin dashboards
-        await manager.broadcast_to_admins(suspension_payload)
+        # Per-interview and global admin dashboards (serialized once)
+        await manager.broadcast_admin_event(interview_id, suspension_payload)
         
         logger.info(f"Interview suspension event broadcast for interview {interview_id}")
         
@@ -212,7 +177,7 @@ async def _broadcast_interview_started_event(interview_id: int):
         from ..schemas.websocket.events import AdminDashboardEvent
         
         # Create enriched payload
-        enriched_data = get_enriched_admin_data(interview_id)
+        enriched_data = await asyncio.to_thread(get_enriched_admin_data, interview_id)
 
         payload = {
             "event_type": "interview_started",
@@ -222,14 +187,8 @@ async def _broadcast_interview_started_event(interview_id: int):
             }
         }
 
-        # Broadcast to per-interview admin dashboards
-        await manager.broadcast_to_admin_dashboard(
-            interview_id,
-            payload
-        )
-        
-        # Broadcast to global admin dashboards
-        await manager.broadcast_to_admins(payload)
+        # Per-interview and global admin dashboards (serialized once)
+        await manager.broadcast_admin_event(interview_id, payload)
         
         logger.debug(f"Interview started event broadcast for interview {interview_id}")
         
@@ -244,7 +203,7 @@ async def _broadcast_interview_completed_event(interview_id: int, result_status:
         from ..schemas.websocket.events import AdminDashboardEvent
         
         # Create enriched payload
-        enriched_data = get_enriched_admin_data(interview_id)
+        enriched_data = await asyncio.to_thread(get_enriched_admin_data, interview_id)
 
         payload = {
             "event_type": "interview_completed",
@@ -255,14 +214,8 @@ async def _broadcast_interview_completed_event(interview_id: int, result_status:
             }
         }
 
-        # Broadcast to per-interview admin dashboards
-        await manager.broadcast_to_admin_dashboard(
-            interview_id,
-            payload
-        )
-        
-        # Broadcast to global admin dashboards
-        await manager.broadcast_to_admins(payload)
+        # Per-interview and global admin dashboards (serialized once)
+        await manager.broadcast_admin_event(interview_id, payload)
         
         logger.debug(f"Interview completed event broadcast for interview {interview_id}")
         
@@ -277,7 +230,7 @@ async def _broadcast_interview_expired_event(interview_id: int):
         from ..schemas.websocket.events import AdminDashboardEvent
         
         # Create enriched payload
-        enriched_data = get_enriched_admin_data(interview_id)
+        enriched_data = await asyncio.to_thread(get_enriched_admin_data, interview_id)
 
         payload = {
             "event_type": "interview_expired",
@@ -287,14 +240,8 @@ async def _broadcast_interview_expired_event(interview_id: int):
             }
         }
 
-        # Broadcast to per-interview admin dashboards
-        await manager.broadcast_to_admin_dashboard(
-            interview_id,
-            payload
-        )
-        
-        # Broadcast to global admin dashboards
-        await manager.broadcast_to_admins(payload)
+        # Per-interview and global admin dashboards (serialized once)
+        await manager.broadcast_admin_event(interview_id, payload)
         
         logger.debug(f"Interview expired event broadcast for interview {interview_id}")
         
@@ -303,14 +250,12 @@ async def _broadcast_interview_expired_event(interview_id: int):
 
 
 def _fire_async_broadcast(coro):
-    """Fire and forget async broadcast (non-blocking)."""
+    """Fire and forget async broadcast (non-blocking, safe from any thread)."""
+    from .broadcast_dispatcher import dispatcher
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            asyncio.run_coroutine_threadsafe(coro, loop)
-        else:
-            asyncio.run(coro)
+        dispatcher.submit(coro)
     except Exception as e:
+        coro.close()
         logger.error(f"Failed to fire async broadcast: {e}")
 
 # Violation severity mapping
@@ -334,37 +279,46 @@ def record_status_change(
     session: Session,
     interview_session: InterviewSession,
     new_status: CandidateStatus,
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = None,
+    commit: bool = True,
 ) -> StatusTimeline:
     """
     Record a status change in the timeline and update session's current status.
     Broadcasts appropriate admin dashboard events for major status transitions.
     
+    The timeline entry is not inserted here: it is handed to the timeline buffer
+    when the session commits and bulk-inserted on its next flush.
+    
     Args:
         session: Database session
         interview_session: The interview session to update
         new_status: The new status to transition to
         metadata: Optional additional context (stored as JSON)
+        commit: Commit the session here; pass False when the caller commits right after
     
     Returns:
-        The created StatusTimeline entry
+        The (not yet persisted) StatusTimeline entry
     """
-    # Create timeline entry
+    now = datetime.now(timezone.utc)
+    context_data = json.dumps(metadata) if metadata else "{}"
     timeline_entry = StatusTimeline(
         interview_id=interview_session.id,
         status=new_status,
-        timestamp=datetime.now(timezone.utc),
-        context_data=json.dumps(metadata) if metadata else "{}"
+        timestamp=now.replace(tzinfo=None),  # Column is naive UTC (see StatusTimeline default)
+        context_data=context_data
+    )
+    timeline_buffer.defer(
+        session,
+        PendingTimelineEntry(interview_session.id, new_status, timeline_entry.timestamp, context_data),
     )
     
     # Update session current status — store as string since the column type is str
     interview_session.current_status = new_status.value
-    interview_session.last_activity = datetime.now(timezone.utc)
+    interview_session.last_activity = now
     
-    session.add(timeline_entry)
     session.add(interview_session)
-    session.commit()
-    session.refresh(timeline_entry)
+    if commit:
+        session.commit()
     
     logger.info(
         f"Status change recorded for session {interview_session.id}: "
@@ -385,7 +339,7 @@ def record_status_change(
     return timeline_entry
 
 
-def add_violation(
+def _apply_violation(
     session: Session,
     interview_session: InterviewSession,
     event_type: str,
@@ -393,18 +347,8 @@ def add_violation(
     force_severity: Optional[str] = None
 ) -> ProctoringEvent:
     """
-    Add a proctoring violation and potentially trigger warnings/suspension.
-    Broadcasts violation events to both candidate and admin dashboard.
-    
-    Args:
-        session: Database session
-        interview_session: The interview session
-        event_type: Type of violation (e.g., "gaze_away", "multiple_faces")
-        details: Additional details about the violation
-        force_severity: Override automatic severity determination
-    
-    Returns:
-        The created ProctoringEvent
+    Builds the ProctoringEvent and applies warning/suspension rules to the session.
+    Adds both to `session` without committing (see add_violation / add_violations_batch).
     """
     # Determine severity
     severity = force_severity or VIOLATION_SEVERITY.get(event_type, "info")
@@ -438,7 +382,8 @@ def add_violation(
                 "reason": event_type,
                 "details": details,
                 "auto_suspended": True
-            }
+            },
+            commit=False,
         )
         
         logger.warning(
@@ -473,7 +418,8 @@ def add_violation(
                     "reason": "max_warnings_exceeded",
                     "warning_count": interview_session.warning_count,
                     "last_violation": event_type
-                }
+                },
+                commit=False,
             )
             
             logger.warning(
@@ -483,32 +429,102 @@ def add_violation(
     
     session.add(event)
     session.add(interview_session)
-    session.commit()
-    session.refresh(event)
-    
+    return event
+
+
+def _broadcast_violation(
+    interview_id: int,
+    event_type: str,
+    details: Optional[str],
+    warning_count: int,
+    suspended_by_warnings: bool
+):
     # Broadcast violation event to candidate and admin
     _fire_async_broadcast(
         _broadcast_violation_event(
-            interview_session.id,
+            interview_id,
             event_type,
             details,
-            tab_switch_count=interview_session.warning_count if event_type == "tab_switch" else None
+            tab_switch_count=warning_count if event_type == "tab_switch" else None
         )
     )
     
     # If suspension occurred due to warnings, also broadcast the suspension event
-    if interview_session.is_suspended and event.triggered_warning and severity == "warning":
+    if suspended_by_warnings:
         _fire_async_broadcast(
             _broadcast_interview_suspended_event(
-                interview_session.id,
+                interview_id,
                 event_type,
-                interview_session.warning_count
+                warning_count
             )
         )
+
+
+def _violation_broadcast_args(interview_session: InterviewSession, event: ProctoringEvent, details: Optional[str]) -> tuple:
+    return (
+        interview_session.id,
+        event.event_type,
+        details,
+        interview_session.warning_count,
+        bool(interview_session.is_suspended and event.triggered_warning and event.severity == "warning"),
+    )
+
+
+def add_violation(
+    session: Session,
+    interview_session: InterviewSession,
+    event_type: str,
+    details: Optional[str] = None,
+    force_severity: Optional[str] = None
+) -> ProctoringEvent:
+    """
+    Add a proctoring violation and potentially trigger warnings/suspension.
+    Broadcasts violation events to both candidate and admin dashboard.
+    
+    Args:
+        session: Database session
+        interview_session: The interview session
+        event_type: Type of violation (e.g., "gaze_away", "multiple_faces")
+        details: Additional details about the violation
+        force_severity: Override automatic severity determination
+    
+    Returns:
+        The created ProctoringEvent
+    """
+    event = _apply_violation(session, interview_session, event_type, details, force_severity)
+    session.commit()
+    session.refresh(event)
     
+    _broadcast_violation(*_violation_broadcast_args(interview_session, event, details))
     return event
 
 
+def add_violations_batch(
+    session: Session,
+    violations: List[Tuple[InterviewSession, str, Optional[str]]]
+) -> List[int]:
+    """
+    Same rules as add_violation for many (interview_session, event_type, details)
+    entries, persisted in a single transaction. Broadcasts after the commit.
+    Returns the new ProctoringEvent ids in input order.
+    """
+    events = []
+    broadcasts = []
+    for interview_session, event_type, details in violations:
+        event = _apply_violation(session, interview_session, event_type, details)
+        events.append(event)
+        # Capture now: attributes are expired by the commit below
+        broadcasts.append(_violation_broadcast_args(interview_session, event, details))
+
+    session.flush()  # Assigns primary keys without a refresh per event
+    event_ids = [event.id for event in events]
+    session.commit()
+
+    for args in broadcasts:
+        _broadcast_violation(*args)
+    return event_ids
+
+
 def complete_interview_session(
     session: Session,
     interview_session: InterviewSession,
@@ -527,6 +543,7 @@ def complete_interview_session(
         interview_session=interview_session,
         new_status=CandidateStatus.INTERVIEW_COMPLETED,
         metadata={"reason": reason, "auto_completed": True},
+        commit=False,
     )
 
     result_obj = interview_session.result
@@ -584,7 +601,8 @@ def check_and_suspend(
         session=session,
         interview_session=interview_session,
         new_status=CandidateStatus.SUSPENDED,
-        metadata={"reason": reason, "manual_suspension": True}
+        metadata={"reason": reason, "manual_suspension": True},
+        commit=False,
     )
     
     session.add(interview_session)
@@ -595,14 +613,22 @@ def check_and_suspend(
 
 
 def _get_timeline_data(session: Session, interview_id: int) -> List[Dict[str, Any]]:
-    """Helper to fetch and format timeline entries."""
+    """Helper to fetch and format timeline entries (stored rows plus unflushed buffered ones)."""
     timeline_stmt = select(StatusTimeline).where(
         StatusTimeline.interview_id == interview_id
     ).order_by(StatusTimeline.timestamp)
-    entries = session.exec(timeline_stmt).all()
+    entries = list(session.exec(timeline_stmt).all())
+
+    # An entry may be both buffered and stored while its flush is committing
+    seen = {(_status_key(e.status), _naive_utc(e.timestamp)) for e in entries}
+    for pending in timeline_buffer.entries_for(interview_id):
+        if (_status_key(pending.status), _naive_utc(pending.timestamp)) not in seen:
+            entries.append(pending)
+    entries.sort(key=lambda e: _naive_utc(e.timestamp))
+
     return [
         {
-            "status": e.status.value if hasattr(e.status, 'value') else str(e.status),
+            "status": _status_key(e.status),
             "timestamp": e.timestamp.isoformat(),
             "metadata": json.loads(e.context_data) if e.context_data else None
         }
@@ -610,6 +636,16 @@ def _get_timeline_data(session: Session, interview_id: int) -> List[Dict[str, An
     ]
 
 
+def _status_key(status) -> str:
+    return status.value if hasattr(status, 'value') else str(status)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
 def _get_warning_data(session: Session, interview_id: int, current_count: int, max_warnings: int) -> Dict[str, Any]:
     """Helper to fetch violations and format warning summary."""
     violations_stmt = select(ProctoringEvent).where(
@@ -656,7 +692,9 @@ def _get_progress_data(interview_session: InterviewSession, result: Optional[Int
 
 def compute_dashboard_metrics(target_date: Optional[date] = None) -> Dict[str, Any]:
     """
-    Compute aggregated dashboard metrics for admin payloads.
+    Compute aggregated dashboard metrics for admin payloads with COUNT queries
+    (no rows are loaded). Broadcasts read the incrementally maintained counters
+    in dashboard_counters instead; this is the full recomputation.
 
     Returns:
         { live: int,
@@ -665,74 +703,14 @@ def compute_dashboard_metrics(target_date: Optional[date] = None) -> Dict[str, A
           passed_today: int }
     """
     try:
-        from sqlmodel import Session, select
-        from sqlalchemy import distinct
-        from datetime import datetime, timezone
         from ..core.database import engine
+        from .dashboard_counters import format_metrics, query_dashboard_totals
 
         if target_date is None:
-            now = datetime.now(timezone.utc)
-            target_date = now.date()
-
-        start = datetime.combine(target_date, datetime.min.time()).replace(tzinfo=timezone.utc)
-        end = start + timedelta(days=1)
+            target_date = datetime.now(timezone.utc).date()
 
         with Session(engine) as session:
-            # live count
-            live_sessions = session.exec(
-                select(InterviewSession).where(InterviewSession.status.in_([InterviewStatus.LIVE, InterviewStatus.CONNECTED, InterviewStatus.DISCONNECTED]))
-            ).all()
-            live_count = len(live_sessions)
-
-            # interviews started today (by start_time)
-            interviews_today = session.exec(
-                select(InterviewSession).where(
-                    InterviewSession.start_time >= start,
-                    InterviewSession.start_time < end
-                )
-            ).all()
-            interviews_today_count = len(interviews_today)
-
-            # distinct interviews with violations today
-            violation_rows = session.exec(
-                select(distinct(ProctoringEvent.interview_id)).where(
-                    ProctoringEvent.timestamp >= start,
-                    ProctoringEvent.timestamp < end
-                )
-            ).all()
-            violation_interview_ids = {r[0] if isinstance(r, tuple) else r for r in violation_rows}
-            violations_today_count = len(violation_interview_ids)
-
-            # results completed today
-            results_today = session.exec(
-                select(InterviewResult).where(
-                    InterviewResult.created_at >= start,
-                    InterviewResult.created_at < end
-                )
-            ).all()
-            passed = 0
-            failed = 0
-            for r in results_today:
-                status = (r.result_status or "").upper()
-                if status == "PASS":
-                    passed += 1
-                elif status == "FAIL":
-                    failed += 1
-
-            # proctoring activity percentage
-            if interviews_today_count > 0:
-                pct = (violations_today_count / float(interviews_today_count)) * 100.0
-            else:
-                pct = 0.0
-
-            proctoring_activity = f"{pct:.2f}%"
-
-            return {
-                "live": live_count,
-                "proctoring_activity": proctoring_activity,
-                "failed_today": failed,
-                "passed_today": passed,
-            }
+            return format_metrics(*query_dashboard_totals(session, target_date))
     except Exception as e:
         logger.error(f"Failed to compute dashboard metrics: {e}")
         return {"live": 0, "proctoring_activity": "0.00%", "failed_today": 0, "passed_today": 0}
@@ -769,6 +747,7 @@ def get_status_summary(
     
     # 4. Serialize users
     candidate_dict = serialize_user(interview_session.candidate)
+    last_activity = activity_tracker.latest(interview_session.id, interview_session.last_activity)
     admin_dict = serialize_user(interview_session.admin) if interview_session.admin else None
     
     return {
@@ -784,7 +763,7 @@ def get_status_summary(
             "status": interview_session.status.value if hasattr(interview_session.status, 'value') else str(interview_session.status),
             "score": (result.total_score if result else interview_session.total_score) or 0.0,
             "current_status": interview_session.current_status,
-            "last_activity": interview_session.last_activity.isoformat() if interview_session.last_activity else None,
+            "last_activity": last_activity.isoformat() if last_activity else None,
             "warning_count": current_warn,
             "max_warnings": max_warn,
             "is_suspended": interview_session.is_suspended or False,
@@ -808,7 +787,7 @@ def get_status_summary(
         "is_suspended": interview_session.is_suspended,
         "suspension_reason": interview_session.suspension_reason,
         "suspended_at": interview_session.suspended_at.isoformat() if interview_session.suspended_at else None,
-        "last_activity": interview_session.last_activity.isoformat() if interview_session.last_activity else None
+        "last_activity": last_activity.isoformat() if last_activity else None
     }
 
 
@@ -819,15 +798,18 @@ def update_last_activity(
 ) -> None:
     """
     Update the last activity timestamp for a session.
+    The row is not written here: activity_tracker flushes heartbeats in batches.
     
     Args:
         session: Database session
         interview_session: The interview session
         broadcast: Whether to broadcast the update to admins
     """
-    interview_session.last_activity = datetime.now(timezone.utc)
-    session.add(interview_session)
-    session.commit()
+    from sqlalchemy.orm.attributes import set_committed_value
+
+    now = activity_tracker.touch(interview_session.id)
+    # Keep the loaded object current without marking it dirty
+    set_committed_value(interview_session, "last_activity", now)
     
     if broadcast:
         # broadcast_interview_update(session, interview_session)
@@ -850,32 +832,18 @@ def broadcast_interview_update(
     try:
         summary = get_status_summary(session, interview_session)
         
-        # 2. Broadcast via WebSocket
+        # 2. Broadcast via WebSocket (handed to the main loop; never blocks this thread)
         from .websocket_manager import manager
-        import asyncio
-        
-        # Determine current loop
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Create enriched payload
-                enriched_data = get_enriched_admin_data(interview_session.id, session=session)
-                
-                asyncio.run_coroutine_threadsafe(
-                    manager.broadcast_to_admins({
-                        "event_type": update_type,
-                        "data": {
-                            **enriched_data,
-                            "summary": summary
-                        }
-                    }), 
-                    loop
-                )
-            else:
-                logger.warning(f"WS Broadcast: Event loop not running for interview {interview_session.id}")
-        except RuntimeError:
-            # Fallback for threads without an event loop
-            logger.debug("WS Broadcast: No event loop in thread, skipping real-time update.")
+        enriched_data = get_enriched_admin_data(interview_session.id, session=session)
+        _fire_async_broadcast(
+            manager.broadcast_to_admins({
+                "event_type": update_type,
+                "data": {
+                    **enriched_data,
+                    "summary": summary
+                }
+            })
+        )
             
     except Exception as e:
         logger.error(f"WS Broadcast Update Fail: {e}")
@@ -0,0 +1,101 @@
+"""
+Per-connection capture settings for the binary video WebSocket.
+
+At connect time the server advertises the analysis resolution, frame rate and
+JPEG quality it actually needs (a `stream_config` message), clamped to anything
+lower the client asked for. While streaming it:
+
+- re-advertises the frame rate when the adaptive sampler's rate for the session
+  changes (e.g. faster while a warning is active, slower under detector load)
+- counts frames larger than negotiated and reminds the client of the limits
+- decodes oversized JPEGs at reduced scale so they still cost little to process
+"""
+
+import math
+import time
+from typing import Any, Dict, Optional
+
+from ..core.config import (
+    PROCTORING_CLIENT_MAX_HEIGHT,
+    PROCTORING_CLIENT_MAX_WIDTH,
+    PROCTORING_CLIENT_JPEG_QUALITY,
+    PROCTORING_STABLE_FPS,
+    PROCTORING_SUSPICIOUS_FPS,
+)
+from ..utils.image_processing import image_dimensions
+
+MIN_CLIENT_FPS = 1.0
+READVERTISE_INTERVAL = 2.0   # Seconds between stream_config updates
+OVERSIZE_REMINDER_AFTER = 10  # Oversized frames before the limits are re-sent
+FPS_HEADROOM = 1.5           # Capture a bit faster than analysed so arrival jitter never starves the sampler
+
+
+class StreamSettings:
+    __slots__ = (
+        "interview_id", "max_height", "max_width", "max_fps", "jpeg_quality",
+        "fps", "frames", "oversized", "_oversized_streak", "_advertised_at",
+    )
+
+    def __init__(
+        self,
+        interview_id: int,
+        max_height: Optional[int] = None,
+        max_fps: Optional[float] = None,
+        jpeg_quality: Optional[int] = None,
+    ):
+        self.interview_id = interview_id
+        self.max_height = min(max_height or PROCTORING_CLIENT_MAX_HEIGHT, PROCTORING_CLIENT_MAX_HEIGHT)
+        self.max_width = self.max_height * PROCTORING_CLIENT_MAX_WIDTH // PROCTORING_CLIENT_MAX_HEIGHT
+        self.max_fps = max(MIN_CLIENT_FPS, min(max_fps or PROCTORING_SUSPICIOUS_FPS, PROCTORING_SUSPICIOUS_FPS))
+        self.jpeg_quality = max(30, min(jpeg_quality or PROCTORING_CLIENT_JPEG_QUALITY, 95))
+        self.fps = self._client_fps(PROCTORING_STABLE_FPS)
+        self.frames = 0
+        self.oversized = 0
+        self._oversized_streak = 0
+        self._advertised_at = float("-inf")
+
+    def message(self, now: Optional[float] = None) -> Dict[str, Any]:
+        self._advertised_at = time.monotonic() if now is None else now
+        return {
+            "type": "stream_config",
+            "interview_id": self.interview_id,
+            "max_height": self.max_height,
+            "max_width": self.max_width,
+            "fps": self.fps,
+            "jpeg_quality": self.jpeg_quality,
+        }
+
+    def observe_frame(self, image_bytes: bytes) -> bool:
+        """Records a received frame; returns True if it exceeds the negotiated size."""
+        self.frames += 1
+        dims = image_dimensions(image_bytes)
+        if dims and (max(dims) > self.max_width or min(dims) > self.max_height):
+            self.oversized += 1
+            self._oversized_streak += 1
+            return True
+        self._oversized_streak = 0
+        return False
+
+    def adapt(self, target_fps: float, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Returns an updated stream_config when the client should change its capture
+        rate or has ignored the size limits, or None if nothing needs to be sent.
+        """
+        now = time.monotonic() if now is None else now
+        if now - self._advertised_at < READVERTISE_INTERVAL:
+            return None
+
+        fps = self._client_fps(target_fps)
+        remind = self._oversized_streak >= OVERSIZE_REMINDER_AFTER
+        if abs(fps - self.fps) < 1.0 and not remind:
+            return None
+
+        self.fps = fps
+        self._oversized_streak = 0
+        return self.message(now)
+
+    def _client_fps(self, target_fps: float) -> float:
+        return float(max(MIN_CLIENT_FPS, min(math.ceil(target_fps * FPS_HEADROOM), self.max_fps)))
+
+    def stats(self) -> Dict[str, Any]:
+        return {"frames": self.frames, "oversized": self.oversized, "fps": self.fps}
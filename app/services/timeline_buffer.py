@@ -0,0 +1,320 @@
+"""
+Buffered, bulk-inserted StatusTimeline writes.
+
+`record_status_change` queues timeline entries here instead of inserting each
+one inside the caller's transaction. Entries are queued on the session and
+only reach the buffer once that transaction commits (a rollback drops them).
+A background thread writes everything pending every `flush_interval` seconds
+with one bulk INSERT, skipping entries whose interview was deleted meanwhile.
+
+- Readers (`_get_timeline_data`) merge `entries_for(interview_id)` with the
+  rows already in the DB, so a timeline is complete before it is flushed.
+- On shutdown the buffer is flushed; if the database is unreachable the
+  entries are appended to a local JSONL file (STATUS_TIMELINE_FALLBACK_PATH)
+  and replayed by the next flush, so accepted status changes are not lost.
+  A worker replays the file by first renaming it to a per-process name (only
+  one worker wins), and deletes it only after the entries are committed; a
+  renamed file left by a crashed worker is picked up again.
+- Other workers see an entry once it is flushed (after `flush_interval`).
+"""
+
+import glob
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session as OrmSession
+
+from ..core.config import STATUS_TIMELINE_FALLBACK_PATH, STATUS_TIMELINE_FLUSH_INTERVAL
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+REPLAY_SUFFIX = ".replay"  # <fallback_path>.<pid>.replay: claimed by one worker, deleted after commit
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # Exists but owned by another user
+    return True
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.error(f"TimelineBuffer: Could not remove {path}: {e}")
+
+
+class PendingTimelineEntry:
+    __slots__ = ("interview_id", "status", "timestamp", "context_data")
+
+    def __init__(self, interview_id: int, status, timestamp: datetime, context_data: str):
+        self.interview_id = interview_id
+        self.status = status
+        self.timestamp = timestamp
+        self.context_data = context_data
+
+    def row(self) -> Dict[str, Any]:
+        return {
+            "interview_id": self.interview_id,
+            "status": self.status,
+            "timestamp": self.timestamp,
+            "context_data": self.context_data,
+        }
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "interview_id": self.interview_id,
+            "status": self.status.value if hasattr(self.status, "value") else str(self.status),
+            "timestamp": self.timestamp.isoformat(),
+            "context_data": self.context_data,
+        })
+
+    @classmethod
+    def from_json(cls, line: str) -> "PendingTimelineEntry":
+        from ..models.db_models import CandidateStatus
+
+        data = json.loads(line)
+        return cls(
+            data["interview_id"],
+            CandidateStatus(data["status"]),
+            datetime.fromisoformat(data["timestamp"]),
+            data.get("context_data") or "{}",
+        )
+
+
+class TimelineBuffer:
+    def __init__(self, flush_interval: float = STATUS_TIMELINE_FLUSH_INTERVAL, fallback_path: Optional[str] = STATUS_TIMELINE_FALLBACK_PATH):
+        self.flush_interval = flush_interval
+        self.fallback_path = fallback_path
+        self._pending: List[PendingTimelineEntry] = []
+        self._inflight: List[PendingTimelineEntry] = []  # Being written; still visible to readers
+        # Entries from a claimed fallback file; the file is deleted once they are committed
+        self._replay: List[PendingTimelineEntry] = []
+        self._replay_path: Optional[str] = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        self.recorded = 0
+        self.flushes = 0
+        self.persisted = 0
+        self.dropped = 0
+
+    def append(self, entry: PendingTimelineEntry):
+        with self._lock:
+            self._pending.append(entry)
+            self.recorded += 1
+        self._ensure_started()
+
+    def defer(self, session, entry: PendingTimelineEntry):
+        """Queues an entry on `session`; it is appended once the session commits."""
+        session.info.setdefault(_PENDING_KEY, []).append(entry)
+
+    def entries_for(self, interview_id: int) -> List[PendingTimelineEntry]:
+        """Unflushed entries of one interview, oldest first."""
+        with self._lock:
+            return [e for e in self._replay + self._inflight + self._pending if e.interview_id == interview_id]
+
+    def forget(self, interview_id: int):
+        """Drops unflushed entries of a deleted interview."""
+        with self._lock:
+            self._pending = [e for e in self._pending if e.interview_id != interview_id]
+
+    def clear(self):
+        with self._lock:
+            self._pending = []
+            self._inflight = []
+            self._replay = []
+            self._replay_path = None
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._replay) + len(self._pending) + len(self._inflight)
+
+    def flush(self, db_session=None) -> int:
+        """Bulk-inserts pending entries (and any replayed from the fallback file). Returns rows written."""
+        with self._flush_lock:
+            self._load_replay()
+            with self._lock:
+                self._inflight = self._pending
+                self._pending = []
+                batch = self._replay + self._inflight
+            if not batch:
+                return 0
+
+            try:
+                if db_session is not None:
+                    written = self._write(db_session, batch)
+                else:
+                    from sqlmodel import Session
+                    from ..core.database import engine
+                    with Session(engine) as session:
+                        written = self._write(session, batch)
+            except Exception:
+                with self._lock:
+                    # Retry on the next flush, ahead of newer entries
+                    self._pending = self._inflight + self._pending
+                    self._inflight = []
+                raise
+            with self._lock:
+                self._inflight = []
+                replay_path, self._replay, self._replay_path = self._replay_path, [], None
+            if replay_path is not None:
+                _remove(replay_path)
+
+            self.flushes += 1
+            self.persisted += written
+            return written
+
+    def recover(self):
+        """Schedules a flush of entries left on disk by a previous shutdown."""
+        if self.fallback_path and (os.path.exists(self.fallback_path) or self._orphaned_replays()):
+            self._ensure_started()
+            self._wakeup.set()
+
+    def close(self):
+        """Final flush on shutdown; entries that cannot be written are kept in the fallback file."""
+        self._running = False
+        self._wakeup.set()
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"TimelineBuffer: Final flush failed ({e}), keeping entries on disk")
+            self._write_fallback()
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "pending": self.pending(), "recorded": self.recorded, "flushes": self.flushes,
+            "persisted": self.persisted, "dropped": self.dropped,
+        }
+
+    # --- internals ---
+
+    def _write(self, session, batch: List[PendingTimelineEntry]) -> int:
+        from sqlalchemy import insert
+        from sqlmodel import select
+        from ..models.db_models import InterviewSession, StatusTimeline
+
+        ids = {e.interview_id for e in batch}
+        existing = set(session.exec(select(InterviewSession.id).where(InterviewSession.id.in_(ids))).all())
+        rows = [e.row() for e in batch if e.interview_id in existing]
+        self.dropped += len(batch) - len(rows)  # Interviews deleted before their entries were flushed
+        if rows:
+            session.execute(insert(StatusTimeline), rows)
+            session.commit()
+        return len(rows)
+
+    def _write_fallback(self):
+        if not self.fallback_path:
+            return
+        with self._lock:
+            # Replayed entries are still in their claimed file on disk
+            entries, self._pending = self._inflight + self._pending, []
+            self._inflight = []
+        if not entries:
+            return
+        try:
+            with open(self.fallback_path, "a", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(entry.to_json() + "\n")
+            logger.warning(f"TimelineBuffer: Saved {len(entries)} unflushed entries to {self.fallback_path}")
+        except OSError as e:
+            logger.error(f"TimelineBuffer: Lost {len(entries)} status timeline entries: {e}")
+
+    def _load_replay(self):
+        """Claims one fallback file for this process (atomic rename) and loads its entries."""
+        if self._replay_path is not None or not self.fallback_path:
+            return
+        claimed = f"{self.fallback_path}.{os.getpid()}{REPLAY_SUFFIX}"
+        for candidate in [self.fallback_path] + self._orphaned_replays():
+            try:
+                # Only one worker wins the rename; the others see the file gone
+                os.replace(candidate, claimed)
+                break
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.error(f"TimelineBuffer: Could not claim {candidate}: {e}")
+                return
+        else:
+            return
+
+        entries = []
+        try:
+            with open(claimed, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        try:
+                            entries.append(PendingTimelineEntry.from_json(line))
+                        except (KeyError, ValueError) as e:
+                            logger.error(f"TimelineBuffer: Skipping unreadable fallback entry: {e}")
+        except OSError as e:
+            logger.error(f"TimelineBuffer: Could not read {claimed}: {e}")
+            return  # Left on disk; claimed again once this process has exited
+        with self._lock:
+            self._replay_path, self._replay = claimed, entries
+        logger.info(f"TimelineBuffer: Replaying {len(entries)} entries saved by a previous shutdown")
+
+    def _orphaned_replays(self) -> List[str]:
+        """Replay files claimed by processes that exited before writing them."""
+        prefix = self.fallback_path + "."
+        orphaned = []
+        for path in glob.glob(glob.escape(prefix) + "*" + REPLAY_SUFFIX):
+            pid = path[len(prefix):-len(REPLAY_SUFFIX)]
+            if pid.isdigit() and int(pid) != os.getpid() and not _pid_alive(int(pid)):
+                orphaned.append(path)
+        return orphaned
+
+    def _ensure_started(self):
+        if self._running:
+            return
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="timeline-flush", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while self._running:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"TimelineBuffer: Flush failed: {e}")
+
+
+timeline_buffer = TimelineBuffer()
+
+
+# ========== ORM HOOKS ==========
+
+_PENDING_KEY = "status_timeline_entries"
+
+
+def _append_committed(session):
+    entries = session.info.pop(_PENDING_KEY, None)
+    for entry in entries or ():
+        timeline_buffer.append(entry)
+
+
+def _discard_uncommitted(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+event.listen(OrmSession, "after_commit", _append_committed)
+event.listen(OrmSession, "after_rollback", _discard_uncommitted)
@@ -0,0 +1,198 @@
+"""
+Coalesced, batched persistence of proctoring violations detected on video frames.
+
+The detectors report the same warning on every analysed frame for as long as
+the condition lasts. Instead of one transaction per frame, occurrences are
+grouped per (interview, warning) into incidents: a repeat within the debounce
+window extends the open incident and bumps its occurrence count.
+
+A background thread flushes every `flush_interval` seconds:
+- new incidents are inserted in one transaction via `add_violations_batch`, so each
+  incident counts as exactly one warning (suspension rules are unchanged)
+- incidents that closed with more occurrences than were persisted get a single
+  details update with the final count
+
+Critical violations trigger an immediate flush.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..core.config import VIOLATION_DEBOUNCE_WINDOW, VIOLATION_FLUSH_INTERVAL
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ViolationIncident:
+    __slots__ = ("interview_id", "event_type", "details", "first_seen", "last_seen", "count", "event_id", "persisted_count")
+
+    def __init__(self, interview_id: int, event_type: str, details: str, now: float):
+        self.interview_id = interview_id
+        self.event_type = event_type
+        self.details = details
+        self.first_seen = now
+        self.last_seen = now
+        self.count = 1
+        self.event_id: Optional[int] = None
+        self.persisted_count = 0
+
+    def describe(self) -> str:
+        if self.count == 1:
+            return self.details
+        return f"{self.details} (x{self.count} over {self.last_seen - self.first_seen:.0f}s)"
+
+
+class ViolationBuffer:
+    def __init__(self, window: float = VIOLATION_DEBOUNCE_WINDOW, flush_interval: float = VIOLATION_FLUSH_INTERVAL):
+        self.window = window
+        self.flush_interval = flush_interval
+
+        self._open: Dict[Tuple[int, str], ViolationIncident] = {}
+        self._closing: Set[int] = set()  # Sessions whose incidents close on the next flush
+        self._retired: List[ViolationIncident] = []  # Incidents replaced by a newer one of the same kind
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        self.recorded = 0
+        self.persisted = 0
+
+    def record(self, interview_id: int, event_type: str, details: str = "", now: Optional[float] = None) -> bool:
+        """Registers one occurrence; returns True if it opened a new incident."""
+        now = time.time() if now is None else now
+        key = (interview_id, event_type)
+        with self._lock:
+            self.recorded += 1
+            incident = self._open.get(key)
+            if incident is not None and now - incident.last_seen <= self.window:
+                incident.last_seen = now
+                incident.count += 1
+                incident.details = details
+                return False
+            if incident is not None:
+                self._retired.append(incident)  # Closed before a flush saw it; still needs writing
+            self._open[key] = ViolationIncident(interview_id, event_type, details, now)
+
+        from .status_manager import VIOLATION_SEVERITY
+        if VIOLATION_SEVERITY.get(event_type) == "critical":
+            self._wakeup.set()  # Suspension should not wait for the next interval
+        self._ensure_started()
+        return True
+
+    def forget(self, interview_id: int):
+        """Closes a finished session's incidents on the next flush (non-blocking)."""
+        with self._lock:
+            if not any(i.interview_id == interview_id for i in self._open.values()):
+                return
+            self._closing.add(interview_id)
+        self._wakeup.set()
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(1 for i in self._open.values() if i.event_id is None) + sum(
+                1 for i in self._retired if i.event_id is None
+            )
+
+    def flush(self, now: Optional[float] = None, db_session=None) -> int:
+        """Persists new incidents and final counts of closed ones. Returns the number of rows written."""
+        now = time.time() if now is None else now
+        with self._flush_lock:
+            with self._lock:
+                closing, self._closing = self._closing, set()
+                closed, self._retired = self._retired, []
+                new = [i for i in closed if i.event_id is None]
+                new += [i for i in self._open.values() if i.event_id is None]
+                for key, incident in list(self._open.items()):
+                    if now - incident.last_seen > self.window or incident.interview_id in closing:
+                        closed.append(incident)
+                        del self._open[key]
+                # Snapshot what will be written so later occurrences are not lost
+                new_rows = [(i, i.describe(), i.count) for i in new]
+                updates = [
+                    (i, i.describe(), i.count) for i in closed
+                    if i.event_id is not None and i.count > i.persisted_count
+                ]
+
+            if not new_rows and not updates:
+                return 0
+
+            try:
+                if db_session is not None:
+                    written = self._write(db_session, new_rows, updates)
+                else:
+                    from sqlmodel import Session
+                    from ..core.database import engine
+                    with Session(engine) as session:
+                        written = self._write(session, new_rows, updates)
+            except Exception:
+                with self._lock:
+                    # Retry unwritten closed incidents on the next flush
+                    self._retired.extend(i for i in closed if i.event_id is None)
+                raise
+
+            self.persisted += written
+            return written
+
+    def close(self):
+        self._running = False
+        self._wakeup.set()
+        try:
+            self.flush(now=float("inf"))
+        except Exception as e:
+            logger.error(f"ViolationBuffer: Final flush failed: {e}")
+
+    # --- internals ---
+
+    def _write(self, session, new_rows, updates) -> int:
+        from sqlmodel import select
+        from ..models.db_models import InterviewSession, ProctoringEvent
+        from .status_manager import add_violations_batch
+
+        written = 0
+        if new_rows:
+            ids = {i.interview_id for i, _, _ in new_rows}
+            sessions = {
+                s.id: s for s in session.exec(select(InterviewSession).where(InterviewSession.id.in_(ids))).all()
+            }
+            rows = [(i, d, c) for i, d, c in new_rows if i.interview_id in sessions]
+            event_ids = add_violations_batch(
+                session, [(sessions[i.interview_id], i.event_type, d) for i, d, _ in rows]
+            )
+            for (incident, _, count), event_id in zip(rows, event_ids):
+                incident.event_id = event_id
+                incident.persisted_count = count
+            written += len(rows)
+
+        if updates:
+            for incident, details, count in updates:
+                event = session.get(ProctoringEvent, incident.event_id)
+                if event is not None:
+                    event.details = details
+                    session.add(event)
+                incident.persisted_count = count
+            session.commit()
+            written += len(updates)
+        return written
+
+    def _ensure_started(self):
+        if self._running:
+            return
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="violation-flush", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while self._running:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"ViolationBuffer: Flush failed: {e}")
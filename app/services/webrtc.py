@@ -1,60 +1,92 @@
 from aiortc import MediaStreamTrack
-import av
+from aiortc.mediastreams import MediaStreamError
+import asyncio
 import logging
-import json
 from typing import Optional
 from .camera import CameraService
+from ..utils.proctoring_codec import ProctoringUpdateEncoder
 
 logger = logging.getLogger(__name__)
 
 class VideoTransformTrack(MediaStreamTrack):
     """
-    A video stream track that transforms frames from an input track.
-    It applies Face & Gaze detection using the CameraService.
+    A video stream track that forwards frames from an input track.
+    Face & Gaze detection runs on a separate task using the CameraService, so
+    analysis latency never delays the outbound video.
     Can optionally send real-time AI results over a WebRTC DataChannel.
     """
     kind = "video"
 
-    def __init__(self, track, interview_id: Optional[int] = None, channel=None):
+    def __init__(self, track, interview_id: Optional[int] = None, channel=None, proctoring_format: Optional[str] = None):
         super().__init__()
         self.track = track
         self.camera_service = CameraService()  # Singleton
         self.interview_id = interview_id
         self.channel = channel
         self.frame_count = 0
+        # Change-only result messages in the format negotiated in the offer
+        self.encoder = ProctoringUpdateEncoder(proctoring_format)
+
+        # Latest-frame-wins hand-off to the analysis task (older pending frames are dropped)
+        self._pending = None
+        self._pending_id = 0
+        self._frame_ready = asyncio.Event()
+        self._analysis_task: Optional[asyncio.Task] = None
         logger.info(f"WebRTC Track Initialized for Session: {interview_id} (DataChannel: {bool(channel)})")
 
     async def recv(self):
         try:
             frame = await self.track.recv()
-            self.frame_count += 1
-            
-            # Convert WebRTC frame to numpy (BGR)
-            img = frame.to_ndarray(format="bgr24")
-            
-            # Process: detection + annotation + AI analysis
-            annotated_img, results = self.camera_service.process_frame_ndarray(img, self.interview_id)
-            
+        except MediaStreamError:
+            # Source ended (peer gone); stop() is not called on relayed tracks
+            self.stop()
+            raise
+        self.frame_count += 1
+
+        # Hand the frame to the analysis task and pass it through untouched
+        self._pending = frame
+        self._pending_id = self.frame_count
+        self._frame_ready.set()
+        if self._analysis_task is None:
+            self._analysis_task = asyncio.ensure_future(self._analysis_loop())
+        return frame
+
+    def stop(self):
+        super().stop()
+        if self._analysis_task is not None:
+            self._analysis_task.cancel()
+            self._analysis_task = None
+
+    async def _analysis_loop(self):
+        loop = asyncio.get_running_loop()
+        while self.readyState == "live" and self.track.readyState == "live":
+            await self._frame_ready.wait()
+            self._frame_ready.clear()
+            frame, frame_id = self._pending, self._pending_id
+            self._pending = None
+            if frame is None:
+                continue
+
+            try:
+                # Conversion + detection run off the event loop
+                results = await loop.run_in_executor(None, self._analyze, frame)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"WebRTC: Analysis Error Session {self.interview_id}: {e}")
+                continue
+
             # PUSH TO DATA CHANNEL: This replaces the need for REST API polling!
             if self.channel and self.channel.readyState == "open":
                 try:
-                    self.channel.send(json.dumps({
-                        "type": "proctoring_update",
-                        "interview_id": self.interview_id,
-                        "data": results,
-                        "frame_id": self.frame_count
-                    }))
+                    message = self.encoder.encode(self.interview_id, results, frame_id=frame_id)
+                    if message is not None:
+                        self.channel.send(message)
                 except Exception as e:
                     logger.debug(f"DataChannel Send Error: {e}")
 
-            # Convert back to WebRTC frame
-            new_frame = av.VideoFrame.from_ndarray(annotated_img, format="bgr24")
-            new_frame.pts = frame.pts
-            new_frame.time_base = frame.time_base
-            return new_frame
-            
-        except Exception as e:
-            logger.error(f"WebRTC: Frame Error Session {self.interview_id}: {e}")
-            if 'frame' in locals():
-                return frame
-            raise
+    def _analyze(self, frame):
+        # Convert WebRTC frame to numpy (BGR) and run detection + annotation + AI analysis
+        img = frame.to_ndarray(format="bgr24")
+        _, results = self.camera_service.process_frame_ndarray(img, self.interview_id)
+        return results
@@ -182,7 +182,8 @@ async def handle_tab_return_event(interview_id: int, session: Session, data: dic
                     session=session,
                     interview_session=session_obj,
                     new_status=CandidateStatus.SUSPENDED,
-                    metadata={"reason": "tab_switch_timeout", "elapsed_seconds": elapsed}
+                    metadata={"reason": "tab_switch_timeout", "elapsed_seconds": elapsed},
+                    commit=False,
                 )
                 
                 from ..tasks.interview_tasks import process_session_results
@@ -293,22 +294,45 @@ async def handle_video_stream_connect(interview_id: int, websocket: WebSocket, c
         log_error(interview_id, f"Error in handle_video_stream_connect: {e}")
         return False
 
-async def process_video_frame(interview_id: int, websocket: WebSocket, data: bytes):
-    """Process a single binary video frame and return AI results."""
+async def process_video_frame(interview_id: int, websocket: WebSocket, data: bytes, encoder=None, stream=None):
+    """
+    Process a single binary video frame and return AI results.
+    `encoder` (ProctoringUpdateEncoder) picks the wire format and drops unchanged results.
+    `stream` (StreamSettings) holds the negotiated capture settings and re-advertises them when they change.
+    """
     try:
         from ..services.camera import CameraService
         camera_service = CameraService()
         
         # Process via AI
-        results = camera_service.process_external_frame(data, interview_id=interview_id)
+        if stream is None:
+            results = camera_service.process_external_frame(data, interview_id=interview_id)
+        else:
+            stream.observe_frame(data)
+            results = camera_service.process_external_frame(
+                data, interview_id=interview_id, max_height=stream.max_height, max_width=stream.max_width
+            )
+            update = stream.adapt(camera_service.client_fps(interview_id))
+            if update is not None:
+                await websocket.send_json(update)
         
-        # Return results
-        await websocket.send_json({
-            "type": "proctoring_update",
-            "interview_id": interview_id,
-            "data": results,
-            "timestamp": time.time()
-        })
+        if encoder is None:
+            await websocket.send_json({
+                "type": "proctoring_update",
+                "interview_id": interview_id,
+                "data": results,
+                "timestamp": time.time()
+            })
+            return
+
+        # Return results (change-only + keepalive)
+        message = encoder.encode(interview_id, results)
+        if message is None:
+            return
+        if encoder.binary:
+            await websocket.send_bytes(message)
+        else:
+            await websocket.send_text(message)
     except Exception as e:
         log_error(interview_id, f"Error processing video frame: {e}")
 
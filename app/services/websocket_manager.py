@@ -1,11 +1,33 @@
-from typing import Dict, List, Any, Set, Optional
+from typing import Dict, List, Any, Set, Optional, Tuple
 from fastapi import WebSocket
+from ..core.config import ADMIN_BROADCAST_COALESCE_WINDOW, ADMIN_SEND_QUEUE_SIZE, REDIS_URL, WS_BACKPLANE
 from ..core.logger import get_logger
+from .ws_connection import OutboundQueue
+from .admin_subscriptions import AdminSubscription, Owner, SubscriptionIndex
+import asyncio
 import json
+from collections import OrderedDict
 from datetime import datetime, timezone
 
 logger = get_logger(__name__)
 
+OWNER_CACHE_SIZE = 4096
+
+
+def _load_interview_owner(interview_id: int) -> Owner:
+    """(admin_id, team_id) of the admin who scheduled an interview."""
+    from sqlmodel import Session, select
+    from ..core.database import engine
+    from ..models.db_models import InterviewSession, User
+
+    with Session(engine) as session:
+        row = session.exec(
+            select(InterviewSession.admin_id, User.team_id)
+            .outerjoin(User, User.id == InterviewSession.admin_id)
+            .where(InterviewSession.id == interview_id)
+        ).first()
+    return (row[0], row[1]) if row else (None, None)
+
 class WebSocketManager:
     """
     Centralized manager for all WebSocket connections.
@@ -13,6 +35,12 @@ class WebSocketManager:
     1. Candidate WebSocket connections per interview
     2. Admin Dashboard connections per interview
     3. Global Admin Dashboard connections (real-time metrics)
+
+    Admin sockets are written through bounded per-connection queues, and
+    candidate state updates are coalesced per interview (latest state wins)
+    so the enriched payload is built and serialized once per window.
+    Broadcasts are also published to the backplane so sockets held by other
+    workers receive them.
     """
     
     def __init__(self):
@@ -22,9 +50,23 @@ class WebSocketManager:
         # {interview_id: [WebSocket]} - Admin dashboard connections (per-interview)
         self.admin_dashboard_connections: Dict[int, List[WebSocket]] = {}
         
-        # Global admin dashboard connections (all admins receive all events)
+        # Global admin dashboard connections (each filtered by its subscription)
         self.admin_connections: List[WebSocket] = []
 
+        # Outbound queues for admin sockets (per-interview and global)
+        self._outboxes: Dict[WebSocket, OutboundQueue] = {}
+
+        # {interview_id: (event_type, extra)} - latest pending state update per interview
+        self._pending_updates: Dict[int, Tuple[str, dict]] = {}
+        self._update_tasks: Dict[int, asyncio.Task] = {}
+
+        # Topic filters of global admin sockets, indexed by interview/admin/team
+        self.admin_subscriptions = SubscriptionIndex()
+        self._owners: "OrderedDict[int, Owner]" = OrderedDict()
+
+        # Pub/sub to the other workers' managers (None = this process only)
+        self.backplane = None
+
     # ========== CANDIDATE WEBSOCKET ==========
     async def connect_candidate(self, websocket: WebSocket, interview_id: int):
         """Register a candidate WebSocket connection for an interview"""
@@ -51,59 +93,48 @@ class WebSocketManager:
 
     async def broadcast_candidate_login(self, interview_id: int, candidate_info: dict):
         """Broadcast candidate login event to all connected admin dashboards"""
-        try:
-            logger.info(f"DEBUG: Starting candidate_login broadcast for interview {interview_id}")
-            # Lazy import to avoid circular dependency
-            from .status_manager import get_enriched_admin_data
-            
-            # Create enriched payload
-            enriched_data = get_enriched_admin_data(interview_id)
-
-            payload = {
-                "event_type": "candidate_logged_in",
-                "data": {
-                    **enriched_data,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                }
-            }
-
-            # Broadcast to per-interview admin dashboards
-            await self.broadcast_to_admin_dashboard(interview_id, payload)
-            
-            # Broadcast to global admin dashboards
-            await self.broadcast_to_admins(payload)
-            logger.info(f"DEBUG: Successfully broadcasted candidate_logged_in for interview {interview_id}")
-            
-        except Exception as e:
-            logger.error(f"WS Error broadcasting candidate_logged_in for interview {interview_id}: {e}", exc_info=True)
+        self.schedule_admin_update(interview_id, "candidate_logged_in")
 
     async def _broadcast_candidate_status(self, interview_id: int, event_type: str):
         """Helper to broadcast candidate connection status to admins"""
+        self.schedule_admin_update(interview_id, event_type)
+
+    def schedule_admin_update(self, interview_id: int, event_type: str, extra: Optional[dict] = None):
+        """
+        Queue an enriched state update for an interview's admins. Updates within
+        the coalescing window replace each other; only the latest is built and sent.
+        """
+        self._pending_updates[interview_id] = (event_type, extra or {})
+        if interview_id not in self._update_tasks:
+            self._update_tasks[interview_id] = asyncio.ensure_future(self._flush_admin_updates(interview_id))
+
+    async def _flush_admin_updates(self, interview_id: int):
+        # Lazy import to avoid circular dependency
+        from .status_manager import get_enriched_admin_data
         try:
-            logger.info(f"DEBUG: Broadcasting candidate status '{event_type}' for interview {interview_id}")
-            # Lazy import to avoid circular dependency
-            from .status_manager import get_enriched_admin_data
-            
-            # Create enriched payload
-            enriched_data = get_enriched_admin_data(interview_id)
-
-            payload = {
-                "event_type": event_type,
-                "data": {
-                    **enriched_data,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                }
-            }
-
-            # Broadcast to per-interview admin dashboards
-            await self.broadcast_to_admin_dashboard(interview_id, payload)
-            
-            # Broadcast to global admin dashboards
-            await self.broadcast_to_admins(payload)
-            logger.info(f"DEBUG: Successfully broadcasted {event_type} for interview {interview_id}")
-            
-        except Exception as e:
-            logger.error(f"Failed to broadcast {event_type} for interview {interview_id}: {e}")
+            while True:
+                await asyncio.sleep(ADMIN_BROADCAST_COALESCE_WINDOW)
+                pending = self._pending_updates.pop(interview_id, None)
+                if pending is None:
+                    return
+                event_type, extra = pending
+                try:
+                    # Enrichment queries the DB, keep it off the event loop
+                    enriched_data = await asyncio.to_thread(get_enriched_admin_data, interview_id)
+                    payload = {
+                        "event_type": event_type,
+                        "data": {
+                            **enriched_data,
+                            **extra,
+                            "timestamp": datetime.now(timezone.utc).isoformat()
+                        }
+                    }
+                    await self.broadcast_admin_event(interview_id, payload)
+                    logger.debug(f"WS: Broadcast {event_type} for interview {interview_id}")
+                except Exception as e:
+                    logger.error(f"Failed to broadcast {event_type} for interview {interview_id}: {e}")
+        finally:
+            self._update_tasks.pop(interview_id, None)
 
     # ========== ADMIN DASHBOARD WEBSOCKET ==========
     async def connect_admin_dashboard(self, websocket: WebSocket, interview_id: int):
@@ -112,6 +143,7 @@ class WebSocketManager:
         if interview_id not in self.admin_dashboard_connections:
             self.admin_dashboard_connections[interview_id] = []
         self.admin_dashboard_connections[interview_id].append(websocket)
+        self._attach(websocket)
         logger.info(f"WS: Admin Dashboard connected to Interview {interview_id}")
 
     def disconnect_admin_dashboard(self, websocket: WebSocket, interview_id: int):
@@ -121,26 +153,102 @@ class WebSocketManager:
                 self.admin_dashboard_connections[interview_id].remove(websocket)
             if not self.admin_dashboard_connections[interview_id]:
                 del self.admin_dashboard_connections[interview_id]
+        self._detach(websocket)
         logger.info(f"WS: Admin Dashboard disconnected from Interview {interview_id}")
 
     # ========== BROADCASTING ==========
-    async def broadcast_to_admin_dashboard(self, interview_id: int, event: dict):
-        """Broadcast an event to all connected admin dashboards for an interview"""
-        if interview_id not in self.admin_dashboard_connections:
-            logger.debug(f"No admin dashboard connections for interview {interview_id}")
-            return
-        
-        # Copy list to avoid runtime modification errors
-        for connection in self.admin_dashboard_connections[interview_id][:]:
+    def _attach(self, websocket: WebSocket):
+        if websocket not in self._outboxes:
+            self._outboxes[websocket] = OutboundQueue(websocket, ADMIN_SEND_QUEUE_SIZE, on_failure=self._on_send_failure)
+
+    def _detach(self, websocket: WebSocket):
+        outbox = self._outboxes.pop(websocket, None)
+        if outbox is not None:
+            outbox.close()
+
+    def _on_send_failure(self, outbox: OutboundQueue):
+        websocket = outbox.websocket
+        for interview_id, connections in list(self.admin_dashboard_connections.items()):
+            if websocket in connections:
+                self.disconnect_admin_dashboard(websocket, interview_id)
+        if websocket in self.admin_connections:
+            self.disconnect_admin(websocket)
+        self._detach(websocket)
+
+    @staticmethod
+    def _serialize(event: dict) -> str:
+        return json.dumps(event, separators=(",", ":"), ensure_ascii=False)
+
+    def _deliver_admin_text(
+        self,
+        interview_id: Optional[int],
+        text: str,
+        dashboards: bool,
+        admins: bool,
+        owner: Optional[Owner] = None,
+        event_type: Optional[str] = None,
+    ) -> int:
+        """Enqueues pre-serialized text to this worker's matching admin sockets; never waits on a socket."""
+        connections = []
+        if dashboards and interview_id is not None:
+            connections += self.admin_dashboard_connections.get(interview_id, [])
+        if admins:
+            # Only global sockets whose topic filters accept the event
+            connections += self.admin_subscriptions.match(interview_id, owner, event_type)
+        for connection in connections:
+            outbox = self._outboxes.get(connection)
+            if outbox is None:
+                self._attach(connection)
+                outbox = self._outboxes[connection]
+            outbox.offer(text)
+        return len(connections)
+
+    async def _broadcast_admin(self, interview_id: Optional[int], event: dict, dashboards: bool, admins: bool):
+        if interview_id is None and isinstance(event.get("data"), dict):
+            interview_id = event["data"].get("interview_id")
+        event_type = event.get("event_type")
+        owner = await self._resolve_owner(interview_id) if admins and interview_id is not None else None
+        # Serialized once; the same text goes to local sockets and other workers
+        text = self._serialize(event)
+        self._deliver_admin_text(interview_id, text, dashboards, admins, owner, event_type)
+        await self._publish({
+            "kind": "admin", "interview_id": interview_id,
+            "dashboards": dashboards, "admins": admins, "text": text,
+            "owner": list(owner) if owner is not None else None, "event_type": event_type,
+        })
+
+    # ========== INTERVIEW OWNERS (topic routing) ==========
+    def set_interview_owner(self, interview_id: int, admin_id: Optional[int], team_id: Optional[int]):
+        self._owners[interview_id] = (admin_id, team_id)
+        self._owners.move_to_end(interview_id)
+        while len(self._owners) > OWNER_CACHE_SIZE:
+            self._owners.popitem(last=False)
+
+    async def _resolve_owner(self, interview_id: int) -> Optional[Owner]:
+        owner = self._owners.get(interview_id)
+        if owner is None:
             try:
-                await connection.send_json(event)
-                logger.debug(f"Event broadcast to admin dashboard for interview {interview_id}: {event.get('event_type')}")
+                owner = await asyncio.to_thread(_load_interview_owner, interview_id)
             except Exception as e:
-                logger.error(f"WS Error sending to admin dashboard {interview_id}: {e}")
-                self.disconnect_admin_dashboard(connection, interview_id)
+                logger.error(f"WS: Failed to resolve owner of interview {interview_id}: {e}")
+                return None
+            self.set_interview_owner(interview_id, *owner)
+        return owner
+
+    async def broadcast_admin_event(self, interview_id: int, event: dict):
+        """Broadcast an event to the interview's admin dashboards and all global admin dashboards"""
+        await self._broadcast_admin(interview_id, event, dashboards=True, admins=True)
+
+    async def broadcast_to_admin_dashboard(self, interview_id: int, event: dict):
+        """Broadcast an event to all connected admin dashboards for an interview"""
+        await self._broadcast_admin(interview_id, event, dashboards=True, admins=False)
 
     async def broadcast_to_candidate(self, interview_id: int, event: dict):
         """Broadcast an event to all connected candidates for an interview"""
+        await self._deliver_candidate(interview_id, event)
+        await self._publish({"kind": "candidate", "interview_id": interview_id, "event": event})
+
+    async def _deliver_candidate(self, interview_id: int, event: dict):
         if interview_id not in self.candidate_connections:
             logger.debug(f"No candidate connections for interview {interview_id}")
             return
@@ -154,6 +262,38 @@ class WebSocketManager:
                 logger.error(f"WS Error sending to candidate {interview_id}: {e}")
                 await self.disconnect_candidate(connection, interview_id)
 
+    # ========== CROSS-WORKER BACKPLANE ==========
+    async def start_backplane(self, backplane=None):
+        """Attach the pub/sub backplane (Redis unless WS_BACKPLANE=local) so broadcasts reach every worker"""
+        if backplane is None:
+            from .broadcast_backplane import create_backplane
+            backplane = await create_backplane(WS_BACKPLANE, REDIS_URL)
+        self.backplane = backplane
+        await backplane.start(self._on_backplane_message)
+        logger.info(f"WS: Broadcast backplane started ({type(backplane).__name__})")
+
+    async def stop_backplane(self):
+        if self.backplane is not None:
+            backplane, self.backplane = self.backplane, None
+            await backplane.stop()
+
+    async def _publish(self, message: dict):
+        if self.backplane is not None:
+            await self.backplane.publish(message)
+
+    async def _on_backplane_message(self, envelope: dict):
+        """Deliver a broadcast published by another worker to this worker's sockets"""
+        kind = envelope.get("kind")
+        if kind == "admin":
+            owner = envelope.get("owner")
+            self._deliver_admin_text(
+                envelope.get("interview_id"), envelope["text"],
+                envelope.get("dashboards", False), envelope.get("admins", False),
+                tuple(owner) if owner else None, envelope.get("event_type"),
+            )
+        elif kind == "candidate":
+            await self._deliver_candidate(envelope["interview_id"], envelope["event"])
+
     # ========== UTILITY METHODS ==========
     def has_admin_connections(self, interview_id: int) -> bool:
         """Check if there are any admin dashboard connections for an interview"""
@@ -167,27 +307,50 @@ class WebSocketManager:
 
     # ========== GLOBAL ADMIN DASHBOARD ==========
     # For real-time monitoring across ALL interviews (not per-interview)
-    async def connect_admin(self, websocket: WebSocket):
-        """Register a global admin dashboard connection"""
+    async def connect_admin(
+        self,
+        websocket: WebSocket,
+        admin_id: Optional[int] = None,
+        team_id: Optional[int] = None,
+        is_super: bool = False,
+    ):
+        """
+        Register a global admin dashboard connection. Admins start subscribed to
+        their own interviews, super admins to all of them.
+        """
         # Already accepted in the endpoint before calling this
         if websocket not in self.admin_connections:
             self.admin_connections.append(websocket)
+        self.admin_subscriptions.add(AdminSubscription(websocket, admin_id, team_id, is_super))
+        self._attach(websocket)
         logger.info(f"WS: Admin Dashboard connected (Global) - Total: {len(self.admin_connections)}")
 
+    def update_admin_subscription(self, websocket: WebSocket, **filters) -> dict:
+        """Change a global admin socket's topic filters (see AdminSubscription)"""
+        return self.admin_subscriptions.update(websocket, **filters).describe()
+
     def disconnect_admin(self, websocket: WebSocket):
         """Unregister a global admin dashboard connection"""
         if websocket in self.admin_connections:
             self.admin_connections.remove(websocket)
+        self.admin_subscriptions.remove(websocket)
+        self._detach(websocket)
         logger.info(f"WS: Admin Dashboard disconnected (Global) - Total: {len(self.admin_connections)}")
 
     async def broadcast_to_admins(self, message: dict):
         """Broadcast a message to ALL connected global admin dashboards"""
-        for connection in self.admin_connections[:]:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"WS Error sending to admin: {e}")
-                self.disconnect_admin(connection)
+        await self._broadcast_admin(None, message, dashboards=False, admins=True)
+
+    def get_broadcast_stats(self) -> Dict[str, int]:
+        return {
+            "admin_connections": len(self.admin_connections),
+            "admin_dashboard_connections": sum(len(c) for c in self.admin_dashboard_connections.values()),
+            "pending_updates": len(self._pending_updates),
+            "queued": sum(o.queue.qsize() for o in self._outboxes.values()),
+            "sent": sum(o.sent for o in self._outboxes.values()),
+            "dropped": sum(o.dropped for o in self._outboxes.values()),
+            "published": getattr(self.backplane, "published", 0),
+        }
 
 # Global Singleton
 manager = WebSocketManager()
@@ -0,0 +1,62 @@
+"""
+Per-connection outbound queue for broadcast WebSockets.
+
+Broadcasters never await a socket directly: they serialize a message once and
+`offer` the text to each connection's bounded queue, and a task per connection
+drains it. A slow admin browser therefore only delays (and, once its queue is
+full, loses the oldest of) its own messages instead of stalling the broadcast
+for everyone else.
+"""
+
+import asyncio
+from typing import Callable, Optional
+
+from fastapi import WebSocket
+
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class OutboundQueue:
+    __slots__ = ("websocket", "queue", "task", "on_failure", "sent", "dropped")
+
+    def __init__(self, websocket: WebSocket, maxsize: int, on_failure: Optional[Callable[["OutboundQueue"], None]] = None):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.on_failure = on_failure
+        self.sent = 0
+        self.dropped = 0
+        self.task = asyncio.ensure_future(self._drain())
+
+    def offer(self, text: str) -> bool:
+        """Enqueues without waiting; drops the oldest queued message when full."""
+        if self.task.done():
+            return False
+        dropped = False
+        if self.queue.full():
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+                dropped = True
+            except asyncio.QueueEmpty:
+                pass
+        self.queue.put_nowait(text)
+        if dropped and self.dropped % 50 == 1:
+            logger.warning(f"WS: Slow admin connection, dropped {self.dropped} queued messages so far")
+        return not dropped
+
+    async def _drain(self):
+        while True:
+            text = await self.queue.get()
+            try:
+                await self.websocket.send_text(text)
+                self.sent += 1
+            except Exception as e:
+                logger.error(f"WS Error sending queued message: {e}")
+                if self.on_failure:
+                    self.on_failure(self)
+                return
+
+    def close(self):
+        self.task.cancel()
@@ -0,0 +1,284 @@
+"""
+Connection-level health for every WebSocket endpoint.
+
+Endpoints wrap their socket with `ws_sessions.wrap(...)` before accepting it.
+The returned WebSocketSession is a drop-in stand-in for the Starlette
+WebSocket (handlers and the broadcast manager keep calling send_*/receive_*),
+and adds:
+
+- Liveness of every socket relies on protocol-level pings (uvicorn
+  --ws-ping-interval/--ws-ping-timeout), which browsers answer on their own;
+  sockets the server has seen disconnect are dropped from the registry.
+- Heartbeat (opt-in): clients that connect with `?heartbeat=1` or send a
+  {"type": "pong"} are pinged with {"type": "ping"} after WS_HEARTBEAT_INTERVAL
+  of silence; pongs are consumed here. Listen-only clients that never opted
+  in get no application pings.
+- Idle reaping (opted-in sockets only): sockets silent for WS_IDLE_TIMEOUT
+  are closed, which wakes the endpoint's pending receive with
+  WebSocketDisconnect so its normal disconnect cleanup runs.
+- Send timeouts: a send that does not complete within WS_SEND_TIMEOUT closes
+  the connection instead of stalling the sender.
+- Max outstanding messages: a client with WS_MAX_OUTSTANDING sends still in
+  flight is treated as dead and closed.
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, Optional
+
+from fastapi import WebSocket, WebSocketDisconnect
+from starlette.websockets import WebSocketState
+
+from ..core.config import WS_HEARTBEAT_INTERVAL, WS_IDLE_TIMEOUT, WS_MAX_OUTSTANDING, WS_SEND_TIMEOUT
+from ..core.logger import get_logger
+
+logger = get_logger(__name__)
+
+PING_TEXT = '{"type":"ping"}'
+PONG_TEXTS = frozenset(("pong", '{"type":"pong"}', '{"type": "pong"}'))
+CLOSE_GOING_AWAY = 1001
+CLOSE_TIMEOUT = 5.0
+
+
+def _wants_heartbeat(websocket: WebSocket) -> bool:
+    try:
+        return str(websocket.query_params.get("heartbeat", "")).lower() in ("1", "true", "yes")
+    except Exception:
+        return False
+
+
+class WebSocketSession:
+    __slots__ = (
+        "websocket", "kind", "interview_id", "registry", "opened_at", "last_received",
+        "outstanding", "messages_in", "messages_out", "closed", "heartbeat", "_closed_waiter",
+    )
+
+    def __init__(self, websocket: WebSocket, kind: str, interview_id: Optional[int], registry: "SessionRegistry"):
+        self.websocket = websocket
+        self.kind = kind
+        self.interview_id = interview_id
+        self.registry = registry
+        self.heartbeat = _wants_heartbeat(websocket)  # App-level ping/idle reaping only when opted in
+        self.opened_at = time.monotonic()
+        self.last_received = self.opened_at
+        self.outstanding = 0
+        self.messages_in = 0
+        self.messages_out = 0
+        self.closed = False
+        self._closed_waiter: Optional[asyncio.Future] = None
+
+    def __getattr__(self, name):
+        # Anything not wrapped (cookies, query_params, client_state...) comes from the socket
+        if name == "websocket":
+            raise AttributeError(name)
+        return getattr(self.websocket, name)
+
+    def __repr__(self) -> str:
+        return f"<WebSocketSession {self.kind} interview={self.interview_id}>"
+
+    async def accept(self, *args, **kwargs):
+        await self.websocket.accept(*args, **kwargs)
+        self.last_received = time.monotonic()
+        self.registry.register(self)
+
+    # ---- Receiving ----
+    async def _receive_message(self) -> dict:
+        if self._closed_waiter is None:
+            self._closed_waiter = asyncio.get_running_loop().create_future()
+            if self.closed:
+                self._closed_waiter.set_result(None)
+        while True:
+            if self.closed:
+                raise WebSocketDisconnect(CLOSE_GOING_AWAY)
+            receive = asyncio.ensure_future(self.websocket.receive())
+            await asyncio.wait({receive, self._closed_waiter}, return_when=asyncio.FIRST_COMPLETED)
+            if not receive.done():
+                # Reaped while waiting: behave like a client disconnect
+                receive.cancel()
+                raise WebSocketDisconnect(CLOSE_GOING_AWAY)
+            message = receive.result()
+            if message["type"] == "websocket.disconnect":
+                self._mark_closed()
+                raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+            self.last_received = time.monotonic()
+            self.messages_in += 1
+            if message.get("text") in PONG_TEXTS:
+                self.registry.pongs += 1
+                self.heartbeat = True  # A client that speaks pong can be pinged and reaped
+                continue
+            return message
+
+    async def receive(self) -> dict:
+        return await self._receive_message()
+
+    async def receive_text(self) -> str:
+        return (await self._receive_message())["text"]
+
+    async def receive_bytes(self) -> bytes:
+        return (await self._receive_message())["bytes"]
+
+    async def receive_json(self, mode: str = "text"):
+        message = await self._receive_message()
+        if mode == "text":
+            return json.loads(message["text"])
+        return json.loads(message["bytes"].decode("utf-8"))
+
+    # ---- Sending ----
+    async def _send(self, send, *args, **kwargs):
+        if self.closed:
+            raise WebSocketDisconnect(CLOSE_GOING_AWAY)
+        if self.outstanding >= self.registry.max_outstanding:
+            self.registry.overflow_closed += 1
+            logger.warning(f"WS: {self!r} has {self.outstanding} sends outstanding, closing")
+            await self.close(CLOSE_GOING_AWAY, "Too many outstanding messages")
+            raise WebSocketDisconnect(CLOSE_GOING_AWAY)
+        self.outstanding += 1
+        try:
+            # Other send errors propagate like they do from a plain WebSocket
+            await asyncio.wait_for(send(*args, **kwargs), timeout=self.registry.send_timeout)
+        except asyncio.TimeoutError:
+            self.registry.send_timeouts += 1
+            logger.warning(f"WS: Send to {self!r} timed out after {self.registry.send_timeout}s, closing")
+        else:
+            self.messages_out += 1
+            return
+        finally:
+            self.outstanding -= 1
+        await self.close(CLOSE_GOING_AWAY, "Send timeout")
+        raise WebSocketDisconnect(CLOSE_GOING_AWAY)
+
+    async def send_text(self, data: str):
+        await self._send(self.websocket.send_text, data)
+
+    async def send_bytes(self, data: bytes):
+        await self._send(self.websocket.send_bytes, data)
+
+    async def send_json(self, data, mode: str = "text"):
+        await self._send(self.websocket.send_json, data, mode=mode)
+
+    async def send(self, message: dict):
+        await self._send(self.websocket.send, message)
+
+    async def ping(self):
+        try:
+            await self.send_text(PING_TEXT)
+            self.registry.pings += 1
+        except Exception:
+            pass  # Timeouts close the session; other errors surface on the endpoint's receive
+
+    # ---- Closing ----
+    def _mark_closed(self):
+        self.closed = True
+        if self._closed_waiter is not None and not self._closed_waiter.done():
+            self._closed_waiter.set_result(None)
+        self.registry.unregister(self)
+
+    async def close(self, code: int = 1000, reason: Optional[str] = None):
+        if self.closed:
+            return
+        self._mark_closed()
+        try:
+            await asyncio.wait_for(self.websocket.close(code=code, reason=reason), timeout=CLOSE_TIMEOUT)
+        except Exception:
+            pass  # Already gone, or the peer never answered the close
+
+    def idle_for(self, now: float) -> float:
+        return now - self.last_received
+
+    def is_disconnected(self) -> bool:
+        return (
+            getattr(self.websocket, "client_state", None) == WebSocketState.DISCONNECTED
+            or getattr(self.websocket, "application_state", None) == WebSocketState.DISCONNECTED
+        )
+
+
+class SessionRegistry:
+    def __init__(
+        self,
+        heartbeat_interval: float = WS_HEARTBEAT_INTERVAL,
+        idle_timeout: float = WS_IDLE_TIMEOUT,
+        send_timeout: float = WS_SEND_TIMEOUT,
+        max_outstanding: int = WS_MAX_OUTSTANDING,
+    ):
+        self.heartbeat_interval = heartbeat_interval
+        self.idle_timeout = idle_timeout
+        self.send_timeout = send_timeout
+        self.max_outstanding = max_outstanding
+        self.sessions: Dict[WebSocketSession, None] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.opened = 0
+        self.closed = 0
+        self.reaped_idle = 0
+        self.send_timeouts = 0
+        self.overflow_closed = 0
+        self.pings = 0
+        self.pongs = 0
+
+    def wrap(self, websocket: WebSocket, kind: str, interview_id: Optional[int] = None) -> WebSocketSession:
+        """Wraps a not yet accepted socket; it is tracked from `accept()` on."""
+        if isinstance(websocket, WebSocketSession):
+            return websocket
+        return WebSocketSession(websocket, kind, interview_id, self)
+
+    def register(self, session: WebSocketSession):
+        self.sessions[session] = None
+        self.opened += 1
+        self._ensure_reaper()
+
+    def unregister(self, session: WebSocketSession):
+        if session in self.sessions:
+            del self.sessions[session]
+            self.closed += 1
+
+    def _ensure_reaper(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._reap_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _reap_loop(self):
+        while self.sessions:
+            await asyncio.sleep(max(min(self.heartbeat_interval, self.idle_timeout) / 2, 1.0))
+            await self.sweep()
+
+    async def sweep(self):
+        """Drops disconnected sessions, closes idle opted-in ones and pings quiet ones; one pass."""
+        now = time.monotonic()
+        for session in list(self.sessions):
+            if session.is_disconnected():
+                session._mark_closed()
+                continue
+            if not session.heartbeat:
+                continue  # Protocol-level pings cover listen-only clients
+            idle = session.idle_for(now)
+            if idle >= self.idle_timeout:
+                self.reaped_idle += 1
+                logger.info(f"WS: Reaping {session!r}, idle for {idle:.0f}s")
+                asyncio.ensure_future(session.close(CLOSE_GOING_AWAY, "Idle timeout"))
+            elif idle >= self.heartbeat_interval:
+                # Never awaited here: a zombie only delays its own ping
+                asyncio.ensure_future(session.ping())
+
+    def metrics(self) -> dict:
+        by_kind: Dict[str, int] = {}
+        for session in self.sessions:
+            by_kind[session.kind] = by_kind.get(session.kind, 0) + 1
+        return {
+            "active": len(self.sessions),
+            "by_kind": by_kind,
+            "opened": self.opened,
+            "closed": self.closed,
+            "reaped_idle": self.reaped_idle,
+            "send_timeouts": self.send_timeouts,
+            "overflow_closed": self.overflow_closed,
+            "outstanding": sum(s.outstanding for s in self.sessions),
+            "pings": self.pings,
+            "pongs": self.pongs,
+        }
+
+
+ws_sessions = SessionRegistry()
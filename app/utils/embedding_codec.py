@@ -0,0 +1,98 @@
+"""
+Compact binary format for stored face embeddings (`User.face_embedding`).
+
+Layout (little-endian):
+    header:  magic b"FE" | version u8 | dtype u8 | model count u8
+    model:   name length u8 | name (ascii) | dim u16 | padding to 4 bytes | dim * itemsize bytes
+
+Vectors are read back with `np.frombuffer`, so loading a reference embedding
+is a zero-copy view over the database blob (float32) with no JSON parsing.
+Legacy JSON text values are still accepted by `decode_embeddings`.
+"""
+
+import json
+import struct
+from typing import Any, Dict, Mapping, Optional, Union
+
+MAGIC = b"FE"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<2sBBB")
+_NAME_LEN = struct.Struct("<B")
+_DIM = struct.Struct("<H")
+
+_DTYPES = {1: "float32", 2: "float16"}
+_DTYPE_CODES = {name: code for code, name in _DTYPES.items()}
+
+
+def is_binary_embedding(value: Any) -> bool:
+    return isinstance(value, (bytes, bytearray, memoryview)) and bytes(value[:2]) == MAGIC
+
+
+def encode_embeddings(embeddings: Mapping[str, Any], dtype: str = "float32") -> bytes:
+    """Packs a {model_name: vector} map into the binary format."""
+    import numpy as np
+
+    if dtype not in _DTYPE_CODES:
+        raise ValueError(f"Unsupported embedding dtype: {dtype}")
+
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, _DTYPE_CODES[dtype], len(embeddings))]
+    offset = _HEADER.size
+    for model, vector in embeddings.items():
+        name = model.encode("ascii")
+        arr = np.asarray(vector, dtype=dtype).reshape(-1)
+        meta = _NAME_LEN.pack(len(name)) + name + _DIM.pack(arr.size)
+        offset += len(meta)
+        pad = (-offset) % 4
+        parts.append(meta + b"\0" * pad)
+        offset += pad
+        data = arr.tobytes()
+        parts.append(data)
+        offset += len(data)
+    return b"".join(parts)
+
+
+def decode_embeddings(value: Union[bytes, bytearray, memoryview, str, None]) -> Optional[Dict[str, Any]]:
+    """
+    Returns {model_name: ndarray} for a stored embedding, or None if it cannot be read.
+    Binary values decode to zero-copy views; legacy JSON text decodes to float32 arrays.
+    """
+    if value is None:
+        return None
+
+    import numpy as np
+
+    if isinstance(value, str) or not is_binary_embedding(value):
+        try:
+            data = json.loads(value if isinstance(value, str) else bytes(value).decode("utf-8"))
+        except (ValueError, UnicodeDecodeError):
+            return None
+        if isinstance(data, list):
+            # Legacy: single ArcFace vector
+            data = {"ArcFace": data}
+        if not isinstance(data, dict):
+            return None
+        return {k: np.asarray(v, dtype=np.float32) for k, v in data.items() if isinstance(v, list)}
+
+    buf = memoryview(value)
+    try:
+        _, version, dtype_code, count = _HEADER.unpack_from(buf, 0)
+        if version != FORMAT_VERSION or dtype_code not in _DTYPES:
+            return None
+        dtype = np.dtype(_DTYPES[dtype_code])
+
+        offset = _HEADER.size
+        result = {}
+        for _ in range(count):
+            (name_len,) = _NAME_LEN.unpack_from(buf, offset)
+            offset += _NAME_LEN.size
+            name = bytes(buf[offset:offset + name_len]).decode("ascii")
+            offset += name_len
+            (dim,) = _DIM.unpack_from(buf, offset)
+            offset += _DIM.size
+            offset += (-offset) % 4
+            result[name] = np.frombuffer(buf, dtype=dtype, count=dim, offset=offset)
+            offset += dim * dtype.itemsize
+        return result
+    except (struct.error, ValueError, UnicodeDecodeError):
+        return None
@@ -1,11 +1,70 @@
-from typing import Any, Tuple
+import struct
+from typing import Any, Optional, Tuple
 
-def decode_image(image_bytes: bytes) -> Any:
-    """Decodes raw image bytes into an OpenCV-compatible BGR image."""
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# JPEG start-of-frame markers (baseline, progressive, lossless...); C4/C8/CC are not frames
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def image_dimensions(image_bytes: bytes) -> Optional[Tuple[int, int]]:
+    """Reads (height, width) from a JPEG or PNG header without decoding pixels."""
+    data = memoryview(image_bytes)
+    if len(data) >= 24 and bytes(data[:8]) == _PNG_SIGNATURE:
+        w, h = struct.unpack(">II", data[16:24])
+        return h, w
+
+    if len(data) < 4 or bytes(data[:2]) != b"\xff\xd8":
+        return None
+    i = 2
+    while i + 9 <= len(data):
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:  # Fill byte
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:  # Standalone markers
+            i += 2
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            h, w = struct.unpack(">HH", data[i + 5:i + 9])
+            return h, w
+        (seg_len,) = struct.unpack(">H", data[i + 2:i + 4])
+        i += 2 + seg_len
+    return None
+
+
+def reduced_decode_factor(dims: Optional[Tuple[int, int]], max_height: int, max_width: int) -> int:
+    """
+    Largest libjpeg scale-down (1, 2, 4 or 8) that keeps the image at least as large
+    as the target box. Orientation-agnostic, since EXIF rotation is applied after decoding.
+    """
+    if not dims:
+        return 1
+    short_side, long_side = sorted(dims)
+    target_short, target_long = sorted((max_height, max_width))
+    for factor in (8, 4, 2):
+        if short_side // factor >= target_short and long_side // factor >= target_long:
+            return factor
+    return 1
+
+
+def decode_image(image_bytes: bytes, max_height: Optional[int] = None, max_width: Optional[int] = None) -> Any:
+    """
+    Decodes raw image bytes into an OpenCV-compatible BGR image.
+    With a target size, oversized JPEGs are decoded at 1/2, 1/4 or 1/8 scale
+    (IMREAD_REDUCED_COLOR_*) so the full-resolution pixels are never materialised.
+    """
     import cv2
     import numpy as np
     nparr = np.frombuffer(image_bytes, np.uint8)
-    return cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+
+    flags = cv2.IMREAD_COLOR
+    if max_height and bytes(image_bytes[:2]) == b"\xff\xd8":
+        factor = reduced_decode_factor(image_dimensions(image_bytes), max_height, max_width or max_height * 16 // 9)
+        if factor > 1:
+            flags = {2: cv2.IMREAD_REDUCED_COLOR_2, 4: cv2.IMREAD_REDUCED_COLOR_4, 8: cv2.IMREAD_REDUCED_COLOR_8}[factor]
+    return cv2.imdecode(nparr, flags)
 
 def resize_with_aspect_ratio(image: Any, target_height: int = 480) -> Tuple[Any, float]:
     """Resizes an image to a target height while maintaining aspect ratio."""
@@ -0,0 +1,91 @@
+"""
+Wire encoding for proctoring results pushed to candidates (video WebSocket and WebRTC DataChannel).
+
+Formats (chosen by the client at connect time):
+    json     {"type": "proctoring_update", "interview_id", "timestamp", "data": {...}} (default layout)
+    msgpack  {"t": "pu", "i": interview_id, "ts": epoch_ms, "w": warning, "f": faces,
+              "g": gaze, "a": auth, "b": box, "k": keepalive}
+
+Updates are change-only: a message is produced when warning, face count, gaze
+or auth changes, and otherwise at most every `keepalive` seconds so clients can
+tell the stream is alive.
+"""
+
+import json
+import time
+from typing import Any, Dict, Optional, Union
+
+FORMAT_JSON = "json"
+FORMAT_MSGPACK = "msgpack"
+FORMATS = (FORMAT_JSON, FORMAT_MSGPACK)
+KEEPALIVE_INTERVAL = 5.0
+
+
+def normalize_format(value: Optional[str]) -> str:
+    """Falls back to JSON for unknown formats (and when msgpack is not installed)."""
+    value = (value or FORMAT_JSON).lower()
+    if value == FORMAT_MSGPACK:
+        try:
+            import msgpack  # noqa: F401
+        except ImportError:
+            return FORMAT_JSON
+    return value if value in FORMATS else FORMAT_JSON
+
+
+class ProctoringUpdateEncoder:
+    """Per-connection encoder that suppresses unchanged results."""
+    __slots__ = ("fmt", "keepalive", "changes_only", "_last_key", "_last_sent")
+
+    def __init__(self, fmt: str = FORMAT_JSON, keepalive: float = KEEPALIVE_INTERVAL, changes_only: bool = True):
+        self.fmt = normalize_format(fmt)
+        self.keepalive = keepalive
+        self.changes_only = changes_only
+        self._last_key = None
+        self._last_sent = float("-inf")
+
+    @property
+    def binary(self) -> bool:
+        return self.fmt == FORMAT_MSGPACK
+
+    def encode(
+        self,
+        interview_id: Optional[int],
+        results: Dict[str, Any],
+        now: Optional[float] = None,
+        frame_id: Optional[int] = None,
+    ) -> Optional[Union[str, bytes]]:
+        """Returns the wire message for `results`, or None if nothing needs to be sent."""
+        now = time.time() if now is None else now
+        key = (results.get("warning"), results.get("faces"), results.get("gaze"), results.get("auth"))
+        changed = key != self._last_key
+        keepalive_due = now - self._last_sent >= self.keepalive
+        if self.changes_only and not changed and not keepalive_due:
+            return None
+
+        self._last_key = key
+        self._last_sent = now
+
+        if self.fmt == FORMAT_MSGPACK:
+            import msgpack
+            return msgpack.packb({
+                "t": "pu",
+                "i": interview_id,
+                "ts": int(now * 1000),
+                "w": results.get("warning", ""),
+                "f": results.get("faces"),
+                "g": results.get("gaze"),
+                "a": results.get("auth"),
+                "b": list(results["box"]) if results.get("box") else None,
+                "k": not changed,
+            })
+
+        message = {
+            "type": "proctoring_update",
+            "interview_id": interview_id,
+            "data": results,
+            "timestamp": now,
+            "keepalive": not changed,
+        }
+        if frame_id is not None:
+            message["frame_id"] = frame_id
+        return json.dumps(message, separators=(",", ":"))
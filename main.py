@@ -28,4 +28,8 @@ if __name__ == "__main__":
         print("\n[WARNING] No SSL Certificates found. HTTPS disabled.")
 
     port = int(os.getenv("PORT", 7427))
-    uvicorn.run("app.server:app", host="0.0.0.0", port=port, reload=True, **ssl_config)
+    from app.core.config import WS_HEARTBEAT_INTERVAL, WS_PING_TIMEOUT
+    uvicorn.run(
+        "app.server:app", host="0.0.0.0", port=port, reload=True,
+        ws_ping_interval=WS_HEARTBEAT_INTERVAL, ws_ping_timeout=WS_PING_TIMEOUT, **ssl_config
+    )
@@ -66,9 +66,12 @@ fi
 echo "Starting FastAPI application (ENV: ${ENV:-production}, MODE: ${ENV_MODE:-Standard})..."
 if [ "${ENV}" = "development" ]; then
     echo "Running in development mode with live reload!"
-    exec uvicorn app.server:app --host 0.0.0.0 --port "${PORT:-7860}" --reload
+    exec uvicorn app.server:app --host 0.0.0.0 --port "${PORT:-7860}" --reload \
+        --ws-ping-interval "${WS_HEARTBEAT_INTERVAL:-25}" --ws-ping-timeout "${WS_PING_TIMEOUT:-20}"
 else
     # For Render/Production: prioritize PORT env var (usually provided by platform)
     # Using --workers 1 is CRITICAL for 512MB RAM limits to avoid OOM
-    exec uvicorn app.server:app --host 0.0.0.0 --port "${PORT:-7860}" --workers 1 --timeout-keep-alive 5
+    # Protocol-level pings keep idle listeners alive and detect dead peers (browsers answer them)
+    exec uvicorn app.server:app --host 0.0.0.0 --port "${PORT:-7860}" --workers 1 --timeout-keep-alive 5 \
+        --ws-ping-interval "${WS_HEARTBEAT_INTERVAL:-25}" --ws-ping-timeout "${WS_PING_TIMEOUT:-20}"
 fi
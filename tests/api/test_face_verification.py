@@ -4,11 +4,12 @@ Test face verification in interview selfie upload endpoint
 import pytest
 import io
 import numpy as np
-import json
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from unittest.mock import MagicMock, patch
 
+from app.utils.embedding_codec import encode_embeddings
+
 
 def test_face_verification_success(client: TestClient, session: Session, test_users):
     """Test successful face verification when selfie matches stored embeddings."""
@@ -24,7 +25,7 @@ def test_face_verification_success(client: TestClient, session: Session, test_us
     stored_arcface = (stored_arcface / np.linalg.norm(stored_arcface)).tolist()
     stored_sface = (stored_sface / np.linalg.norm(stored_sface)).tolist()
     
-    candidate.face_embedding = json.dumps({"ArcFace": stored_arcface, "SFace": stored_sface})
+    candidate.face_embedding = encode_embeddings({"ArcFace": stored_arcface, "SFace": stored_sface})
     session.add(candidate)
     session.commit()
     
@@ -69,7 +70,7 @@ def test_face_verification_failure_mismatch(client: TestClient, session: Session
     stored_arcface = (stored_arcface / np.linalg.norm(stored_arcface)).tolist()
     stored_sface = (stored_sface / np.linalg.norm(stored_sface)).tolist()
     
-    candidate.face_embedding = json.dumps({"ArcFace": stored_arcface, "SFace": stored_sface})
+    candidate.face_embedding = encode_embeddings({"ArcFace": stored_arcface, "SFace": stored_sface})
     session.add(candidate)
     session.commit()
     
@@ -148,7 +149,7 @@ def test_face_verification_no_face_detected(client: TestClient, session: Session
     from datetime import datetime, timezone
     
     admin, candidate, _ = test_users
-    candidate.face_embedding = json.dumps({"ArcFace": [0.1]*512, "SFace": [0.1]*128})
+    candidate.face_embedding = encode_embeddings({"ArcFace": [0.1]*512, "SFace": [0.1]*128})
     session.add(candidate)
     session.commit()
     
@@ -1,11 +1,12 @@
 import pytest
 import io
-import json
 import numpy as np
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from unittest.mock import MagicMock, patch
 
+from app.utils.embedding_codec import encode_embeddings
+
 def test_upload_selfie_with_real_image(client: TestClient, session: Session, test_users):
     """Test selfie upload with a real image (mocked DeepFace)."""
     from app.models.db_models import InterviewSession, InterviewStatus, User
@@ -14,10 +15,10 @@ def test_upload_selfie_with_real_image(client: TestClient, session: Session, tes
     admin, candidate, _ = test_users
     cand_id = candidate.id
     
-    # Seed candidate with valid JSON face embeddings
+    # Seed candidate with binary face embeddings
     stored_arcface = [0.1]*512
     stored_sface = [0.1]*128
-    candidate.face_embedding = json.dumps({
+    candidate.face_embedding = encode_embeddings({
         "ArcFace": stored_arcface,
         "SFace": stored_sface
     })
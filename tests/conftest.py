@@ -145,17 +145,42 @@ def override_dependencies(session):
     def _get_test_db():
         yield session
 
+    # Without a server loop, broadcasts would otherwise run on a dispatcher thread
+    # sharing the single SQLite connection with the test
+    def _run_inline(coro):
+        import asyncio
+        # Private loop: asyncio.run() would unset the main thread's loop for later async tests
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(coro)
+        finally:
+            loop.close()
+        return True
+
     _dummy_metrics = {"live": 0, "proctoring_activity": "0.00%", "failed_today": 0, "passed_today": 0}
 
     # 3. Patch compute_dashboard_metrics everywhere it is imported so WebSocket
     #    broadcast helpers never open a second concurrent DB session (SQLite deadlock).
+    #    Likewise the heartbeat and timeline flush threads are not started; tests flush explicitly.
     with patch("app.services.status_manager.compute_dashboard_metrics", return_value=_dummy_metrics), \
-         patch("app.services.websocket_manager.compute_dashboard_metrics", return_value=_dummy_metrics, create=True):
+         patch("app.services.websocket_manager.compute_dashboard_metrics", return_value=_dummy_metrics, create=True), \
+         patch("app.services.status_manager.dashboard_counters.snapshot", return_value=_dummy_metrics), \
+         patch("app.services.broadcast_dispatcher.dispatcher._run_without_loop", side_effect=_run_inline), \
+         patch("app.services.activity_tracker.activity_tracker._ensure_started"), \
+         patch("app.services.timeline_buffer.timeline_buffer._ensure_started"), \
+         patch("app.services.timeline_buffer.timeline_buffer.fallback_path", None):
         fastapi_app.dependency_overrides[get_db] = _get_test_db
         yield
         fastapi_app.dependency_overrides.clear()
 
     app.core.database.engine = old_engine
+    # Each test gets a fresh database, so ids (cached snapshots, pending heartbeats) are reused
+    from app.services.interview_snapshots import interview_snapshots
+    from app.services.activity_tracker import activity_tracker
+    from app.services.timeline_buffer import timeline_buffer
+    interview_snapshots.clear()
+    activity_tracker._pending.clear()
+    timeline_buffer.clear()
 
 @pytest.fixture(name="client")
 def client_fixture(session):
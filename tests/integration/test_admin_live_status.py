@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.models.db_models import (
+    Answers, InterviewResult, InterviewSession, InterviewStatus, QuestionPaper, Questions, SessionQuestion
+)
+
+
+def test_live_status_progress(client, session, test_users, auth_headers):
+    """Progress is derived from counted session questions and answers."""
+    admin, candidate, _ = test_users
+    paper = QuestionPaper(name="Live Paper", admin_user=admin.id)
+    session.add(paper)
+    session.commit()
+    questions = [Questions(paper_id=paper.id, content=f"Q{i}", question_text=f"Q{i}", marks=1) for i in range(4)]
+    session.add_all(questions)
+    session.commit()
+
+    live = InterviewSession(admin_id=admin.id, candidate_id=candidate.id, paper_id=paper.id,
+                            schedule_time=datetime.now(timezone.utc), status=InterviewStatus.LIVE)
+    scheduled = InterviewSession(admin_id=admin.id, candidate_id=candidate.id,
+                                 schedule_time=datetime.now(timezone.utc), status=InterviewStatus.SCHEDULED)
+    session.add_all([live, scheduled])
+    session.commit()
+    session.add_all([SessionQuestion(interview_id=live.id, question_id=q.id) for q in questions])
+    result = InterviewResult(interview_id=live.id, total_score=2.0)
+    session.add(result)
+    session.commit()
+    session.add(Answers(interview_result_id=result.id, question_id=questions[0].id))
+    session.commit()
+
+    response = client.get("/api/admin/interviews/live-status", headers=auth_headers)
+    assert response.status_code == 200
+    items = {item["interview"]["id"]: item for item in response.json()["data"]}
+    assert items[live.id]["progress_percent"] == 25.0
+    assert items[live.id]["interview"]["total_score"] == 2.0
+    assert items[scheduled.id]["progress_percent"] == 0
+    # The result outer join yields one row per interview
+    assert len(response.json()["data"]) == len(items) == 2
+
+
+def test_interview_has_at_most_one_result(session, test_users):
+    """live-status relies on InterviewResult.interview_id being unique."""
+    _, candidate, _ = test_users
+    interview = InterviewSession(candidate_id=candidate.id, schedule_time=datetime.now(timezone.utc))
+    session.add(interview)
+    session.commit()
+    session.add(InterviewResult(interview_id=interview.id))
+    session.commit()
+
+    session.add(InterviewResult(interview_id=interview.id))
+    with pytest.raises(IntegrityError):
+        session.commit()
+    session.rollback()
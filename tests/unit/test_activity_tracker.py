@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from app.models.db_models import InterviewSession
+from app.services.activity_tracker import ActivityTracker
+
+
+def _interview(session, candidate, last_activity):
+    interview = InterviewSession(candidate_id=candidate.id, schedule_time=datetime.utcnow(), last_activity=last_activity)
+    session.add(interview)
+    session.commit()
+    return interview
+
+
+def test_heartbeats_are_flushed_in_one_update(session, test_users):
+    _, candidate, _ = test_users
+    old = datetime.utcnow() - timedelta(hours=1)
+    first, second = _interview(session, candidate, old), _interview(session, candidate, old)
+    tracker = ActivityTracker()
+    tracker._running = True  # No background thread; flushed explicitly below
+
+    now = datetime.utcnow()
+    for _ in range(5):
+        tracker.touch(first.id, now)
+    tracker.touch(second.id, now)
+    assert tracker.latest(first.id, old) == now  # Readers see the unflushed value
+
+    statements = []
+    listener = lambda conn, cursor, stmt, *args: statements.append(stmt)
+    event.listen(session.get_bind(), "before_cursor_execute", listener)
+    try:
+        assert tracker.flush(db_session=session) == 2
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", listener)
+
+    assert sum(stmt.lstrip().upper().startswith("UPDATE") for stmt in statements) == 1
+    session.expire_all()
+    assert session.get(InterviewSession, first.id).last_activity == now
+    assert session.get(InterviewSession, second.id).last_activity == now
+    assert tracker.metrics()["pending"] == 0
+
+
+def test_flush_never_moves_activity_backwards(session, test_users):
+    _, candidate, _ = test_users
+    newer = datetime.utcnow()
+    interview = _interview(session, candidate, newer)
+    tracker = ActivityTracker()
+    tracker._running = True
+
+    tracker.touch(interview.id, newer - timedelta(minutes=5))
+    assert tracker.latest(interview.id, newer) == newer
+    tracker.flush(db_session=session)
+
+    session.expire_all()
+    assert session.get(InterviewSession, interview.id).last_activity == newer
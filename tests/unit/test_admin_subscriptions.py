@@ -0,0 +1,48 @@
+import pytest
+
+from app.services.admin_subscriptions import AdminSubscription, SubscriptionIndex
+
+
+def _index(*subs):
+    index = SubscriptionIndex()
+    for sub in subs:
+        index.add(sub)
+    return index
+
+
+def test_default_scopes_route_by_owner():
+    own, teammate, other, super_admin = "own", "teammate", "other", "super"
+    index = _index(
+        AdminSubscription(own, admin_id=1, team_id=10),
+        AdminSubscription(teammate, admin_id=2, team_id=10),
+        AdminSubscription(other, admin_id=3),
+        AdminSubscription(super_admin, admin_id=4, is_super=True),
+    )
+    assert set(index.match(100, (1, 10), "violation_detected")) == {own, super_admin}
+
+    index.update(teammate, scope="team")
+    assert set(index.match(100, (1, 10), "violation_detected")) == {own, teammate, super_admin}
+    # Unknown owner: only explicit and "all" subscribers
+    assert index.match(100, None, "violation_detected") == [super_admin]
+
+
+def test_interview_ids_and_event_types():
+    index = _index(AdminSubscription("ws", admin_id=1))
+    index.update("ws", scope="none", interview_ids=[7], event_types=["interview_suspended"])
+    assert index.match(7, (9, None), "interview_suspended") == ["ws"]
+    assert index.match(7, (9, None), "candidate_connected") == []
+    assert index.match(8, (1, None), "interview_suspended") == []  # scope "none" ignores ownership
+
+    index.update("ws", all_event_types=True)
+    assert index.match(7, (9, None), "candidate_connected") == ["ws"]
+    index.remove("ws")
+    assert index.match(7, (9, None), "candidate_connected") == [] and len(index) == 0
+
+
+def test_restricted_scopes_are_rejected():
+    index = _index(AdminSubscription("ws", admin_id=1))
+    with pytest.raises(ValueError):
+        index.update("ws", scope="all")
+    with pytest.raises(ValueError):
+        index.update("ws", scope="team")
+    assert index.get("ws").scope == "own"
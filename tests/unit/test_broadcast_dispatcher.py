@@ -0,0 +1,119 @@
+import asyncio
+import threading
+
+from app.services.broadcast_dispatcher import BroadcastDispatcher
+
+
+def run_on_private_loop(coro):
+    # Keeps the session-wide event loop untouched for the async tests that follow
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_submit_from_worker_thread_runs_on_main_loop_in_order():
+    run_on_private_loop(_submit_from_worker_thread())
+
+
+async def _submit_from_worker_thread():
+    dispatcher = BroadcastDispatcher()
+    dispatcher.start(asyncio.get_running_loop())
+    main_thread = threading.get_ident()
+    seen = []
+
+    async def broadcast(i):
+        seen.append((i, threading.get_ident()))
+
+    def worker():
+        for i in range(20):
+            assert dispatcher.submit(broadcast(i)) is True
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join(timeout=2)  # Submitting never waits on the loop
+    assert not thread.is_alive()
+
+    for _ in range(50):
+        if len(seen) == 20:
+            break
+        await asyncio.sleep(0.01)
+
+    assert [i for i, _ in seen] == list(range(20))
+    assert all(tid == main_thread for _, tid in seen)
+    stats = dispatcher.stats()
+    assert stats["submitted"] == 20 and stats["completed"] == 20 and stats["pending"] == 0
+    await dispatcher.stop()
+
+
+def test_failures_and_overflow_are_counted():
+    run_on_private_loop(_failures_and_overflow())
+
+
+async def _failures_and_overflow():
+    dispatcher = BroadcastDispatcher(max_pending=1)
+    dispatcher.start(asyncio.get_running_loop())
+
+    async def boom():
+        raise RuntimeError("socket gone")
+
+    async def ok():
+        pass
+
+    dispatcher.submit(boom())
+    dispatcher.submit(ok())  # Queue still holds boom(): rejected
+    await asyncio.sleep(0.01)
+
+    stats = dispatcher.stats()
+    assert stats["failed"] == 1
+    assert stats["rejected"] == 1
+    await dispatcher.stop()
+
+
+def test_slow_broadcast_does_not_block_queue():
+    run_on_private_loop(_slow_broadcast())
+
+
+async def _slow_broadcast():
+    dispatcher = BroadcastDispatcher()
+    dispatcher.start(asyncio.get_running_loop())
+    stalled = asyncio.Event()
+    done = []
+
+    async def stuck():
+        await stalled.wait()  # e.g. a backplane publish that never returns
+
+    async def quick(i):
+        done.append(i)
+
+    dispatcher.submit(stuck())
+    for i in range(3):
+        dispatcher.submit(quick(i))
+    await asyncio.sleep(0.05)
+
+    assert done == [0, 1, 2]
+    assert dispatcher.stats()["running"] == 1
+    await dispatcher.stop()
+
+
+def test_submissions_after_stop_are_rejected():
+    run_on_private_loop(_after_stop())
+
+
+async def _after_stop():
+    dispatcher = BroadcastDispatcher()
+    dispatcher.start(asyncio.get_running_loop())
+    await dispatcher.stop()
+
+    async def late():
+        pass
+
+    results = []
+    thread = threading.Thread(target=lambda: results.append(dispatcher.submit(late())))
+    thread.start()
+    thread.join(timeout=2)
+
+    assert results == [False]
+    assert dispatcher.loop is None  # No private fallback loop was started
+    assert dispatcher.stats()["rejected"] == 1
@@ -0,0 +1,69 @@
+import importlib.util
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+
+def _load_camera():
+    # conftest replaces app.services.camera with a mock; load the real module from source
+    import app.services
+
+    path = os.path.join(os.path.dirname(app.services.__file__), "camera.py")
+    spec = importlib.util.spec_from_file_location("app.services._camera_ring_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+camera = _load_camera()
+
+
+class FakeDetector:
+    def __init__(self, accepts, result):
+        self.accepts = accepts
+        self.result = result
+        self.refs = []
+
+    def accepts_frame(self):
+        return self.accepts
+
+    def process_frame(self, frame, interview_id, frame_ref=None):
+        self.refs.append(frame_ref)
+        return self.result
+
+
+@pytest.fixture
+def service():
+    camera.CameraService._instance = None  # Fresh singleton per test
+    svc = camera.CameraService()
+    svc.frame_ring = MagicMock(max_height=540)
+    svc.frame_ring.write.return_value = "ref"
+    with patch.object(svc.sampler, "should_analyze", return_value=True):
+        yield svc
+    camera.CameraService._instance = None
+
+
+def _analyze(service):
+    service.process_frame_ndarray(np.zeros((4, 4, 3), dtype=np.uint8), 9)
+
+
+def test_frame_is_not_written_to_ring_when_every_queue_is_full(service):
+    service.face_detector = FakeDetector(False, (True, 0.1, 1, []))
+    service.gaze_detector = FakeDetector(False, "Looking Center")
+    _analyze(service)
+
+    service.frame_ring.write.assert_not_called()
+    assert service.face_detector.refs == [None]
+
+
+def test_frame_is_written_once_when_any_worker_accepts(service):
+    service.face_detector = FakeDetector(False, (True, 0.1, 1, []))
+    service.gaze_detector = FakeDetector(True, "Looking Center")
+    _analyze(service)
+
+    service.frame_ring.write.assert_called_once()
+    assert service.gaze_detector.refs == ["ref"]
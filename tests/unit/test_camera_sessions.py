@@ -0,0 +1,31 @@
+from app.services.camera_sessions import CameraSession, CameraSessionStore
+
+
+def test_least_recently_active_session_is_evicted():
+    evicted = []
+    store = CameraSessionStore(max_sessions=2, on_evict=evicted.append)
+    store.get_or_create(1)
+    store.get_or_create(2)
+    store.get_or_create(1)  # 2 is now the least recently active
+    store.get_or_create(3)
+
+    assert evicted == [2]
+    assert 1 in store and 3 in store and 2 not in store
+    assert store.metrics()["evicted"] == 1
+
+
+def test_eviction_callback_may_reenter_store():
+    store = CameraSessionStore(max_sessions=1)
+    store.on_evict = store.pop
+    store.get_or_create(1)
+    store.get_or_create(2)
+    assert len(store) == 1 and 2 in store
+
+
+def test_record_is_slotted_and_verdict_reflects_fields():
+    record = CameraSession(5)
+    assert not hasattr(record, "__dict__")
+    record.faces, record.warning, record.box = 2, "Multiple Faces", (1, 2, 3, 4)
+    verdict = record.verdict()
+    assert verdict["faces"] == 2 and verdict["warning"] == "Multiple Faces" and verdict["box"] == (1, 2, 3, 4)
+    assert record.approx_bytes() > 0
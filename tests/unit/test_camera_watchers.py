@@ -0,0 +1,81 @@
+import importlib.util
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+
+def _load_camera():
+    # conftest replaces app.services.camera with a mock; load the real module from source
+    import app.services
+
+    path = os.path.join(os.path.dirname(app.services.__file__), "camera.py")
+    spec = importlib.util.spec_from_file_location("app.services._camera_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+camera = _load_camera()
+
+
+@pytest.fixture
+def service():
+    camera.CameraService._instance = None  # Fresh singleton per test
+    yield camera.CameraService()
+    camera.CameraService._instance = None
+
+
+def _encoder():
+    return MagicMock(return_value=(True, np.frombuffer(b"jpeg", dtype=np.uint8)))
+
+
+def test_watchers_are_refcounted_per_session(service):
+    first = service.add_watcher(7)
+    second = service.add_watcher(7)
+    assert first != second
+
+    service.remove_watcher(7, first)
+    assert 7 in service.session_frames
+    service.remove_watcher(7, second)
+    assert 7 not in service.session_frames
+    service.remove_watcher(7, second)  # Already gone: no error
+
+
+def test_frames_are_only_kept_and_encoded_while_watched(service):
+    imencode = _encoder()
+    with patch.object(sys.modules["cv2"], "imencode", imencode):
+        service._publish_frame(7, "frame")
+        assert service.get_frame(7) == (None, 0)
+
+        token = service.add_watcher(7)
+        service._publish_frame(7, "frame")
+        assert service.get_frame(7) == (b"jpeg", 1)
+        assert service.get_frame(7) == (b"jpeg", 1)  # Unchanged frame is not re-encoded
+        assert imencode.call_count == 1
+
+        service.remove_watcher(7, token)
+        service._publish_frame(7, "frame")
+        assert imencode.call_count == 1
+
+
+def test_encoding_uses_fastest_rate_and_best_quality_of_watchers(service):
+    imencode = _encoder()
+    service.add_watcher(7, max_fps=1, quality=50)
+    service.add_watcher(7, max_fps=5, quality=90)
+    clock = [100.0]
+    with patch.object(sys.modules["cv2"], "imencode", imencode), \
+         patch.object(camera.time, "monotonic", lambda: clock[0]):
+        service._publish_frame(7, "f1")
+        service.get_frame(7)
+        assert imencode.call_args[0][2][1] == 90
+
+        service._publish_frame(7, "f2")
+        clock[0] += 0.1  # Faster than the 5 fps watcher allows
+        assert service.get_frame(7)[1] == 1
+        clock[0] += 0.15
+        assert service.get_frame(7)[1] == 2
+    assert imencode.call_count == 2
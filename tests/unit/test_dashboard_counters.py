@@ -0,0 +1,66 @@
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.models.db_models import InterviewResult, InterviewSession, InterviewStatus, ProctoringEvent
+from app.services import dashboard_counters as counters_module
+from app.services.dashboard_counters import DashboardCounters
+
+
+@pytest.fixture
+def counters():
+    fresh = DashboardCounters(redis_url=None)
+    with patch.object(counters_module, "dashboard_counters", fresh):
+        yield fresh
+
+
+def _interview(session, candidate, status):
+    interview = InterviewSession(candidate_id=candidate.id, schedule_time=datetime.utcnow(), status=status)
+    session.add(interview)
+    session.commit()
+    return interview
+
+
+def test_transitions_update_counters_after_commit(session, test_users, counters):
+    _, candidate, _ = test_users
+    counters.reconcile(session=session)
+    interview = _interview(session, candidate, InterviewStatus.SCHEDULED)
+
+    interview.status = InterviewStatus.LIVE
+    interview.start_time = datetime.utcnow()
+    session.add(interview)
+    session.commit()
+    assert counters.snapshot()["live"] == 1
+
+    # Rolled back changes are not counted
+    interview.status = InterviewStatus.COMPLETED
+    session.add(interview)
+    session.flush()
+    session.rollback()
+    assert counters.snapshot()["live"] == 1
+
+    session.add(ProctoringEvent(interview_id=interview.id, event_type="multiple_faces"))
+    session.add(ProctoringEvent(interview_id=interview.id, event_type="tab_switch"))
+    interview.status = InterviewStatus.COMPLETED
+    session.add(interview)
+    session.add(InterviewResult(interview_id=interview.id, result_status="PASS"))
+    session.commit()
+
+    assert counters.snapshot() == {
+        "live": 0, "proctoring_activity": "100.00%", "failed_today": 0, "passed_today": 1,
+    }
+
+
+def test_reconcile_matches_database(session, test_users, counters):
+    _, candidate, _ = test_users
+    live = _interview(session, candidate, InterviewStatus.CONNECTED)
+    _interview(session, candidate, InterviewStatus.SCHEDULED)
+    session.add(InterviewResult(interview_id=live.id, result_status="fail"))
+    session.commit()
+
+    # Drift, e.g. from a bulk UPDATE that bypassed the ORM
+    counters.memory.apply({"dashboard:live": 5}, {})
+    metrics = counters.reconcile(session=session)
+    assert metrics["live"] == 1 and metrics["failed_today"] == 1
+    assert counters.snapshot()["live"] == 1
@@ -0,0 +1,61 @@
+import json
+
+import numpy as np
+
+from app.utils.embedding_codec import decode_embeddings, encode_embeddings, is_binary_embedding
+
+
+def _vectors():
+    rng = np.random.default_rng(0)
+    return {
+        "ArcFace": rng.standard_normal(512).astype(np.float32),
+        "SFace": rng.standard_normal(128).astype(np.float32),
+    }
+
+
+def test_float32_round_trip():
+    vectors = _vectors()
+    blob = encode_embeddings(vectors)
+    assert is_binary_embedding(blob)
+
+    decoded = decode_embeddings(blob)
+    assert set(decoded) == {"ArcFace", "SFace"}
+    for name, vec in vectors.items():
+        assert decoded[name].dtype == np.float32
+        np.testing.assert_array_equal(decoded[name], vec)
+
+
+def test_float16_round_trip():
+    vectors = _vectors()
+    decoded = decode_embeddings(encode_embeddings(vectors, dtype="float16"))
+    assert decoded["ArcFace"].dtype == np.float16
+    np.testing.assert_allclose(decoded["ArcFace"].astype(np.float32), vectors["ArcFace"], atol=1e-2)
+
+
+def test_decode_is_zero_copy():
+    blob = encode_embeddings(_vectors())
+    decoded = decode_embeddings(blob)
+    assert not decoded["ArcFace"].flags.owndata
+    assert np.shares_memory(decoded["ArcFace"], np.frombuffer(blob, dtype=np.uint8))
+
+
+def test_legacy_json_is_still_readable():
+    vectors = _vectors()
+    legacy = json.dumps({k: v.tolist() for k, v in vectors.items()})
+    decoded = decode_embeddings(legacy)
+    np.testing.assert_allclose(decoded["SFace"], vectors["SFace"])
+
+    # Oldest format: a bare ArcFace list
+    assert "ArcFace" in decode_embeddings(json.dumps(vectors["ArcFace"].tolist()))
+
+
+def test_invalid_values_decode_to_none():
+    assert decode_embeddings(None) is None
+    assert decode_embeddings("not json") is None
+    assert decode_embeddings(b"FE\x09\x01\x00") is None   # unknown version
+
+
+def test_binary_is_smaller_than_json():
+    vectors = _vectors()
+    legacy = json.dumps({k: v.tolist() for k, v in vectors.items()})
+    assert len(encode_embeddings(vectors)) < len(legacy) / 3
@@ -0,0 +1,145 @@
+import json
+from unittest.mock import patch
+
+import numpy as np
+
+from app.services.face import FaceRecognizer, FaceTracker, ReferenceEmbeddings, box_iou, cosine_matches
+
+
+def test_reference_embeddings_are_normalised_float32():
+    refs = ReferenceEmbeddings.from_encoding(json.dumps({"ArcFace": [3.0, 4.0], "SFace": [0.0, 2.0]}))
+
+    arc = refs.get("ArcFace")
+    assert arc.dtype == np.float32
+    assert np.allclose(arc, [0.6, 0.8])
+    assert np.allclose(refs.get("SFace"), [0.0, 1.0])
+
+
+def test_reference_embeddings_legacy_list_and_bad_input():
+    refs = ReferenceEmbeddings.from_encoding("[1.0, 0.0]")
+    assert np.allclose(refs.get("ArcFace"), [1.0, 0.0])
+    assert ReferenceEmbeddings.from_encoding("not json") is None
+    assert ReferenceEmbeddings.from_encoding(None) is None
+
+
+def test_cosine_matches_is_vectorised_and_skips_wrong_dims():
+    reference = np.array([1.0, 0.0], dtype=np.float32)
+    embeddings = [[2.0, 0.1], [0.0, 5.0], [1.0, 0.0, 0.0]]
+
+    assert cosine_matches(reference, embeddings) == [True, False, False]
+    assert cosine_matches(reference, []) == []
+
+
+def test_known_encoding_is_parsed_once_per_object():
+    with patch("app.services.face.IS_ORCHESTRATOR", True):
+        recognizer = FaceRecognizer()
+
+    encoding = json.dumps({"SFace": [1.0, 0.0]})
+    with patch("app.services.face.ReferenceEmbeddings.from_encoding", wraps=ReferenceEmbeddings.from_encoding) as parse:
+        recognizer.known_encoding = encoding
+        recognizer.known_encoding = encoding
+        assert parse.call_count == 1
+
+
+def test_recognize_matches_each_face_against_its_model():
+    with patch("app.services.face.IS_ORCHESTRATOR", True):
+        recognizer = FaceRecognizer(known_encoding={"SFace": [1.0, 0.0]})
+
+    img = np.zeros((100, 100, 3), dtype=np.uint8)
+    locs = [(0, 50, 50, 0), (10, 90, 90, 40), (-5, 10, 10, 0)]
+    embeddings = iter([([0.9, 0.1], "SFace"), ([0.0, 1.0], "SFace")])
+
+    with patch.object(FaceRecognizer, "_embed", side_effect=lambda face: next(embeddings)):
+        assert recognizer.recognize(img, locs) == [True, False, False]
+
+
+def test_tracker_reuses_verdict_for_stable_face():
+    tracker = FaceTracker(iou_threshold=0.5, verified_ttl=5.0, unverified_ttl=1.0)
+    calls = []
+
+    def recognize(pending):
+        calls.append(list(pending))
+        return [True] * len(pending)
+
+    box = (10, 110, 110, 10)
+    assert tracker.resolve([box], recognize, now=0.0) == [True]
+    # Small jitter within TTL: verdict reused, no embedding
+    assert tracker.resolve([(12, 112, 111, 12)], recognize, now=1.0) == [True]
+    assert len(calls) == 1
+
+    # TTL expired: re-embedded
+    tracker.resolve([box], recognize, now=6.5)
+    assert len(calls) == 2
+    assert tracker.embedded == 2 and tracker.reused == 1
+
+
+def test_tracker_embeds_only_new_or_jumped_faces():
+    tracker = FaceTracker(iou_threshold=0.5, verified_ttl=5.0, unverified_ttl=1.0)
+    calls = []
+
+    def recognize(pending):
+        calls.append(list(pending))
+        return [False] * len(pending)
+
+    a, b = (0, 100, 100, 0), (0, 400, 100, 300)
+    tracker.resolve([a], recognize, now=0.0)
+    # Second face appears: only it is embedded
+    tracker.resolve([a, b], recognize, now=0.5)
+    assert calls[-1] == [b]
+    # First face jumps across the frame: treated as new
+    moved = (200, 100, 300, 0)
+    tracker.resolve([moved, b], recognize, now=0.6)
+    assert calls[-1] == [moved]
+
+
+def test_tracker_rechecks_unknown_faces_sooner():
+    tracker = FaceTracker(iou_threshold=0.5, verified_ttl=5.0, unverified_ttl=1.0)
+    results = iter([[False], [True]])
+    box = (0, 100, 100, 0)
+
+    assert tracker.resolve([box], lambda p: next(results), now=0.0) == [False]
+    assert tracker.resolve([box], lambda p: next(results), now=0.5) == [False]
+    assert tracker.resolve([box], lambda p: next(results), now=1.5) == [True]
+
+
+def test_box_iou():
+    assert box_iou((0, 10, 10, 0), (0, 10, 10, 0)) == 1.0
+    assert box_iou((0, 10, 10, 0), (20, 30, 30, 20)) == 0.0
+    assert abs(box_iou((0, 10, 10, 0), (0, 15, 10, 5)) - 50 / 150) < 1e-9
+
+
+def test_orchestrator_recognition_does_not_block_and_updates_cache():
+    import threading
+    from app.services import face as face_module
+
+    release = threading.Event()
+    calls = []
+
+    def slow_recognize(self, img, locs):
+        calls.append(len(locs))
+        release.wait(timeout=5)
+        return [True]
+
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    with patch.object(face_module, "IS_ORCHESTRATOR", True), \
+         patch.object(face_module, "convert_to_rgb", lambda img: img), \
+         patch.object(FaceRecognizer, "recognize", slow_recognize):
+        service = face_module.FaceService()
+        try:
+            # Returns the cached (default) verdict while the remote call is in flight
+            assert service.process_frame(frame, 1) == (False, 1.0, 0, [])
+            # Same session cannot queue a second call until the first completes
+            assert service._submit_recognition(frame, 1, None) is False
+
+            pending = service._inflight[1]
+            done = threading.Event()
+            pending.add_done_callback(lambda f: done.set())
+            release.set()
+            assert done.wait(timeout=5)
+            assert service.process_frame(frame, 1)[0] is True
+            assert calls == [1]
+
+            service.clear_session(1)
+            assert 1 not in service.session_results
+        finally:
+            service.close()
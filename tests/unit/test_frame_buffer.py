@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from app.services.frame_buffer import SharedFrameRing
+
+
+@pytest.fixture
+def ring():
+    r = SharedFrameRing(slots=2, max_height=4, max_width=6)
+    yield r
+    r.close()
+
+
+def test_write_and_read_roundtrip(ring):
+    frame = np.arange(3 * 5 * 3, dtype=np.uint8).reshape(3, 5, 3)
+    ref = ring.write(frame, scale=0.5)
+
+    assert ref.height == 3 and ref.width == 5 and ref.scale == 0.5
+    view = ring.read(ref)
+    assert np.array_equal(view, frame)
+    assert ring.is_current(ref)
+
+
+def test_reader_in_other_handle_sees_same_pixels(ring):
+    frame = np.full((4, 6, 3), 7, dtype=np.uint8)
+    ref = ring.write(frame)
+
+    reader = SharedFrameRing.attach(*ring.spec)
+    try:
+        assert np.array_equal(reader.read(ref), frame)
+    finally:
+        reader.close()
+
+
+def test_wrapped_slot_is_reported_stale(ring):
+    first = ring.write(np.zeros((2, 2, 3), dtype=np.uint8))
+    ring.write(np.ones((2, 2, 3), dtype=np.uint8))
+    ring.write(np.ones((2, 2, 3), dtype=np.uint8))  # Reuses the first slot
+
+    assert not ring.is_current(first)
+    assert ring.read(first) is None
+
+
+def test_oversized_frame_falls_back(ring):
+    assert ring.write(np.zeros((10, 6, 3), dtype=np.uint8)) is None
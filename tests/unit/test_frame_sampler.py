@@ -0,0 +1,50 @@
+from app.services.frame_sampler import AdaptiveFrameSampler
+
+
+def _run(sampler, interview_id, fps_in, seconds, backlog=0.0, start=1000.0):
+    """Feeds frames at `fps_in` for `seconds` and returns how many were analysed."""
+    analysed = 0
+    for i in range(int(fps_in * seconds)):
+        if sampler.should_analyze(interview_id, backlog=backlog, now=start + i / fps_in):
+            analysed += 1
+    return analysed
+
+
+def test_stable_session_is_sampled_at_stable_rate():
+    sampler = AdaptiveFrameSampler(stable_fps=2, suspicious_fps=8, global_budget_fps=100)
+    analysed = _run(sampler, 1, fps_in=30, seconds=10)
+
+    assert 19 <= analysed <= 21
+    stats = sampler.session_stats(1)
+    assert stats["analyzed"] == analysed
+    assert stats["dropped"] == 300 - analysed
+
+
+def test_suspicious_session_is_sampled_faster():
+    sampler = AdaptiveFrameSampler(stable_fps=2, suspicious_fps=8, global_budget_fps=100)
+    sampler.should_analyze(1, now=0.0)
+    sampler.record_result(1, "NO FACE DETECTED")
+
+    assert _run(sampler, 1, fps_in=30, seconds=10) >= 75
+
+
+def test_backlog_reduces_rate():
+    sampler = AdaptiveFrameSampler(stable_fps=4, suspicious_fps=8, global_budget_fps=100)
+    assert sampler.target_fps(1, backlog=0.2) == 4
+    assert sampler.target_fps(1, backlog=0.9) < 1.0
+
+
+def test_global_budget_is_shared_between_active_sessions():
+    sampler = AdaptiveFrameSampler(stable_fps=10, suspicious_fps=10, global_budget_fps=10)
+    for sid in range(5):
+        sampler.should_analyze(sid, now=100.0)
+
+    assert sampler.target_fps(0, now=101.5) == 2.0
+    assert sampler.metrics()["active_sessions"] == 5
+
+
+def test_forget_drops_session_state():
+    sampler = AdaptiveFrameSampler()
+    sampler.should_analyze(7, now=1.0)
+    sampler.forget(7)
+    assert sampler.session_stats(7) == {"analyzed": 0, "dropped": 0}
@@ -0,0 +1,48 @@
+from app.services.gaze import (
+    GazeSessionState,
+    SUSPICION_THRESHOLD,
+    apply_grace_period,
+    evict_idle_states,
+)
+
+
+def test_center_gaze_is_safe_and_resets_timer():
+    state = GazeSessionState()
+    assert apply_grace_period(state, "Left", 100.0) == "Safe: Center (Brief Left)"
+    assert state.suspicious_since == 100.0
+
+    assert apply_grace_period(state, "Center", 101.0) == "Safe: Center"
+    assert state.suspicious_since is None
+
+
+def test_warning_only_after_threshold():
+    state = GazeSessionState()
+    apply_grace_period(state, "Down", 0.0)
+    assert apply_grace_period(state, "Down", SUSPICION_THRESHOLD - 0.1).startswith("Safe")
+    assert apply_grace_period(state, "Down", SUSPICION_THRESHOLD + 0.1) == "WARNING: Looking Down"
+
+
+def test_blink_warning_message():
+    state = GazeSessionState()
+    apply_grace_period(state, "Blink", 0.0)
+    assert apply_grace_period(state, "Blink", SUSPICION_THRESHOLD + 1) == "WARNING: Sleeping/Eyes Closed"
+
+
+def test_sessions_do_not_share_grace_timers():
+    states = {1: GazeSessionState(), 2: GazeSessionState()}
+
+    # Session 1 looks away long enough to be flagged
+    apply_grace_period(states[1], "Left", 0.0)
+    assert apply_grace_period(states[1], "Left", 5.0) == "WARNING: Looking Left"
+
+    # Session 2 only just looked away, so it must still be within its grace period
+    assert apply_grace_period(states[2], "Left", 5.0) == "Safe: Center (Brief Left)"
+
+
+def test_evict_idle_states():
+    states = {1: GazeSessionState(), 2: GazeSessionState()}
+    states[1].last_seen = 0.0
+    states[2].last_seen = 500.0
+
+    assert evict_idle_states(states, now=700.0, ttl=600) == 1
+    assert list(states) == [2]
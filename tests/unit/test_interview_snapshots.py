@@ -0,0 +1,79 @@
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.models.db_models import Answers, InterviewResult, InterviewSession, InterviewStatus
+from app.services import interview_snapshots as snapshots_module
+from app.services import status_manager
+from app.services.interview_snapshots import SnapshotCache
+
+
+@pytest.fixture
+def cache():
+    fresh = SnapshotCache(ttl=600)
+    with patch.object(snapshots_module, "interview_snapshots", fresh), \
+         patch.object(status_manager, "interview_snapshots", fresh):
+        yield fresh
+
+
+def _interview(session, candidate):
+    interview = InterviewSession(candidate_id=candidate.id, schedule_time=datetime.utcnow())
+    session.add(interview)
+    session.commit()
+    return interview
+
+
+def test_enrichment_is_served_from_memory_after_first_load(session, test_users, cache):
+    _, candidate, _ = test_users
+    interview = _interview(session, candidate)
+
+    first = status_manager.get_enriched_admin_data(interview.id)
+    assert first["candidate"]["candidate_email"] == candidate.email
+    assert first["interview_status"] == InterviewStatus.SCHEDULED.value
+
+    with patch.object(snapshots_module, "query_snapshot", side_effect=AssertionError("DB read on hot path")):
+        again = status_manager.get_enriched_admin_data(interview.id)
+    assert again == first
+    assert cache.metrics() == {"size": 1, "hits": 1, "misses": 1}
+
+
+def test_committed_changes_patch_snapshot_in_place(session, test_users, cache):
+    _, candidate, _ = test_users
+    interview = _interview(session, candidate)
+    snap = cache.get_or_load(interview.id)
+    assert snap.questions_answered == 0
+
+    interview.status = InterviewStatus.LIVE
+    interview.tab_switch_count = 2
+    session.add(interview)
+    result = InterviewResult(interview_id=interview.id)
+    session.add(result)
+    session.flush()
+    session.add(Answers(interview_result_id=result.id, candidate_answer="a"))
+    session.commit()
+
+    assert cache.get(interview.id) is snap
+    assert snap.status == InterviewStatus.LIVE.value
+    assert snap.tab_switch_count == 2
+    assert snap.questions_answered == 1
+
+    # Rolled back changes never reach the snapshot
+    interview.tab_switch_count = 5
+    session.add(interview)
+    session.flush()
+    session.rollback()
+    assert snap.tab_switch_count == 2
+
+    candidate.full_name = "Renamed Candidate"
+    session.add(candidate)
+    session.commit()
+    assert snap.enriched({})["candidate"]["candidate_name"] == "Renamed Candidate"
+
+
+def test_cache_is_bounded_and_expires():
+    cache = SnapshotCache(max_size=2, ttl=0)
+    for interview_id in (1, 2, 3):
+        cache.put(snapshots_module.InterviewSnapshot(interview_id=interview_id))
+    assert cache.metrics()["size"] == 2
+    assert cache.get(3) is None  # ttl=0: every entry is already stale
@@ -0,0 +1,41 @@
+import json
+
+import msgpack
+
+from app.utils.proctoring_codec import ProctoringUpdateEncoder, normalize_format
+
+SAFE = {"auth": True, "faces": 1, "gaze": "Safe: Center", "warning": "", "box": (1, 2, 3, 4)}
+
+
+def test_unchanged_results_are_suppressed_until_keepalive():
+    encoder = ProctoringUpdateEncoder("json", keepalive=5.0)
+
+    first = json.loads(encoder.encode(7, SAFE, now=100.0))
+    assert first["type"] == "proctoring_update" and first["data"]["faces"] == 1
+    assert first["keepalive"] is False
+
+    # Same verdict (box jitter does not count as a change)
+    assert encoder.encode(7, {**SAFE, "box": (2, 3, 4, 5)}, now=101.0) is None
+    assert json.loads(encoder.encode(7, SAFE, now=105.5))["keepalive"] is True
+
+    changed = encoder.encode(7, {**SAFE, "faces": 2, "warning": "MULTIPLE FACES DETECTED"}, now=106.0)
+    assert json.loads(changed)["data"]["warning"] == "MULTIPLE FACES DETECTED"
+
+
+def test_msgpack_message_is_compact():
+    encoder = ProctoringUpdateEncoder("msgpack")
+    packed = encoder.encode(7, SAFE, now=100.0)
+
+    assert isinstance(packed, bytes) and encoder.binary
+    msg = msgpack.unpackb(packed)
+    assert msg == {"t": "pu", "i": 7, "ts": 100000, "w": "", "f": 1, "g": "Safe: Center", "a": True, "b": [1, 2, 3, 4], "k": False}
+    assert len(packed) < len(ProctoringUpdateEncoder("json").encode(7, SAFE, now=100.0))
+
+
+def test_every_frame_mode_and_unknown_format():
+    encoder = ProctoringUpdateEncoder("xml", changes_only=False)
+    assert encoder.fmt == "json"
+    assert encoder.encode(1, SAFE, now=0.0) is not None
+    assert encoder.encode(1, SAFE, now=0.1) is not None
+    assert normalize_format(None) == "json"
+    assert normalize_format("MSGPACK") == "msgpack"
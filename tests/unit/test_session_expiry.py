@@ -0,0 +1,51 @@
+from app.services.session_expiry import SessionExpiry
+
+
+def test_touch_postpones_expiry():
+    expiry = SessionExpiry(ttl=10.0)
+    expiry.touch(1, now=0.0)
+    expiry.touch(2, now=0.0)
+    expiry.touch(1, now=8.0)
+
+    assert expiry.pop_expired(now=5.0) == []
+    assert expiry.pop_expired(now=10.5) == [2]
+    assert 1 in expiry and expiry.last_active(1) == 8.0
+    assert expiry.next_deadline() == 18.0
+    assert expiry.pop_expired(now=18.0) == [1]
+    assert len(expiry) == 0
+
+
+def test_heap_holds_one_entry_per_session():
+    expiry = SessionExpiry(ttl=10.0)
+    for n in range(1000):
+        expiry.touch(7, now=float(n))
+    assert len(expiry._heap) == 1
+
+
+def test_discard_and_re_add():
+    expiry = SessionExpiry(ttl=10.0)
+    expiry.touch(1, now=0.0)
+    expiry.discard(1)
+    assert expiry.pop_expired(now=20.0) == []
+
+    expiry.touch(1, now=0.0)
+    expiry.discard(1)
+    expiry.touch(1, now=5.0)
+    assert expiry.pop_expired(now=12.0) == []
+    assert expiry.pop_expired(now=15.0) == [1]
+    assert expiry.pop_expired(now=100.0) == []
+
+
+def test_discarded_entries_are_compacted():
+    expiry = SessionExpiry(ttl=10.0)
+    expiry.touch("live", now=0.0)
+    for n in range(1000):
+        expiry.touch(1, now=float(n))
+        expiry.discard(1)
+    expiry.touch(1, now=1000.0)
+
+    assert len(expiry._heap) <= 70  # Stale entries never outgrow the compaction threshold
+    assert expiry.next_deadline() == 10.0
+    assert expiry.pop_expired(now=1005.0) == ["live"]
+    assert expiry.pop_expired(now=1010.0) == [1]
+    assert expiry._heap == []
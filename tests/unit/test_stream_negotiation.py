@@ -0,0 +1,60 @@
+import struct
+import zlib
+
+from app.services.stream_negotiation import StreamSettings
+from app.utils.image_processing import image_dimensions, reduced_decode_factor
+
+
+def _jpeg_header(height, width):
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x01\x01\x00\x00\x01\x00\x01\x00\x00"
+    sof0 = b"\xff\xc0" + struct.pack(">HBHHB", 17, 8, height, width, 3) + b"\x01\x22\x00\x02\x11\x01\x03\x11\x01"
+    return b"\xff\xd8" + app0 + sof0 + b"\xff\xd9"
+
+
+def _png_header(height, width):
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + b"IHDR" + ihdr + struct.pack(">I", zlib.crc32(b"IHDR" + ihdr))
+
+
+def test_image_dimensions_reads_headers_only():
+    assert image_dimensions(_jpeg_header(1080, 1920)) == (1080, 1920)
+    assert image_dimensions(_png_header(480, 640)) == (480, 640)
+    assert image_dimensions(b"not an image") is None
+
+
+def test_reduced_decode_factor_keeps_target_resolution():
+    assert reduced_decode_factor((2160, 3840), 540, 960) == 4
+    assert reduced_decode_factor((1080, 1920), 540, 960) == 2
+    assert reduced_decode_factor((720, 1280), 540, 960) == 1
+    # Portrait (rotated) frames are handled the same way
+    assert reduced_decode_factor((1920, 1080), 540, 960) == 2
+    assert reduced_decode_factor(None, 540, 960) == 1
+
+
+def test_stream_settings_clamp_client_requests():
+    stream = StreamSettings(1, max_height=2000, max_fps=100, jpeg_quality=5)
+    msg = stream.message(now=0.0)
+    assert msg["type"] == "stream_config"
+    assert msg["max_height"] == 540 and msg["max_width"] == 960
+    assert msg["jpeg_quality"] == 30
+
+    smaller = StreamSettings(1, max_height=360)
+    assert (smaller.max_height, smaller.max_width) == (360, 640)
+
+
+def test_stream_settings_readvertise_fps_and_oversize():
+    stream = StreamSettings(1)
+    stream.message(now=0.0)
+    initial = stream.fps
+
+    # Rate-limited, and unchanged rate is not re-sent
+    assert stream.adapt(8.0, now=1.0) is None
+    assert stream.adapt(2.0, now=3.0) is None
+    update = stream.adapt(8.0, now=3.0)
+    assert update is not None and update["fps"] > initial
+
+    for _ in range(10):
+        assert stream.observe_frame(_jpeg_header(1080, 1920)) is True
+    assert stream.adapt(8.0, now=6.0) is not None   # size reminder
+    assert stream.stats()["oversized"] == 10
+    assert stream.observe_frame(_jpeg_header(480, 640)) is False
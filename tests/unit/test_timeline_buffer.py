@@ -0,0 +1,104 @@
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import select
+
+from app.models.db_models import CandidateStatus, InterviewSession, StatusTimeline
+from app.services import status_manager
+from app.services import timeline_buffer as buffer_module
+from app.services.timeline_buffer import TimelineBuffer
+
+
+@pytest.fixture
+def buffer(tmp_path):
+    fresh = TimelineBuffer(fallback_path=str(tmp_path / "timeline.jsonl"))
+    fresh._running = True  # No background thread; flushed explicitly below
+    with patch.object(buffer_module, "timeline_buffer", fresh), \
+         patch.object(status_manager, "timeline_buffer", fresh):
+        yield fresh
+
+
+def _interview(session, candidate):
+    interview = InterviewSession(candidate_id=candidate.id, schedule_time=datetime.utcnow())
+    session.add(interview)
+    session.commit()
+    return interview
+
+
+def _stored(session, interview_id):
+    return session.exec(select(StatusTimeline).where(StatusTimeline.interview_id == interview_id)).all()
+
+
+def test_entries_are_bulk_inserted_and_visible_before_flush(session, test_users, buffer):
+    _, candidate, _ = test_users
+    interview = _interview(session, candidate)
+
+    for status in (CandidateStatus.LINK_ACCESSED, CandidateStatus.INTERVIEW_ACTIVE, CandidateStatus.INTERVIEW_COMPLETED):
+        status_manager.record_status_change(session, interview, status, {"step": status.value})
+    assert interview.current_status == CandidateStatus.INTERVIEW_COMPLETED.value
+    assert _stored(session, interview.id) == []
+
+    expected = [CandidateStatus.LINK_ACCESSED.value, CandidateStatus.INTERVIEW_ACTIVE.value, CandidateStatus.INTERVIEW_COMPLETED.value]
+    assert [e["status"] for e in status_manager._get_timeline_data(session, interview.id)] == expected
+
+    statements = []
+    listener = lambda conn, cursor, stmt, *args: statements.append(stmt)
+    event.listen(session.get_bind(), "before_cursor_execute", listener)
+    try:
+        assert buffer.flush(db_session=session) == 3
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", listener)
+    assert sum(stmt.lstrip().upper().startswith("INSERT") for stmt in statements) == 1
+
+    assert len(_stored(session, interview.id)) == 3
+    # Stored rows are not repeated from the buffer
+    assert [e["status"] for e in status_manager._get_timeline_data(session, interview.id)] == expected
+
+
+def test_uncommitted_entries_are_dropped_on_rollback(session, test_users, buffer):
+    _, candidate, _ = test_users
+    interview = _interview(session, candidate)
+
+    status_manager.record_status_change(session, interview, CandidateStatus.SUSPENDED, commit=False)
+    session.rollback()
+    assert buffer.pending() == 0
+
+
+def test_entries_survive_shutdown_without_database(session, test_users, buffer):
+    _, candidate, _ = test_users
+    interview = _interview(session, candidate)
+    status_manager.record_status_change(session, interview, CandidateStatus.INTERVIEW_ACTIVE)
+
+    with patch.object(TimelineBuffer, "_write", side_effect=RuntimeError("database unavailable")):
+        buffer.close()
+    assert buffer.pending() == 0
+
+    # The next process replays the saved entries
+    restarted = TimelineBuffer(fallback_path=buffer.fallback_path)
+    assert restarted.flush(db_session=session) == 1
+    assert [row.status for row in _stored(session, interview.id)] == [CandidateStatus.INTERVIEW_ACTIVE]
+
+
+def test_fallback_file_is_claimed_once_and_kept_until_committed(session, test_users, buffer):
+    _, candidate, _ = test_users
+    interview = _interview(session, candidate)
+    status_manager.record_status_change(session, interview, CandidateStatus.INTERVIEW_ACTIVE)
+    with patch.object(TimelineBuffer, "_write", side_effect=RuntimeError("database unavailable")):
+        buffer.close()
+
+    first = TimelineBuffer(fallback_path=buffer.fallback_path)
+    with patch.object(TimelineBuffer, "_write", side_effect=RuntimeError("crash mid-replay")):
+        with pytest.raises(RuntimeError):
+            first.flush(db_session=session)
+    claimed = first._replay_path
+    assert os.path.exists(claimed) and not os.path.exists(buffer.fallback_path)
+
+    # Another worker starting now finds nothing to replay
+    assert TimelineBuffer(fallback_path=buffer.fallback_path).flush(db_session=session) == 0
+
+    assert first.flush(db_session=session) == 1
+    assert not os.path.exists(claimed)
+    assert len(_stored(session, interview.id)) == 1
@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from sqlmodel import select
+
+from app.models.db_models import InterviewSession, InterviewStatus, ProctoringEvent
+from app.services.violation_buffer import ViolationBuffer
+
+
+def _interview(session, test_users, max_warnings=3):
+    admin, candidate, _ = test_users
+    interview = InterviewSession(
+        admin_id=admin.id,
+        candidate_id=candidate.id,
+        schedule_time=datetime.now(timezone.utc),
+        duration_minutes=60,
+        status=InterviewStatus.LIVE,
+        max_warnings=max_warnings,
+    )
+    session.add(interview)
+    session.commit()
+    return interview.id
+
+
+@patch("app.services.status_manager._fire_async_broadcast", side_effect=lambda coro: coro.close())
+def test_repeated_warning_is_one_incident(_broadcast, session, test_users):
+    iid = _interview(session, test_users)
+    buffer = ViolationBuffer(window=10.0)
+    buffer._ensure_started = lambda: None  # Flushed explicitly in this test
+
+    # Candidate looks away for ~5s at 4 analysed fps: 20 occurrences
+    for n in range(20):
+        buffer.record(iid, "NO FACE DETECTED", "Faces: 0", now=100.0 + n * 0.25)
+    assert buffer.pending() == 1
+    assert buffer.flush(now=105.0, db_session=session) == 1
+
+    events = session.exec(select(ProctoringEvent).where(ProctoringEvent.interview_id == iid)).all()
+    assert len(events) == 1
+    assert session.get(InterviewSession, iid).warning_count == 1
+
+    # Occurrences after the insert extend the incident; the final count is written once it closes
+    buffer.record(iid, "NO FACE DETECTED", "Faces: 0", now=106.0)
+    assert buffer.flush(now=107.0, db_session=session) == 0
+    assert buffer.flush(now=120.0, db_session=session) == 1
+    session.expire_all()
+    assert "x21" in session.get(ProctoringEvent, events[0].id).details
+
+
+@patch("app.services.status_manager._fire_async_broadcast", side_effect=lambda coro: coro.close())
+def test_separate_incidents_keep_warning_semantics(_broadcast, session, test_users):
+    iid = _interview(session, test_users, max_warnings=2)
+    buffer = ViolationBuffer(window=2.0)
+    buffer._ensure_started = lambda: None
+
+    buffer.record(iid, "NO FACE DETECTED", now=0.0)
+    buffer.record(iid, "MULTIPLE FACES DETECTED", now=0.5)
+    buffer.record(iid, "NO FACE DETECTED", now=10.0)  # Gap > window: new incident
+    assert buffer.flush(now=10.5, db_session=session) == 3
+
+    interview = session.get(InterviewSession, iid)
+    assert interview.warning_count == 3
+    assert interview.is_suspended is True
+
+
+@patch("app.services.status_manager._fire_async_broadcast", side_effect=lambda coro: coro.close())
+def test_forget_closes_incidents_on_next_flush(_broadcast, session, test_users):
+    iid = _interview(session, test_users)
+    buffer = ViolationBuffer(window=60.0)
+    buffer._ensure_started = lambda: None
+
+    buffer.record(iid, "NO FACE DETECTED", now=0.0)
+    buffer.flush(now=1.0, db_session=session)
+    buffer.record(iid, "NO FACE DETECTED", now=2.0)
+    buffer.forget(iid)
+    assert buffer.flush(now=3.0, db_session=session) == 1
+    assert buffer.pending() == 0 and not buffer._open
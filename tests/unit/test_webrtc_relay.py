@@ -0,0 +1,68 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("aiortc")
+from aiortc import MediaStreamTrack
+from aiortc.mediastreams import MediaStreamError
+
+from app.routers import video
+
+
+class FakeSource(MediaStreamTrack):
+    kind = "video"
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    async def recv(self):
+        await asyncio.sleep(0.01)
+        if self.readyState != "live":
+            raise MediaStreamError
+        self.reads += 1
+        return f"frame-{self.reads}"
+
+
+class FakePeerConnection:
+    def __init__(self):
+        self.tracks = []
+
+    def addTrack(self, track):
+        self.tracks.append(track)
+
+
+def run_on_private_loop(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_candidate_and_watchers_get_relay_proxies_of_one_analysed_track():
+    async def scenario():
+        relay = video.MediaRelay()
+        source = FakeSource()
+        candidate_pc, admin_pcs = FakePeerConnection(), [FakePeerConnection(), FakePeerConnection()]
+        with patch.object(video, "relay", relay), \
+             patch.object(video, "VideoTransformTrack", lambda track, **kwargs: track):
+            analysed = video._attach_candidate_track(candidate_pc, source, 1, channel=None, proctoring_format="json")
+            for pc in admin_pcs:
+                video._relay_to(pc, analysed)
+
+        proxies = [pc.tracks[0] for pc in [candidate_pc] + admin_pcs]
+        assert analysed is source
+        assert all(proxy is not source for proxy in proxies)
+        assert len({id(proxy) for proxy in proxies}) == 3
+
+        frames = await asyncio.gather(*(proxy.recv() for proxy in proxies))
+        reads = source.reads
+        source.stop()
+        await asyncio.sleep(0.05)  # Let the relay's reader task wind down
+        return frames, reads
+
+    frames, reads = run_on_private_loop(scenario())
+    # Every consumer got the same frame from a single read of the source
+    assert len(set(frames)) == 1 and reads == 1
@@ -0,0 +1,98 @@
+import asyncio
+import importlib.util
+import os
+import sys
+import threading
+
+import pytest
+
+pytest.importorskip("aiortc")
+from aiortc.mediastreams import MediaStreamError
+
+
+def _load_webrtc():
+    # conftest replaces app.services.webrtc with a mock; load the real module from source
+    import app.services
+
+    path = os.path.join(os.path.dirname(app.services.__file__), "webrtc.py")
+    spec = importlib.util.spec_from_file_location("app.services._webrtc_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+webrtc = _load_webrtc()
+
+
+class FakeSourceTrack:
+    kind = "video"
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+        self.readyState = "live"
+
+    async def recv(self):
+        await asyncio.sleep(0)
+        if not self.frames:
+            self.readyState = "ended"
+            raise MediaStreamError
+        return self.frames.pop(0)
+
+
+def run_on_private_loop(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def _track(source, analyzed):
+    track = webrtc.VideoTransformTrack(source, interview_id=1)
+
+    def analyze(frame):
+        analyzed.append(frame)
+        return {}
+
+    track._analyze = analyze
+    return track
+
+
+def test_analysis_task_finishes_when_source_ends():
+    async def scenario():
+        track = _track(FakeSourceTrack(["f1"]), [])
+        assert await track.recv() == "f1"
+        task = track._analysis_task
+        with pytest.raises(MediaStreamError):
+            await track.recv()
+        await asyncio.wait_for(asyncio.gather(task, return_exceptions=True), timeout=1)
+        return task, track
+
+    task, track = run_on_private_loop(scenario())
+    assert task.done()
+    assert track._analysis_task is None and track.readyState == "ended"
+
+
+def test_frames_arriving_during_analysis_collapse_to_latest():
+    async def scenario():
+        analyzed = []
+        release = threading.Event()
+        track = _track(FakeSourceTrack(["f1", "f2", "f3"]), analyzed)
+        slow_analyze = track._analyze
+        track._analyze = lambda frame: release.wait(1) and slow_analyze(frame)
+
+        await track.recv()
+        await asyncio.sleep(0.01)  # f1 is now being analyzed
+        await track.recv()
+        await track.recv()
+        release.set()
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if len(analyzed) == 2:
+                break
+        track.stop()
+        return analyzed
+
+    # f2 was superseded by f3 before the analysis task got to it
+    assert run_on_private_loop(scenario()) == ["f1", "f3"]
@@ -0,0 +1,115 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+from app.services import websocket_manager as wsm
+from app.services.websocket_manager import WebSocketManager
+
+
+class FakeSocket:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.messages = []
+
+    async def send_text(self, text):
+        await asyncio.sleep(self.delay)
+        self.messages.append(json.loads(text))
+
+
+async def test_slow_admin_does_not_stall_others():
+    manager = WebSocketManager()
+    slow, fast = FakeSocket(delay=10), FakeSocket()
+    await manager.connect_admin(slow)
+    await manager.connect_admin(fast)
+
+    for n in range(100):
+        await manager.broadcast_to_admins({"event_type": "tick", "n": n})
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.01)
+
+    assert [m["n"] for m in fast.messages] == list(range(100))
+    stats = manager.get_broadcast_stats()
+    assert stats["dropped"] > 0  # The slow socket's bounded queue shed its oldest messages
+    manager.disconnect_admin(slow)
+    manager.disconnect_admin(fast)
+    await asyncio.sleep(0)
+
+
+async def test_updates_are_coalesced_per_interview():
+    manager = WebSocketManager()
+    admin = FakeSocket()
+    await manager.connect_admin(admin)
+    builds = []
+
+    def enrich(interview_id):
+        builds.append(interview_id)
+        return {"interview_id": interview_id}
+
+    with patch.object(wsm, "ADMIN_BROADCAST_COALESCE_WINDOW", 0.01), \
+         patch("app.services.status_manager.get_enriched_admin_data", side_effect=enrich):
+        manager.schedule_admin_update(7, "candidate_connected")
+        manager.schedule_admin_update(7, "candidate_logged_in")
+        manager.schedule_admin_update(8, "candidate_connected")
+        for _ in range(200):  # Enrichment runs in the default executor, which may be busy
+            if len(admin.messages) == 2:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+
+    assert sorted(builds) == [7, 8]
+    events = {m["data"]["interview_id"]: m["event_type"] for m in admin.messages}
+    assert events == {7: "candidate_logged_in", 8: "candidate_connected"}
+    manager.disconnect_admin(admin)
+    await asyncio.sleep(0)
+
+
+class FakeCandidateSocket:
+    def __init__(self):
+        self.messages = []
+
+    async def send_json(self, data):
+        self.messages.append(data)
+
+
+async def test_backplane_fans_out_across_workers():
+    from app.services.broadcast_backplane import LocalBackplane, LocalHub
+
+    hub = LocalHub()
+    worker_a, worker_b = WebSocketManager(), WebSocketManager()
+    await worker_a.start_backplane(LocalBackplane(hub))
+    await worker_b.start_backplane(LocalBackplane(hub))
+    admin_a, admin_b, candidate_b = FakeSocket(), FakeSocket(), FakeCandidateSocket()
+    await worker_a.connect_admin(admin_a)
+    await worker_b.connect_admin(admin_b)
+    worker_b.candidate_connections[5] = [candidate_b]
+
+    await worker_a.broadcast_admin_event(5, {"event_type": "violation_detected"})
+    await worker_a.broadcast_to_candidate(5, {"type": "violation"})
+    await asyncio.sleep(0.01)
+
+    assert admin_a.messages == [{"event_type": "violation_detected"}]  # Delivered once, not echoed back
+    assert admin_b.messages == [{"event_type": "violation_detected"}]
+    assert candidate_b.messages == [{"type": "violation"}]
+
+    for worker, admin in ((worker_a, admin_a), (worker_b, admin_b)):
+        worker.disconnect_admin(admin)
+        await worker.stop_backplane()
+    await asyncio.sleep(0)
+
+
+async def test_admins_only_receive_subscribed_interviews():
+    manager = WebSocketManager()
+    owner, other, super_admin = FakeSocket(), FakeSocket(), FakeSocket()
+    await manager.connect_admin(owner, admin_id=1)
+    await manager.connect_admin(other, admin_id=2)
+    await manager.connect_admin(super_admin, admin_id=3, is_super=True)
+    manager.set_interview_owner(42, admin_id=1, team_id=None)
+
+    await manager.broadcast_admin_event(42, {"event_type": "violation_detected", "data": {"interview_id": 42}})
+    await asyncio.sleep(0.01)
+
+    assert len(owner.messages) == 1 and len(super_admin.messages) == 1
+    assert other.messages == []
+    for socket in (owner, other, super_admin):
+        manager.disconnect_admin(socket)
+    await asyncio.sleep(0)
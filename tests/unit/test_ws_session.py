@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+from app.services.ws_session import PING_TEXT, SessionRegistry
+
+
+class FakeSocket:
+    def __init__(self, send_delay=0.0, query_params=None):
+        self.send_delay = send_delay
+        self.query_params = query_params or {}
+        self.inbox: asyncio.Queue = asyncio.Queue()
+        self.sent = []
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def receive(self):
+        return await self.inbox.get()
+
+    async def send_text(self, text):
+        await asyncio.sleep(self.send_delay)
+        self.sent.append(text)
+
+    async def close(self, code=1000, reason=None):
+        self.closed_with = code
+
+    def push(self, text):
+        self.inbox.put_nowait({"type": "websocket.receive", "text": text})
+
+
+async def test_pongs_are_consumed_and_pings_sent_to_quiet_sockets():
+    registry = SessionRegistry(heartbeat_interval=10, idle_timeout=60)
+    socket = FakeSocket(query_params={"heartbeat": "1"})
+    session = registry.wrap(socket, "admin", 1)
+    await session.accept()
+    session.last_received -= 20
+
+    await registry.sweep()
+    await asyncio.sleep(0.01)
+    assert socket.sent == [PING_TEXT]
+
+    socket.push('{"type":"pong"}')
+    socket.push("hello")
+    assert await session.receive_text() == "hello"
+    metrics = registry.metrics()
+    assert metrics["pings"] == 1 and metrics["pongs"] == 1
+    assert metrics["by_kind"] == {"admin": 1}
+    await registry.stop()
+
+
+async def test_idle_socket_is_reaped_and_wakes_receiver():
+    registry = SessionRegistry(heartbeat_interval=10, idle_timeout=30)
+    socket = FakeSocket(query_params={"heartbeat": "1"})
+    session = registry.wrap(socket, "candidate", 2)
+    await session.accept()
+    session.last_received -= 60
+
+    receiver = asyncio.ensure_future(session.receive_text())
+    await asyncio.sleep(0)
+    await registry.sweep()
+    with pytest.raises(WebSocketDisconnect):
+        await asyncio.wait_for(receiver, timeout=1)
+
+    assert socket.closed_with == 1001
+    metrics = registry.metrics()
+    assert metrics["active"] == 0 and metrics["reaped_idle"] == 1
+    await registry.stop()
+
+
+async def test_listen_only_sockets_are_not_pinged_or_reaped_until_they_pong():
+    registry = SessionRegistry(heartbeat_interval=10, idle_timeout=30)
+    socket = FakeSocket()
+    session = registry.wrap(socket, "status", 5)
+    await session.accept()
+    session.last_received -= 600
+
+    await registry.sweep()
+    await asyncio.sleep(0.01)
+    assert socket.sent == [] and socket.closed_with is None
+    assert registry.metrics()["active"] == 1
+
+    # Sending a pong opts the client in
+    socket.push('{"type":"pong"}')
+    socket.push("hello")
+    await session.receive_text()
+    session.last_received -= 20
+    await registry.sweep()
+    await asyncio.sleep(0.01)
+    assert socket.sent == [PING_TEXT]
+    await registry.stop()
+
+
+async def test_send_timeout_closes_zombie_socket():
+    registry = SessionRegistry(send_timeout=0.01)
+    socket = FakeSocket(send_delay=10)
+    session = registry.wrap(socket, "video", 3)
+    await session.accept()
+
+    with pytest.raises(WebSocketDisconnect):
+        await session.send_text("frame result")
+
+    assert session.closed and socket.closed_with == 1001
+    assert registry.metrics()["send_timeouts"] == 1
+    with pytest.raises(WebSocketDisconnect):
+        await session.receive_text()
+    await registry.stop()
+
+
+async def test_too_many_outstanding_sends_close_socket():
+    registry = SessionRegistry(max_outstanding=2)
+    socket = FakeSocket(send_delay=10)
+    session = registry.wrap(socket, "status", 4)
+    await session.accept()
+
+    pending = [asyncio.ensure_future(session.send_text(str(n))) for n in range(2)]
+    await asyncio.sleep(0)
+    with pytest.raises(WebSocketDisconnect):
+        await session.send_text("one too many")
+
+    assert registry.metrics()["overflow_closed"] == 1
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    await registry.stop()